@@ -0,0 +1,213 @@
+# auditoria.py
+import asyncio
+import re
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+AUDITORIA_DB_FILE = "auditoria.db"
+
+LOTE_MAX = 200          # eventos por transação
+LOTE_PRAZO_SEG = 1.0    # espera máxima antes de gravar um lote incompleto
+FILA_MAX = 10000        # acima disso os eventos mais antigos são descartados
+
+# "Alvo: Fulano (123...)" / "Alvo: 123..." → ID do alvo, para achar ações contra alguém
+ALVO_REGEX = re.compile(r"Alvo:[^\n]*?(\d{15,21})")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS eventos (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts REAL NOT NULL,
+    guild_id INTEGER NOT NULL,
+    guild_nome TEXT,
+    acao TEXT NOT NULL,
+    usuario_id INTEGER,
+    alvo_id INTEGER,
+    moderador_id INTEGER,
+    detalhes TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_eventos_guild_ts ON eventos (guild_id, ts);
+CREATE INDEX IF NOT EXISTS idx_eventos_usuario ON eventos (usuario_id, ts);
+CREATE INDEX IF NOT EXISTS idx_eventos_alvo ON eventos (alvo_id, ts);
+CREATE INDEX IF NOT EXISTS idx_eventos_moderador ON eventos (moderador_id, ts);
+CREATE INDEX IF NOT EXISTS idx_eventos_acao ON eventos (acao, ts);
+CREATE INDEX IF NOT EXISTS idx_eventos_ts ON eventos (ts);
+"""
+
+_SCHEMA_FTS = """
+CREATE VIRTUAL TABLE IF NOT EXISTS eventos_fts USING fts5 (detalhes, content='eventos', content_rowid='id');
+CREATE TRIGGER IF NOT EXISTS eventos_fts_ai AFTER INSERT ON eventos BEGIN
+    INSERT INTO eventos_fts (rowid, detalhes) VALUES (new.id, new.detalhes);
+END;
+"""
+
+
+class Auditoria:
+    """
+    Cópia pesquisável de tudo que passa por registrar_log (SQLite em modo WAL).
+    Os eventos entram numa fila e são gravados em lotes numa thread própria,
+    então uma rajada de logs não bloqueia o loop.
+    """
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+        self.fts = False
+        self._conn: Optional[sqlite3.Connection] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lzim-auditoria")
+        self._fila: Optional[asyncio.Queue] = None
+        self._tarefa: Optional[asyncio.Task] = None
+        self.stats = {"gravados": 0, "descartados": 0, "falhas": 0}
+
+    # ---------- thread do banco ----------
+    def _abrir(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.caminho, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            try:
+                conn.executescript(_SCHEMA_FTS)
+                self.fts = True
+            except sqlite3.OperationalError:
+                # SQLite sem FTS5: busca por texto cai para LIKE
+                self.fts = False
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _inserir(self, lote: List[tuple]):
+        conn = self._abrir()
+        with conn:
+            conn.executemany(
+                "INSERT INTO eventos (ts, guild_id, guild_nome, acao, usuario_id, alvo_id, moderador_id, detalhes) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                lote
+            )
+
+    def _consultar(self, filtros: Dict[str, Any], limite: int) -> List[Dict[str, Any]]:
+        conn = self._abrir()
+        where = ["e.guild_id = ?"]
+        args: List[Any] = [filtros["guild_id"]]
+        if filtros.get("usuario_id"):
+            where.append("(e.usuario_id = ? OR e.alvo_id = ?)")
+            args += [filtros["usuario_id"], filtros["usuario_id"]]
+        if filtros.get("moderador_id"):
+            where.append("e.moderador_id = ?")
+            args.append(filtros["moderador_id"])
+        if filtros.get("acao"):
+            where.append("e.acao LIKE ?")
+            args.append(f"%{filtros['acao']}%")
+        if filtros.get("desde"):
+            where.append("e.ts >= ?")
+            args.append(filtros["desde"])
+        if filtros.get("ate"):
+            where.append("e.ts <= ?")
+            args.append(filtros["ate"])
+        if filtros.get("antes_de_id"):
+            where.append("e.id < ?")
+            args.append(filtros["antes_de_id"])
+
+        origem = "eventos e"
+        if filtros.get("texto"):
+            if self.fts:
+                origem = "eventos e JOIN eventos_fts f ON f.rowid = e.id"
+                where.append("eventos_fts MATCH ?")
+                # Cada palavra vira um termo entre aspas (sem sintaxe FTS vinda do usuário)
+                args.append(" ".join('"' + p.replace('"', '""') + '"' for p in filtros["texto"].split()))
+            else:
+                where.append("e.detalhes LIKE ?")
+                args.append(f"%{filtros['texto']}%")
+
+        sql = f"SELECT e.* FROM {origem} WHERE {' AND '.join(where)} ORDER BY e.id DESC LIMIT ?"
+        args.append(limite)
+        return [dict(r) for r in conn.execute(sql, args).fetchall()]
+
+    # ---------- API (loop) ----------
+    def registrar(self, guild, acao: str, usuario=None, moderador=None, detalhes: str = ""):
+        if self._fila is None:
+            self._fila = asyncio.Queue(maxsize=FILA_MAX)
+        if self._fila.full():
+            try:
+                self._fila.get_nowait()
+                self.stats["descartados"] += 1
+            except asyncio.QueueEmpty:
+                pass
+
+        alvo = ALVO_REGEX.search(detalhes or "")
+        self._fila.put_nowait((
+            time.time(),
+            guild.id,
+            getattr(guild, "name", None),
+            acao,
+            getattr(usuario, "id", None),
+            int(alvo.group(1)) if alvo else None,
+            getattr(moderador, "id", None),
+            detalhes or "",
+        ))
+        if self._tarefa is None or self._tarefa.done():
+            self._tarefa = asyncio.create_task(self._worker(), name="lzim-auditoria")
+
+    def profundidade(self) -> int:
+        return self._fila.qsize() if self._fila else 0
+
+    async def _worker(self):
+        loop = asyncio.get_running_loop()
+        fila = self._fila
+        assert fila is not None
+        lote: List[tuple] = []
+        try:
+            while True:
+                lote = [await fila.get()]
+                prazo = loop.time() + LOTE_PRAZO_SEG
+                while len(lote) < LOTE_MAX:
+                    if not fila.empty():
+                        lote.append(fila.get_nowait())
+                        continue
+                    restante = prazo - loop.time()
+                    if restante <= 0:
+                        break
+                    try:
+                        lote.append(await asyncio.wait_for(fila.get(), timeout=restante))
+                    except asyncio.TimeoutError:
+                        break
+                atual, lote = lote, []
+                await self._gravar(atual)
+        except asyncio.CancelledError:
+            # Encerrando: não perde o lote que estava sendo montado
+            if lote:
+                await self._gravar(lote)
+            raise
+
+    async def _gravar(self, lote: List[tuple]):
+        try:
+            await asyncio.get_running_loop().run_in_executor(self._executor, self._inserir, lote)
+            self.stats["gravados"] += len(lote)
+        except Exception as e:
+            self.stats["falhas"] += len(lote)
+            print(f"[Auditoria] Erro ao gravar {len(lote)} evento(s): {e}")
+
+    async def buscar(self, guild_id: int, limite: int = 10, **filtros) -> List[Dict[str, Any]]:
+        filtros["guild_id"] = guild_id
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self._consultar, filtros, limite)
+
+    async def encerrar(self):
+        """Grava o que estiver na fila e fecha o banco."""
+        if self._tarefa and not self._tarefa.done():
+            self._tarefa.cancel()
+            try:
+                await self._tarefa
+            except asyncio.CancelledError:
+                pass
+        self._tarefa = None
+        restante = []
+        while self._fila and not self._fila.empty():
+            restante.append(self._fila.get_nowait())
+        if restante:
+            await self._gravar(restante)
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            await asyncio.get_running_loop().run_in_executor(self._executor, conn.close)
+
+
+auditoria = Auditoria(AUDITORIA_DB_FILE)
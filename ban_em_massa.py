@@ -0,0 +1,196 @@
+# ban_em_massa.py
+import re
+import time
+from typing import Dict, Iterable, List, Optional
+
+import discord
+
+from execucao_em_massa import ExecucaoEmMassa, acompanhar, mostrar_final
+
+TAMANHO_LOTE_BAN = 200          # limite do Discord por chamada de bulk ban
+CONCORRENCIA_INDIVIDUAL = 4     # bans individuais em voo no modo sem bulk
+ANEXO_MAX_BYTES = 1024 * 1024
+MAX_IDS = 5000
+
+ID_REGEX = re.compile(r"\d{15,21}")   # IDs soltos e menções <@123> / <@!123>
+
+
+def extrair_ids(texto: str) -> List[int]:
+    """IDs de usuário de um texto livre (menções, um por linha, separados por vírgula...), sem repetir, na ordem."""
+    return list(dict.fromkeys(int(m) for m in ID_REGEX.findall(texto or "")))
+
+
+async def ler_anexo(anexo: discord.Attachment) -> str:
+    if anexo.size > ANEXO_MAX_BYTES:
+        raise ValueError(f"arquivo maior que {ANEXO_MAX_BYTES // 1024} KB")
+    return (await anexo.read()).decode("utf-8", errors="ignore")
+
+
+class BanEmMassa:
+    """
+    Bane vários usuários por ID. Usa o bulk ban do Discord (lotes de 200) quando
+    a biblioteca oferece; se o bulk não existir ou for recusado (ex.: falta
+    Gerenciar Servidor), o lote cai para bans individuais pelo executor em
+    massa, com concorrência limitada que recua em 429.
+
+    Antes de banir, descarta quem não pode ser banido: o próprio bot, quem
+    executou, o dono e membros com cargo igual/maior que o do bot ou que o do
+    moderador (só dá para checar quem está no cache; o resto a API decide).
+    """
+    def __init__(self, guild: discord.Guild, moderador: discord.Member, ids: Iterable[int],
+                 motivo: str, delete_message_seconds: int = 0):
+        self.guild = guild
+        self.moderador = moderador
+        self.motivo = motivo
+        self.reason = f"{motivo} | ban em massa por {moderador}"
+        self.delete_message_seconds = delete_message_seconds
+        self.ignorados: Dict[int, str] = {}
+        self.ids = [uid for uid in ids if not self._ignorar(uid)]
+        self.banidos: List[int] = []
+        self.falhas: Dict[int, str] = {}
+        self.usou_bulk = False
+        self.cancelado = False
+        self.inicio = 0.0
+        self.fim = 0.0
+        self._individual: Optional[ExecucaoEmMassa] = None
+
+    def _ignorar(self, uid: int) -> bool:
+        motivo = None
+        if uid == self.guild.me.id:
+            motivo = "é o bot"
+        elif uid == self.moderador.id:
+            motivo = "é você"
+        elif uid == self.guild.owner_id:
+            motivo = "dono do servidor"
+        else:
+            membro = self.guild.get_member(uid)
+            if membro is not None:
+                if membro.top_role >= self.guild.me.top_role:
+                    motivo = "cargo igual/maior que o do bot"
+                elif membro.top_role >= self.moderador.top_role and self.moderador.id != self.guild.owner_id:
+                    motivo = "cargo igual/maior que o seu"
+        if motivo:
+            self.ignorados[uid] = motivo
+        return motivo is not None
+
+    @property
+    def processados(self) -> int:
+        feitos = len(self.banidos) + len(self.falhas)
+        if self._individual is not None:
+            feitos += self._individual.feitos
+        return feitos
+
+    @property
+    def duracao(self) -> float:
+        return (self.fim or time.perf_counter()) - self.inicio if self.inicio else 0.0
+
+    def cancelar(self):
+        self.cancelado = True
+        if self._individual is not None:
+            self._individual.cancelar()
+
+    async def executar(self) -> "BanEmMassa":
+        self.inicio = time.perf_counter()
+        try:
+            for i in range(0, len(self.ids), TAMANHO_LOTE_BAN):
+                if self.cancelado:
+                    break
+                lote = self.ids[i:i + TAMANHO_LOTE_BAN]
+                if not await self._bulk(lote):
+                    await self._individuais(lote)
+        finally:
+            self.fim = time.perf_counter()
+        return self
+
+    async def _bulk(self, lote: List[int]) -> bool:
+        if not hasattr(self.guild, "bulk_ban"):
+            return False
+        try:
+            resultado = await self.guild.bulk_ban([discord.Object(id=uid) for uid in lote], reason=self.reason,
+                                                  delete_message_seconds=self.delete_message_seconds)
+        except (discord.Forbidden, discord.HTTPException) as e:
+            print(f"[BanEmMassa] Bulk ban recusado ({e}); banindo um a um")
+            return False
+        self.usou_bulk = True
+        self.banidos += [obj.id for obj in resultado.banned]
+        for obj in resultado.failed:
+            self.falhas[obj.id] = "recusado pelo Discord"
+        return True
+
+    async def _individuais(self, lote: List[int]):
+        async def banir(uid: int):
+            await self.guild.ban(discord.Object(id=uid), reason=self.reason,
+                                 delete_message_seconds=self.delete_message_seconds)
+
+        self._individual = ExecucaoEmMassa(lote, banir, CONCORRENCIA_INDIVIDUAL)
+        if self.cancelado:
+            self._individual.cancelar()
+        try:
+            await self._individual.executar()
+        finally:
+            execucao, self._individual = self._individual, None
+        for r in execucao.resultados:
+            if r.status == "ok":
+                self.banidos.append(r.item)
+            elif r.status == "falha":
+                self.falhas[r.item] = r.detalhe or "erro"
+
+    # ---------- exibição ----------
+    def resumo(self) -> str:
+        linhas = [f"🔨 Banidos: **{len(self.banidos)}** de {len(self.ids)}"]
+        if self.falhas:
+            linhas.append(f"❌ Falhas: **{len(self.falhas)}**")
+        if self.ignorados:
+            linhas.append(f"➖ Ignorados: **{len(self.ignorados)}**")
+        if self.cancelado and self.processados < len(self.ids):
+            linhas.append(f"⏹️ Cancelado: {len(self.ids) - self.processados} não processado(s)")
+        return "\n".join(linhas)
+
+    def embed(self, titulo: str) -> discord.Embed:
+        if not self.fim:
+            cor, emoji = discord.Color.blurple(), "⏳"
+        elif self.cancelado:
+            cor, emoji = discord.Color.orange(), "⏹️"
+        else:
+            cor, emoji = (discord.Color.orange(), "⚠️") if self.falhas else (discord.Color.green(), "✅")
+        embed = discord.Embed(title=f"{emoji} {titulo}", description=self.resumo(), color=cor)
+        detalhes = [f"`{uid}` — {motivo}" for uid, motivo in [*self.falhas.items(), *self.ignorados.items()]]
+        if detalhes:
+            texto = "\n".join(detalhes[:15]) + (f"\n… e mais {len(detalhes) - 15}" if len(detalhes) > 15 else "")
+            embed.add_field(name="Não banidos", value=texto[:1024], inline=False)
+        modo = "bulk ban" if self.usou_bulk else "um a um"
+        embed.set_footer(text=f"{self.processados}/{len(self.ids)} • {modo} • {self.duracao:.0f}s")
+        return embed
+
+    def detalhes_log(self) -> str:
+        """Texto do log único da operação (a lista de IDs é cortada para caber)."""
+        ids = ", ".join(str(uid) for uid in self.banidos[:40])
+        if len(self.banidos) > 40:
+            ids += f" … (+{len(self.banidos) - 40})"
+        texto = (f"Motivo: {self.motivo}\nBanidos: {len(self.banidos)} • Falhas: {len(self.falhas)} • "
+                 f"Ignorados: {len(self.ignorados)}" + (" • ⏹️ cancelado" if self.cancelado else "")
+                 + f"\nModo: {'bulk ban' if self.usou_bulk else 'um a um'}")
+        if ids:
+            texto += f"\nIDs: {ids}"
+        return texto
+
+
+async def rodar_ban_em_massa(interaction: discord.Interaction, ids: List[int], motivo: str,
+                             delete_message_seconds: int = 0) -> Optional[BanEmMassa]:
+    """
+    Bane os IDs com progresso ao vivo e botão de cancelar, e troca pelo
+    resultado. A interação precisa já ter sido deferida. Devolve None (e
+    avisa) se não sobrou ninguém para banir; o log fica com quem chamou.
+    """
+    if len(ids) > MAX_IDS:
+        await interaction.followup.send(f"⚠️ No máximo **{MAX_IDS}** IDs por vez (recebi {len(ids)}).", ephemeral=True)
+        return None
+    ban = BanEmMassa(interaction.guild, interaction.user, ids, motivo, delete_message_seconds)
+    titulo = f"Ban em massa ({len(ban.ids)} usuário(s))"
+    if not ban.ids:
+        ban.fim = ban.inicio = time.perf_counter()
+        await interaction.followup.send(embed=ban.embed(titulo), ephemeral=True)
+        return None
+    _, msg = await acompanhar(interaction, ban, ban.executar(), lambda: ban.embed(titulo))
+    await mostrar_final(interaction, msg, ban.embed(titulo))
+    return ban
@@ -0,0 +1,178 @@
+# benchmarks/cache_membros.py
+"""
+Memória residente e tempo até "pronto" por política de cache de membros
+(cache_membros.POLITICAS), em servidores sintéticos.
+
+Não conecta no Discord: os payloads de GUILD_CREATE e GUILD_MEMBERS_CHUNK
+são gerados localmente e entregues aos parsers do discord.py, como o
+gateway faria. Depois do "pronto", FRACAO_ENTRADAS do servidor entra
+(GUILD_MEMBER_ADD), para medir quanto o cache cresce com o uso. Cada
+combinação roda num processo separado para a medida de memória não vazar
+de uma para outra.
+
+Uso: python benchmarks/cache_membros.py [--tamanhos 1000,10000,100000] [--politicas completo,minimo]
+"""
+import argparse
+import asyncio
+import gc
+import json
+import os
+import subprocess
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+GUILD_ID = 900000000000000000
+BOT_ID = 1
+MEMBROS_POR_CHUNK = 1000      # o gateway manda no máximo 1000 membros por chunk
+FRACAO_EM_CALL = 0.01         # 1% dos membros em canais de voz
+FRACAO_ENTRADAS = 0.1         # entradas depois do login (10% do tamanho do servidor)
+
+
+def _rss_kb() -> int:
+    try:
+        with open("/proc/self/status") as f:
+            for linha in f:
+                if linha.startswith("VmRSS:"):
+                    return int(linha.split()[1])
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # pico; melhor que nada fora do Linux
+
+
+def _membro(i: int) -> dict:
+    return {
+        "user": {"id": str(10**17 + i), "username": f"membro{i}", "global_name": None, "discriminator": "0", "avatar": None},
+        "roles": [],
+        "joined_at": "2024-01-01T00:00:00+00:00",
+        "deaf": False,
+        "mute": False,
+        "flags": 0,
+    }
+
+
+def _guild_create(tamanho: int) -> dict:
+    em_call = range(1, 1 + int(tamanho * FRACAO_EM_CALL))
+    return {
+        "id": str(GUILD_ID),
+        "name": f"sintetico-{tamanho}",
+        "member_count": tamanho,
+        "large": True,
+        "roles": [{"id": str(GUILD_ID), "name": "@everyone", "permissions": "0", "position": 0,
+                   "color": 0, "hoist": False, "managed": False, "mentionable": False}],
+        "channels": [{"id": "800000000000000001", "type": 2, "name": "Músicas", "position": 0,
+                      "permission_overwrites": [], "bitrate": 64000, "user_limit": 0}],
+        # Servidores grandes: o GUILD_CREATE só traz o próprio bot e quem está em call
+        "members": [_membro(0)] + [_membro(i) for i in em_call],
+        "voice_states": [{"user_id": str(10**17 + i), "channel_id": "800000000000000001", "session_id": "x",
+                          "deaf": False, "mute": False, "self_deaf": False, "self_mute": False,
+                          "self_video": False, "suppress": False, "request_to_speak_timestamp": None} for i in em_call],
+        "emojis": [],
+        "stickers": [],
+        "features": [],
+    }
+
+
+def _chunk(state, guild, tamanho: int):
+    # Mesmo caminho de um chunk real: ChunkRequest + parse_guild_members_chunk
+    from discord.state import ChunkRequest
+    pedido = ChunkRequest(guild.id, guild.shard_id, asyncio.get_running_loop(), state._get_guild, cache=True)
+    state._chunk_requests[pedido.nonce] = pedido
+    total = (tamanho + MEMBROS_POR_CHUNK - 1) // MEMBROS_POR_CHUNK
+    for indice in range(total):
+        ini = indice * MEMBROS_POR_CHUNK
+        state.parse_guild_members_chunk({
+            "guild_id": str(guild.id),
+            "members": [_membro(i) for i in range(ini, min(tamanho, ini + MEMBROS_POR_CHUNK))],
+            "chunk_index": indice,
+            "chunk_count": total,
+            "nonce": pedido.nonce,
+        })
+
+
+async def _filho(politica: str, tamanho: int) -> dict:
+    import discord
+    from discord.user import ClientUser
+    import cache_membros
+
+    opcoes = cache_membros.opcoes_bot(politica)
+    if politica == "minimo":
+        # Só quem está em call: quem entra no servidor não pode ir para o cache
+        flags = opcoes["member_cache_flags"]
+        assert flags.voice and not flags.joined, f"minimo com flags erradas: {flags!r}"
+    client = discord.Client(intents=discord.Intents.default() | discord.Intents(members=True), **opcoes)
+    state = client._connection
+    state.user = ClientUser(state=state, data={"id": str(BOT_ID), "username": "bot", "discriminator": "0", "avatar": None})
+
+    gc.collect()
+    rss_base = _rss_kb()
+    inicio = time.perf_counter()
+    guild = state._add_guild_from_data(_guild_create(tamanho))
+    if opcoes["chunk_guilds_at_startup"]:
+        _chunk(state, guild, tamanho)
+    pronto = time.perf_counter() - inicio
+    gc.collect()
+    rss_pronto = _rss_kb()
+
+    resultado = {
+        "politica": politica,
+        "tamanho": tamanho,
+        "pronto_ms": pronto * 1000,
+        "rss_mb": (rss_pronto - rss_base) / 1024,
+        "membros_cache": len(guild.members),
+        "primeiro_uso_ms": None,
+        "rss_apos_uso_mb": None,
+    }
+    # Entradas de membros novos (IDs depois dos já existentes)
+    for i in range(tamanho, tamanho + int(tamanho * FRACAO_ENTRADAS)):
+        state.parse_guild_member_add(dict(_membro(i), guild_id=str(guild.id)))
+    gc.collect()
+    resultado["membros_apos_entradas"] = len(guild.members)
+    resultado["rss_apos_entradas_mb"] = (_rss_kb() - rss_base) / 1024
+    # sob_demanda: custo do chunk no primeiro recurso que precisa da lista (ex.: sorteio)
+    if politica == "sob_demanda":
+        inicio = time.perf_counter()
+        _chunk(state, guild, tamanho)
+        resultado["primeiro_uso_ms"] = (time.perf_counter() - inicio) * 1000
+        gc.collect()
+        resultado["rss_apos_uso_mb"] = (_rss_kb() - rss_base) / 1024
+    return resultado
+
+
+def _formatar(v, unidade: str, largura: int) -> str:
+    return ("—" if v is None else f"{v:.1f}{unidade}").rjust(largura)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tamanhos", default="1000,10000,100000")
+    parser.add_argument("--politicas", default="completo,sob_demanda,minimo")
+    parser.add_argument("--filho", nargs=2, metavar=("POLITICA", "TAMANHO"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.filho:
+        print(json.dumps(asyncio.run(_filho(args.filho[0], int(args.filho[1])))))
+        return
+
+    print(f"{'política':<12} {'membros':>8} {'pronto':>10} {'RSS':>9} {'em cache':>9} "
+          f"{'+entradas':>10} {'RSS':>9} {'1º uso':>10} {'RSS após':>9}")
+    for tamanho in (int(t) for t in args.tamanhos.split(",")):
+        for politica in args.politicas.split(","):
+            saida = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--filho", politica, str(tamanho)],
+                capture_output=True, text=True, check=True,
+            )
+            r = json.loads(saida.stdout.strip().splitlines()[-1])
+            print(
+                f"{r['politica']:<12} {r['tamanho']:>8} {r['pronto_ms']:>8.1f}ms {r['rss_mb']:>7.1f}MB "
+                f"{r['membros_cache']:>9} {r['membros_apos_entradas']:>10} {r['rss_apos_entradas_mb']:>7.1f}MB "
+                f"{_formatar(r['primeiro_uso_ms'], 'ms', 10)} "
+                f"{_formatar(r['rss_apos_uso_mb'], 'MB', 9)}"
+            )
+
+
+if __name__ == "__main__":
+    main()
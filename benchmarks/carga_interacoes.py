@@ -0,0 +1,357 @@
+# benchmarks/carga_interacoes.py
+"""
+Gerador de carga de interações: monta INTERACTION_CREATE sintéticos para
+cada slash command registrado e para cada botão (custom_id) das views
+ativas, dispara no bot (no mesmo processo, contra o Discord falso) com
+taxa e concorrência configuráveis e mede, por alvo:
+
+  ack     → tempo até o primeiro callback (o prazo do Discord é 3s)
+  final   → até a resposta de verdade (callback direto, ou o follow-up/edição
+            depois de um defer)
+  erros   → exceções registradas pelo discord.py + linhas de erro impressas
+            pelos handlers, mais interações sem ack dentro do prazo
+  REST    → chamadas à API por interação (sem contar o próprio callback)
+
+Ordem: primeiro os slash commands (como dono, com permissão de admin), depois
+os botões das mensagens que eles criaram (como membros aleatórios, simulando a
+corrida em um sorteio ou painel de tickets).
+
+Uso:
+  python benchmarks/carga_interacoes.py --por-alvo 200 --taxa 50 --concorrencia 100
+  python benchmarks/carga_interacoes.py --alvos sorteio,lzim_sorteio_join --por-alvo 2000 --taxa 200
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import logging
+import os
+import sys
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from discord_falso import ADMINISTRATOR, PERMISSOES_TODAS, DiscordFalso, bot_conectado  # noqa: E402
+
+PRAZO_ACK_SEG = 3.0
+TAREFAS_HANDLER = ("CommandTree-invoker", "discord-ui-view-dispatch")   # nomes das tarefas do discord.py
+IGNORAR_PADRAO = "recarregar,debug_profile"   # recarregam módulos / só um por vez: atrapalham a medida
+
+# Valores para parâmetros de texto que os handlers validam pelo nome
+VALORES_TEXTO = {
+    "tempo": "1m", "em": "1m", "duracao": "10m", "expr": "(2+2)*5", "opcoes": "A;B;C",
+    "usuario": "<@{alvo}>", "user_id": "{alvo}", "user_ids": "{alvo}", "canais": "{canais}",
+}
+
+
+class _CapturaErros(logging.Handler):
+    def __init__(self):
+        super().__init__(level=logging.ERROR)
+        self.total = 0
+        self.exemplo = ""
+
+    def emit(self, record: logging.LogRecord):
+        self.total += 1
+        self.exemplo = self.exemplo or record.getMessage()[:160]
+
+
+class _SaidaErros(io.TextIOBase):
+    """stdout durante a carga: conta as linhas de erro que os handlers imprimem."""
+    def __init__(self):
+        self.total = 0
+        self.exemplo = ""
+        self._linha = ""
+
+    def write(self, texto: str) -> int:
+        self._linha += texto
+        *completas, self._linha = self._linha.split("\n")
+        for linha in completas:
+            minusculo = linha.lower()
+            if "erro" in minusculo or "falha" in minusculo or "error" in minusculo:
+                self.total += 1
+                self.exemplo = self.exemplo or linha.strip()[:160]
+        return len(texto)
+
+
+def _percentil(valores: List[float], p: float) -> Optional[float]:
+    if not valores:
+        return None
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(round(p / 100 * (len(ordenados) - 1))))]
+
+
+class Gerador:
+    def __init__(self, bot, falso: DiscordFalso, guild):
+        self.bot, self.falso, self.guild = bot, falso, guild
+        self.g = falso.guilds[guild.id]
+        self.canal = guild.text_channels[0]
+        self._seq = 0
+        self._acks: Dict[str, float] = {}
+        self._finais: Dict[str, float] = {}
+        self._deferidas: set = set()
+        self._eventos: Dict[str, asyncio.Event] = {}
+        self._canal_token: Dict[str, int] = {}
+        falso.ao_responder = self._respondida
+        ids = {c["name"]: c["id"] for escopo in falso.comandos.values() for c in escopo}
+        self._ids_comandos = ids
+
+    # ---------- respostas (avisadas pelo Discord falso) ----------
+    def _respondida(self, token: str, tipo: str):
+        agora = time.monotonic()
+        if tipo.startswith("callback:"):
+            self._acks.setdefault(token, agora)
+            if tipo in ("callback:5", "callback:6"):
+                self._deferidas.add(token)
+            else:
+                self._finais.setdefault(token, agora)
+        elif token in self._deferidas:
+            self._finais.setdefault(token, agora)
+        evento = self._eventos.get(token)
+        if evento is not None and token in self._finais:
+            evento.set()
+
+    # ---------- payloads ----------
+    def _permissoes(self, membro: dict) -> int:
+        total = int(self.g["_cargos"][self.guild.id]["permissions"])
+        for rid in membro["roles"]:
+            cargo = self.g["_cargos"].get(int(rid))
+            if cargo:
+                total |= int(cargo["permissions"])
+        if total & ADMINISTRATOR or int(membro["user"]["id"]) == int(self.g["owner_id"]):
+            return PERMISSOES_TODAS
+        return total
+
+    def _membro(self, uid: int) -> dict:
+        membro = self.g["_membros"][uid]
+        return dict(membro, permissions=str(self._permissoes(membro)))
+
+    def _canal(self, canal_id: int) -> dict:
+        c = self.g["_canais"][canal_id]
+        return {"id": c["id"], "type": c["type"], "name": c["name"], "guild_id": str(self.guild.id),
+                "parent_id": c.get("parent_id"), "permissions": str(PERMISSOES_TODAS)}
+
+    def _base(self, tipo: int, usuario_id: int, canal_id: int) -> Tuple[str, dict]:
+        self._seq += 1
+        token = f"carga-{self._seq}"
+        return token, {
+            "id": str(self.falso.novo_id()), "application_id": str(self.falso.app_id), "type": tipo,
+            "token": token, "version": 1, "guild_id": str(self.guild.id), "channel_id": str(canal_id),
+            "channel": self._canal(canal_id), "member": self._membro(usuario_id),
+            "app_permissions": str(PERMISSOES_TODAS), "locale": "pt-BR", "guild_locale": "pt-BR",
+            "entitlements": [], "authorizing_integration_owners": {"0": str(self.guild.id)}, "context": 0,
+            "attachment_size_limit": 10 * 1024 * 1024,
+        }
+
+    def _opcoes(self, comando, resolvidos: dict) -> List[dict]:
+        from discord import AppCommandOptionType as T
+        alvo = next(uid for uid in self.g["_membros"] if uid not in (self.falso.app_id, self.falso.dono_id))
+        opcoes = []
+        for p in comando.parameters:
+            if not p.required and not p.choices:
+                continue
+            if p.choices:
+                valor = p.choices[0].value
+            elif p.type is T.string:
+                canais = " ".join(f"<#{c.id}>" for c in self.guild.text_channels[:10])
+                valor = VALORES_TEXTO.get(p.name, "teste").format(alvo=alvo, canais=canais)
+            elif p.type in (T.integer, T.number):
+                valor = p.min_value if p.min_value is not None else 1
+            elif p.type is T.boolean:
+                valor = False
+            elif p.type in (T.user, T.mentionable):
+                valor = str(alvo)
+                resolvidos.setdefault("users", {})[str(alvo)] = self.g["_membros"][alvo]["user"]
+                m = {k: v for k, v in self._membro(alvo).items() if k != "user"}
+                resolvidos.setdefault("members", {})[str(alvo)] = m
+            elif p.type is T.channel:
+                valor = str(self.canal.id)
+                resolvidos.setdefault("channels", {})[valor] = self._canal(self.canal.id)
+            elif p.type is T.role:
+                cargo = self.guild.roles[-1]
+                valor = str(cargo.id)
+                resolvidos.setdefault("roles", {})[valor] = self.g["_cargos"][cargo.id]
+            else:
+                continue   # anexos: sem suporte
+            opcoes.append({"name": p.name, "type": p.type.value, "value": valor})
+        return opcoes
+
+    def payload_comando(self, comando, usuario_id: int) -> Tuple[str, dict]:
+        token, dados = self._base(2, usuario_id, self.canal.id)
+        resolvidos: dict = {}
+        dados["data"] = {"id": self._ids_comandos.get(comando.name, str(self.falso.novo_id())),
+                         "name": comando.name, "type": 1, "options": self._opcoes(comando, resolvidos),
+                         "resolved": resolvidos}
+        self._canal_token[token] = self.canal.id
+        return token, dados
+
+    def payload_botao(self, custom_id: str, mensagem: dict, canal_id: int, usuario_id: int) -> Tuple[str, dict]:
+        token, dados = self._base(3, usuario_id, canal_id)
+        dados["data"] = {"custom_id": custom_id, "component_type": 2}
+        dados["message"] = dict(mensagem, channel_id=str(canal_id))
+        return token, dados
+
+    # ---------- alvos ----------
+    def comandos(self) -> list:
+        return sorted(self.bot.tree.get_commands(), key=lambda c: c.name)
+
+    def botoes(self) -> List[Tuple[str, dict, int]]:
+        """(custom_id, mensagem, canal) para cada botão de view ativa, na mensagem mais recente que o mostra."""
+        achados: Dict[str, Tuple[dict, int]] = {}
+
+        def varrer(msg: dict, canal_id: int):
+            for linha in msg.get("components") or []:
+                for comp in linha.get("components", []):
+                    if comp.get("type") == 2 and comp.get("custom_id"):
+                        achados[comp["custom_id"]] = (msg, canal_id)
+
+        for cid, mensagens in self.falso.mensagens.items():
+            if cid in self.g["_canais"]:
+                for msg in mensagens.values():
+                    varrer(msg, cid)
+        for token, msg in self.falso.mensagens_interacao.values():
+            varrer(msg, self._canal_token.get(token, self.canal.id))
+
+        ativos = set()
+        for chaves in self.bot._connection._view_store._views.values():
+            ativos.update(custom_id for (_tipo, custom_id) in chaves)
+        return [(cid, msg, canal) for cid, (msg, canal) in sorted(achados.items()) if cid in ativos]
+
+    # ---------- disparo ----------
+    async def _uma(self, token: str, payload: dict, espera_seg: float) -> Tuple[Optional[float], Optional[float]]:
+        evento = self._eventos[token] = asyncio.Event()
+        inicio = time.monotonic()
+        self.bot._connection.parse_interaction_create(payload)
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(evento.wait(), espera_seg)
+        del self._eventos[token]
+        ack, final = self._acks.pop(token, None), self._finais.pop(token, None)
+        self._deferidas.discard(token)
+        return (ack - inicio if ack else None), (final - inicio if final else None)
+
+    async def _aquietar(self, limite_seg: float):
+        """Espera os handlers disparados terminarem (até limite_seg): o que fazem depois do ack
+        (envios na fila do rate limit, logs...) entra na conta do alvo e não vaza para o próximo."""
+        fim = time.monotonic() + limite_seg
+        while time.monotonic() < fim:
+            if not any(t.get_name().startswith(TAREFAS_HANDLER) for t in asyncio.all_tasks()):
+                break
+            await asyncio.sleep(0.1)
+        await asyncio.sleep(0.2)   # fila de logs: o dispatcher junta por ~0.1s antes de enviar
+
+    async def rodar_alvo(self, nome: str, fabrica, total: int, taxa: float, concorrencia: int,
+                         espera_seg: float) -> dict:
+        self.falso.chamadas.clear()
+        self.falso.limitadas.clear()
+        captura = _CapturaErros()
+        logging.getLogger("discord").addHandler(captura)
+        saida = _SaidaErros()
+        limite = asyncio.Semaphore(concorrencia)
+        resultados: List[Tuple[Optional[float], Optional[float]]] = []
+
+        async def uma(i: int):
+            try:
+                token, payload = fabrica(i)
+                resultados.append(await self._uma(token, payload, espera_seg))
+            finally:
+                limite.release()
+
+        tarefas = []
+        inicio = time.monotonic()
+        with contextlib.redirect_stdout(saida):
+            for i in range(total):
+                atraso = inicio + i / taxa - time.monotonic()
+                if atraso > 0:
+                    await asyncio.sleep(atraso)
+                await limite.acquire()
+                tarefas.append(asyncio.create_task(uma(i)))
+            await asyncio.gather(*tarefas)
+            await self._aquietar(espera_seg)
+        duracao = time.monotonic() - inicio
+        logging.getLogger("discord").removeHandler(captura)
+
+        acks = [a for a, _ in resultados if a is not None]
+        finais = [f for _, f in resultados if f is not None]
+        rest = Counter({r: n for r, n in self.falso.chamadas.items() if "/interactions/" not in r})
+        return {
+            "alvo": nome, "n": total, "duracao": duracao,
+            "ack_p50": _percentil(acks, 50), "ack_p99": _percentil(acks, 99),
+            "final_p50": _percentil(finais, 50), "final_p99": _percentil(finais, 99),
+            "sem_ack": total - len(acks), "atrasadas": sum(1 for a in acks if a > PRAZO_ACK_SEG),
+            "erros": captura.total + saida.total, "exemplo_erro": captura.exemplo or saida.exemplo,
+            "rest_por_int": sum(rest.values()) / max(total, 1),
+            "rota_top": rest.most_common(1)[0][0] if rest else "",
+            "429": sum(self.falso.limitadas.values()),
+        }
+
+
+def _ms(v: Optional[float]) -> str:
+    return "—".rjust(8) if v is None else f"{v * 1000:>6.0f}ms"
+
+
+def _imprimir(r: dict):
+    print(f"{r['alvo']:<24} {r['n']:>5} {_ms(r['ack_p50'])} {_ms(r['ack_p99'])} {_ms(r['final_p50'])} "
+          f"{_ms(r['final_p99'])} {r['sem_ack'] + r['atrasadas']:>6} {r['erros']:>5} {r['rest_por_int']:>7.2f} "
+          f"{r['429']:>4}  {r['rota_top']}")
+    if r["exemplo_erro"]:
+        print(f"{'':<24} ↳ {r['exemplo_erro']}")
+
+
+async def rodar(args):
+    falso = DiscordFalso(args.latencia_ms, args.variacao_ms)
+    falso.semear(canais=args.canais, cargos=args.cargos, membros=args.membros, mensagens_por_canal=20)
+    await falso.iniciar(0)
+    bot, tarefa = await bot_conectado(falso)
+    guild = bot.guilds[0]
+    gerador = Gerador(bot, falso, guild)
+    alvos = set(filter(None, args.alvos.split(","))) if args.alvos else None
+    ignorar = set(filter(None, args.ignorar.split(",")))
+
+    print(f"{'alvo':<24} {'n':>5} {'ack p50':>8} {'ack p99':>8} {'fim p50':>8} {'fim p99':>8} "
+          f"{'>3s':>6} {'erros':>5} {'REST/i':>7} {'429':>4}  rota mais chamada")
+    try:
+        for comando in gerador.comandos():
+            if comando.name in ignorar or (alvos and comando.name not in alvos):
+                continue
+            r = await gerador.rodar_alvo(
+                f"/{comando.name}", lambda i, c=comando: gerador.payload_comando(c, falso.dono_id),
+                args.por_alvo, args.taxa, args.concorrencia, args.espera)
+            _imprimir(r)
+        for custom_id, mensagem, canal in gerador.botoes():
+            if alvos and custom_id not in alvos:
+                continue
+            # Lista viva: /ban, /expulsar e /massban da fase de comandos tiram membros do servidor falso
+            membros = [uid for uid in gerador.g["_membros"] if uid != falso.app_id]
+            r = await gerador.rodar_alvo(
+                custom_id,
+                lambda i, c=custom_id, m=mensagem, k=canal: gerador.payload_botao(c, m, k, membros[i % len(membros)]),
+                args.por_alvo, args.taxa, args.concorrencia, args.espera)
+            _imprimir(r)
+    finally:
+        with contextlib.redirect_stdout(io.StringIO()):
+            await bot.close()
+            await asyncio.gather(tarefa, return_exceptions=True)
+        await falso.encerrar()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--por-alvo", type=int, default=50, help="interações por comando/botão")
+    parser.add_argument("--taxa", type=float, default=20, help="interações por segundo")
+    parser.add_argument("--concorrencia", type=int, default=50, help="máximo de interações em andamento")
+    parser.add_argument("--espera", type=float, default=15, help="segundos esperando a resposta final")
+    parser.add_argument("--alvos", default="", help="nomes de comandos e/ou custom_ids (padrão: todos)")
+    parser.add_argument("--ignorar", default=IGNORAR_PADRAO)
+    parser.add_argument("--canais", type=int, default=40)
+    parser.add_argument("--cargos", type=int, default=250)
+    parser.add_argument("--membros", type=int, default=2000)
+    parser.add_argument("--latencia-ms", type=float, default=40)
+    parser.add_argument("--variacao-ms", type=float, default=20)
+    # Erros do discord.py só entram na contagem (sem despejar tracebacks no meio da tabela)
+    logging.getLogger("discord").setLevel(logging.ERROR)
+    logging.getLogger("discord").propagate = False
+    asyncio.run(rodar(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
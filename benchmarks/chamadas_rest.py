@@ -0,0 +1,152 @@
+# benchmarks/chamadas_rest.py
+"""
+Quantas chamadas REST (e quanto tempo, com rate limit) cada operação do bot
+custa, medido contra o Discord falso (benchmarks/discord_falso.py) com o bot
+rodando no mesmo processo.
+
+Cenários: criar ticket, privar ticket, /chatatualizarperms (somente leitura
+em todos os canais, um por vez e pelo executor em massa), /clear de 200
+mensagens (purge do discord.py e motor de limpeza), entrega de N logs e
+ban de N IDs (um /ban por vez e /massban com bulk ban).
+
+Uso: python benchmarks/chamadas_rest.py [--canais 40] [--cargos 250] [--logs 100] [--bans 25] [--cenarios ticket,logs]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from discord_falso import DiscordFalso, bot_conectado  # noqa: E402
+
+
+async def _ticket(bot, guild, membro, ctx):
+    import mod_tickets
+    ctx["ticket"] = await mod_tickets._create_ticket_channel(guild, membro, reason="benchmark")
+
+
+async def _privar(bot, guild, membro, ctx):
+    import mod_tickets
+    canal = ctx.get("ticket") or guild.text_channels[0]
+    await mod_tickets._lock_ticket(canal, True)
+
+
+async def _perms(bot, guild, membro, ctx):
+    import mod_permissoes
+    # Mesmo laço do /chatatualizarperms modo somente leitura
+    for canal in guild.text_channels:
+        await mod_permissoes._apply_read_only(canal, guild.me)
+
+
+async def _perms_massa(bot, guild, membro, ctx):
+    import mod_permissoes
+    from execucao_em_massa import ExecucaoEmMassa
+    # /chatatualizarperms atual: mesmos canais pelo executor em massa (concorrência limitada)
+    execucao = ExecucaoEmMassa(guild.text_channels, lambda canal: mod_permissoes._apply_read_only(canal, guild.me))
+    await execucao.executar()
+    falhas = execucao.contagem().get("falha")
+    if falhas:
+        raise RuntimeError(f"{falhas} canal(is) falharam")
+
+
+async def _clear(bot, guild, membro, ctx):
+    canal = guild.text_channels[-1]
+    ctx["apagadas"] = len(await canal.purge(limit=200))
+
+
+async def _limpeza(bot, guild, membro, ctx):
+    from limpeza import FiltroLimpeza, Limpeza
+    # /clear atual: mesmo canal e quantidade, pelo motor de limpeza (lotes de 100 em paralelo com a leitura)
+    canal = guild.text_channels[-2]
+    limpeza = await Limpeza(canal, FiltroLimpeza(), limite_apagar=200, limite_varrer=200).executar()
+    ctx["apagadas"] = limpeza.apagadas
+
+
+async def _logs(bot, guild, membro, ctx):
+    import config
+    import mod_logs
+    config.SERVIDOR_CENTRAL_ID = guild.id   # o servidor falso faz papel de central
+    for i in range(ctx["n_logs"]):
+        await mod_logs.registrar_log(bot, guild, f"Benchmark {i % 5}", membro, detalhes=f"evento {i}")
+    await mod_logs.encerrar_dispatcher()    # espera a fila esvaziar
+
+
+def _ids_ban(ctx, deslocamento):
+    # IDs fora do servidor (como numa lista de raid); cada cenário usa uma faixa própria
+    return [900000000000000000 + deslocamento + i for i in range(ctx["n_bans"])]
+
+
+async def _bans(bot, guild, membro, ctx):
+    import discord
+    # Um /ban por ID, como era feito antes do /massban
+    for uid in _ids_ban(ctx, 0):
+        await guild.ban(discord.Object(id=uid), reason="benchmark")
+
+
+async def _massban(bot, guild, membro, ctx):
+    from ban_em_massa import BanEmMassa
+    ban = await BanEmMassa(guild, membro, _ids_ban(ctx, 100000), "benchmark").executar()
+    if ban.falhas:
+        raise RuntimeError(f"{len(ban.falhas)} falha(s)")
+
+
+CENARIOS = {
+    "ticket": _ticket,
+    "privar": _privar,
+    "perms": _perms,
+    "perms_massa": _perms_massa,
+    "clear": _clear,
+    "limpeza": _limpeza,
+    "logs": _logs,
+    "bans": _bans,
+    "massban": _massban,
+}
+
+
+async def rodar(args):
+    falso = DiscordFalso(args.latencia_ms, args.variacao_ms)
+    falso.semear(canais=args.canais, cargos=args.cargos, membros=args.membros, mensagens_por_canal=250)
+    await falso.iniciar(0)
+    bot, tarefa = await bot_conectado(falso)
+    guild = bot.guilds[0]
+    membro = await guild.fetch_member(falso.dono_id)
+    ctx = {"n_logs": args.logs, "n_bans": args.bans}
+
+    print(f"{'cenário':<12} {'tempo':>9} {'REST':>6} {'429':>5}  rotas")
+    try:
+        for nome in args.cenarios.split(","):
+            falso.chamadas.clear()
+            falso.limitadas.clear()
+            inicio = time.perf_counter()
+            try:
+                await CENARIOS[nome](bot, guild, membro, ctx)
+                erro = ""
+            except Exception as e:
+                erro = f"  ❌ {e!r}"
+            tempo = time.perf_counter() - inicio
+            rotas = Counter(falso.chamadas)
+            print(f"{nome:<12} {tempo:>8.2f}s {sum(rotas.values()):>6} {sum(falso.limitadas.values()):>5}  "
+                  + ", ".join(f"{r} ×{n}" for r, n in rotas.most_common(4)) + erro)
+    finally:
+        await bot.close()
+        await asyncio.gather(tarefa, return_exceptions=True)
+        await falso.encerrar()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--canais", type=int, default=40)
+    parser.add_argument("--cargos", type=int, default=250)
+    parser.add_argument("--membros", type=int, default=200)
+    parser.add_argument("--logs", type=int, default=100)
+    parser.add_argument("--bans", type=int, default=25)
+    parser.add_argument("--latencia-ms", type=float, default=40)
+    parser.add_argument("--variacao-ms", type=float, default=20)
+    parser.add_argument("--cenarios", default=",".join(CENARIOS))
+    asyncio.run(rodar(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
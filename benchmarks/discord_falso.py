@@ -0,0 +1,1063 @@
+# benchmarks/discord_falso.py
+"""
+Discord falso para medir o bot sem o Discord de verdade.
+
+REST: canais, cargos, membros, mensagens, banimentos, webhooks, comandos e
+respostas de interação, com latência simulada e os cabeçalhos de rate limit
+por rota (X-RateLimit-*, 429 com retry_after) que o discord.py respeita.
+Gateway: websocket em /_falso/gateway (HELLO, IDENTIFY → READY, GUILD_CREATE,
+heartbeat, pedido de membros) e injeção de eventos por POST /_falso/evento.
+As mudanças feitas via REST também viram eventos (CHANNEL_UPDATE, ...), como
+no Discord, para o cache do bot acompanhar.
+
+Uso:
+  python benchmarks/discord_falso.py --porta 8999 --canais 40 --cargos 250 --membros 5000
+  DISCORD_API_BASE=http://127.0.0.1:8999/api/v10 DISCORD_TOKEN=falso python main.py
+  curl http://127.0.0.1:8999/_falso/estatisticas    # chamadas REST por rota
+
+Também serve como biblioteca (benchmarks/carga_interacoes.py usa direto):
+  falso = DiscordFalso(); falso.semear(...); await falso.iniciar(porta)
+"""
+import argparse
+import asyncio
+import bisect
+import hashlib
+import json
+import random
+import re
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from aiohttp import web
+
+API = "/api/v10"
+EPOCA_DISCORD_MS = 1420070400000
+LIMIAR_GRANDE = 250          # large_threshold: acima disso o GUILD_CREATE não traz os membros
+MEMBROS_POR_CHUNK = 1000
+
+# (limite, janela em segundos) por rota; o resto usa LIMITE_PADRAO. Valores na ordem dos reais.
+LIMITE_PADRAO = (5, 5.0)
+LIMITES_ROTA = {
+    ("POST", "/channels/{id}/messages"): (5, 5.0),
+    ("DELETE", "/channels/{id}/messages/{id}"): (5, 1.0),
+    ("POST", "/channels/{id}/messages/bulk-delete"): (1, 1.0),
+    ("PATCH", "/channels/{id}"): (5, 5.0),
+    ("PUT", "/channels/{id}/permissions/{id}"): (5, 5.0),
+    ("POST", "/guilds/{id}/channels"): (5, 5.0),
+    ("PUT", "/guilds/{id}/bans/{id}"): (5, 5.0),
+    ("POST", "/guilds/{id}/bulk-ban"): (1, 5.0),
+    ("PATCH", "/guilds/{id}/roles"): (1, 5.0),
+    ("PATCH", "/guilds/{id}/roles/{id}"): (5, 5.0),
+    ("POST", "/webhooks/{id}/{token}"): (5, 2.0),
+    ("GET", "/channels/{id}/messages"): (5, 1.0),
+}
+LIMITE_GLOBAL = 50           # pedidos por segundo, somando todas as rotas
+
+# Intent necessário para receber cada evento (bits do gateway)
+INTENT_EVENTO = {
+    "GUILD_": 1 << 0, "CHANNEL_": 1 << 0, "THREAD_": 1 << 0,
+    "GUILD_MEMBER_": 1 << 1,
+    "GUILD_BAN_": 1 << 2, "GUILD_AUDIT_LOG_ENTRY_CREATE": 1 << 2,
+    "WEBHOOKS_UPDATE": 1 << 5,
+    "VOICE_STATE_UPDATE": 1 << 7,
+    "MESSAGE_": 1 << 9,
+}
+
+ADMINISTRATOR = 1 << 3
+PERMISSOES_TODAS = (1 << 50) - 1
+PERMISSOES_MEMBRO = 0x6BFFFEC1 & ~ADMINISTRATOR
+
+NOMES_CARGOS_BOT = ["Admin", "Staff", "Moderador", "Membro", "🔥SUPER VIP", "💎VIP DIAMANTE",
+                    "🐸VIP SAPO", "💜VIP GALÁTICO"]
+
+
+class ErroDiscord(Exception):
+    def __init__(self, status: int, codigo: int, mensagem: str):
+        self.status, self.codigo, self.mensagem = status, codigo, mensagem
+
+
+def _nao_encontrado(o_que: str) -> ErroDiscord:
+    codigos = {"canal": 10003, "cargo": 10011, "membro": 10007, "mensagem": 10008,
+               "servidor": 10004, "webhook": 10015, "ban": 10026, "usuário": 10013}
+    return ErroDiscord(404, codigos.get(o_que, 0), f"Unknown {o_que}")
+
+
+def _json(dados: Any, status: int = 200, headers: Optional[Dict[str, str]] = None) -> web.Response:
+    # O discord.py compara o Content-Type exato: sem "; charset=utf-8"
+    return web.Response(body=json.dumps(dados).encode(), status=status, headers=headers,
+                        content_type="application/json")
+
+
+def _modelo_para_regex(modelo: str) -> "re.Pattern[str]":
+    return re.compile("^" + re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", modelo) + "$")
+
+
+class _Balde:
+    __slots__ = ("limite", "janela", "restantes", "reinicia")
+
+    def __init__(self, limite: int, janela: float):
+        self.limite, self.janela = limite, janela
+        self.restantes, self.reinicia = limite, 0.0
+
+
+class DiscordFalso:
+    def __init__(self, latencia_ms: float = 40, variacao_ms: float = 20, limites: bool = True, semente: int = 1):
+        self.latencia_ms, self.variacao_ms, self.limites = latencia_ms, variacao_ms, limites
+        self.rng = random.Random(semente)
+        self._seq_id = 0
+
+        self.bot_usuario = self._usuario(self.novo_id(), "lzim-falso", bot=True)
+        self.app_id = int(self.bot_usuario["id"])
+        self.dono_id = 0
+
+        self.usuarios: Dict[int, dict] = {self.app_id: self.bot_usuario}
+        self.guilds: Dict[int, dict] = {}
+        self.canal_guild: Dict[int, int] = {}
+        self.mensagens: Dict[int, Dict[int, dict]] = {}     # canal → id → mensagem
+        self.ids_mensagens: Dict[int, List[int]] = {}        # canal → ids ordenados (para o histórico)
+        self.webhooks: Dict[int, dict] = {}
+        self.comandos: Dict[str, List[dict]] = {}
+        self.respostas: Dict[str, dict] = {}                 # token da interação → resposta original
+        self.mensagens_interacao: Dict[int, Tuple[str, dict]] = {}   # id → (token, mensagem) de respostas/follow-ups
+        self.ao_responder = None    # callable(token, tipo): avisado em callback/follow-up/edição de interação
+
+        self.chamadas: Counter = Counter()
+        self.limitadas: Counter = Counter()
+        self._baldes: Dict[Tuple[str, str, str], _Balde] = {}
+        self._global: List[float] = []
+        self._sessoes: List["_SessaoGateway"] = []
+        self._runner: Optional[web.AppRunner] = None
+        self.url_base = ""
+
+        self._rotas: List[Tuple[str, "re.Pattern[str]", str, Any]] = []
+        for metodo, modelo, funcao in self._tabela():
+            self._rotas.append((metodo, _modelo_para_regex(modelo), re.sub(r"\{\w+\}", "{id}", modelo), funcao))
+
+    # ---------- IDs e payloads ----------
+    def novo_id(self, quando_ms: Optional[float] = None) -> int:
+        self._seq_id += 1
+        ms = int(quando_ms if quando_ms is not None else time.time() * 1000)
+        return ((ms - EPOCA_DISCORD_MS) << 22) | (self._seq_id & 0x3FFFFF)
+
+    def _usuario(self, uid: int, nome: str, bot: bool = False) -> dict:
+        return {"id": str(uid), "username": nome, "global_name": None, "discriminator": "0",
+                "avatar": None, "bot": bot, "public_flags": 0}
+
+    def _membro(self, usuario: dict, cargos: List[int]) -> dict:
+        return {"user": usuario, "roles": [str(c) for c in cargos], "nick": None, "avatar": None,
+                "joined_at": "2024-01-01T00:00:00+00:00", "deaf": False, "mute": False, "flags": 0,
+                "pending": False, "communication_disabled_until": None}
+
+    def _cargo(self, rid: int, nome: str, posicao: int, permissoes: int = 0, gerenciado: bool = False) -> dict:
+        return {"id": str(rid), "name": nome, "color": 0, "hoist": False, "position": posicao,
+                "permissions": str(permissoes), "managed": gerenciado, "mentionable": False, "flags": 0}
+
+    def _canal(self, gid: int, cid: int, nome: str, tipo: int = 0, posicao: int = 0,
+               pai: Optional[int] = None, overwrites: Optional[list] = None) -> dict:
+        canal = {"id": str(cid), "guild_id": str(gid), "type": tipo, "name": nome, "position": posicao,
+                 "permission_overwrites": overwrites or [], "parent_id": str(pai) if pai else None,
+                 "nsfw": False, "flags": 0}
+        if tipo in (0, 5):
+            canal.update(topic=None, rate_limit_per_user=0, last_message_id=None)
+        elif tipo in (2, 13):   # voz e palco (Stage)
+            canal.update(bitrate=64000, user_limit=0, rtc_region=None)
+        return canal
+
+    def _mensagem(self, canal_id: int, autor: dict, conteudo: str = "", mid: Optional[int] = None,
+                  embeds: Optional[list] = None, anexos: Optional[list] = None, **extra) -> dict:
+        mid = mid or self.novo_id()
+        ms = (mid >> 22) + EPOCA_DISCORD_MS
+        msg = {"id": str(mid), "channel_id": str(canal_id), "author": autor, "content": conteudo,
+               "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(ms / 1000)) + f".{ms % 1000:03d}000+00:00",
+               "edited_timestamp": None, "tts": False, "mention_everyone": False, "mentions": [],
+               "mention_roles": [], "attachments": anexos or [], "embeds": embeds or [], "pinned": False,
+               "type": 0, "flags": 0, "components": []}
+        gid = self.canal_guild.get(canal_id)
+        if gid:
+            msg["guild_id"] = str(gid)
+        msg.update(extra)
+        return msg
+
+    # ---------- dados sintéticos ----------
+    def semear(self, guilds: int = 1, canais: int = 40, cargos: int = 250, membros: int = 1000,
+               cargos_por_membro: int = 5, mensagens_por_canal: int = 0, dias_mensagens: int = 30) -> List[int]:
+        """Cria servidores parecidos com os reais: cargos do bot (Admin, Staff, VIPs) entre cargos
+        genéricos, canais de texto em categorias, um canal de voz e membros com vários cargos."""
+        criados = []
+        for n in range(guilds):
+            gid = self.novo_id()
+            criados.append(gid)
+            dono = self._usuario(self.novo_id(), f"dono{n}")
+            self.usuarios[int(dono["id"])] = dono
+            self.dono_id = self.dono_id or int(dono["id"])
+            g = {"id": str(gid), "name": f"Servidor falso {n}", "owner_id": dono["id"], "icon": None,
+                 "features": [], "emojis": [], "stickers": [], "premium_tier": 0, "preferred_locale": "pt-BR",
+                 "verification_level": 0, "default_message_notifications": 0, "explicit_content_filter": 0,
+                 "mfa_level": 0, "nsfw_level": 0, "system_channel_id": None, "afk_timeout": 300,
+                 "joined_at": "2024-01-01T00:00:00+00:00", "unavailable": False, "voice_states": [],
+                 "presences": [], "threads": [], "stage_instances": [], "guild_scheduled_events": [],
+                 "soundboard_sounds": [],
+                 "_cargos": {}, "_canais": {}, "_membros": {}, "_bans": set()}
+            self.guilds[gid] = g
+
+            g["_cargos"][gid] = self._cargo(gid, "@everyone", 0, PERMISSOES_MEMBRO)
+            nomes = NOMES_CARGOS_BOT + [f"cargo-{i}" for i in range(max(0, cargos - 1 - len(NOMES_CARGOS_BOT)))]
+            ids_cargos = []
+            for pos, nome in enumerate(nomes[:max(0, cargos - 1)], start=1):
+                rid = self.novo_id()
+                permissoes = PERMISSOES_TODAS if nome == "Admin" else PERMISSOES_MEMBRO
+                g["_cargos"][rid] = self._cargo(rid, nome, cargos - pos, permissoes)
+                ids_cargos.append(rid)
+            cargo_bot = self.novo_id()
+            g["_cargos"][cargo_bot] = self._cargo(cargo_bot, "lzim", cargos, PERMISSOES_TODAS, gerenciado=True)
+
+            g["_membros"][self.app_id] = self._membro(self.bot_usuario, [cargo_bot])
+            g["_membros"][int(dono["id"])] = self._membro(dono, ids_cargos[:1])
+            for i in range(membros):
+                u = self._usuario(self.novo_id(), f"membro{n}_{i}")
+                self.usuarios[int(u["id"])] = u
+                g["_membros"][int(u["id"])] = self._membro(u, self.rng.sample(ids_cargos, min(cargos_por_membro, len(ids_cargos))))
+
+            categoria = None
+            for i in range(canais):
+                if i % 10 == 0:
+                    categoria = self.novo_id()
+                    self._adicionar_canal(gid, self._canal(gid, categoria, f"categoria-{i // 10}", tipo=4, posicao=i // 10))
+                cid = self.novo_id()
+                self._adicionar_canal(gid, self._canal(gid, cid, f"canal-{i}", posicao=i, pai=categoria))
+            voz = self.novo_id()
+            self._adicionar_canal(gid, self._canal(gid, voz, "Músicas", tipo=2))
+
+            if mensagens_por_canal:
+                autores = [m["user"] for m in list(g["_membros"].values())[:50]]
+                agora = time.time() * 1000
+                for cid, canal in g["_canais"].items():
+                    if canal["type"] != 0:
+                        continue
+                    for k in range(mensagens_por_canal):
+                        quando = agora - dias_mensagens * 86400000 * (1 - k / mensagens_por_canal)
+                        self._guardar_mensagem(self._mensagem(cid, self.rng.choice(autores), f"mensagem {k}",
+                                                              mid=self.novo_id(quando)))
+        return criados
+
+    def _adicionar_canal(self, gid: int, canal: dict):
+        cid = int(canal["id"])
+        self.guilds[gid]["_canais"][cid] = canal
+        self.canal_guild[cid] = gid
+        if canal["type"] in (0, 5, 2):
+            self.mensagens.setdefault(cid, {})
+            self.ids_mensagens.setdefault(cid, [])
+
+    def _guardar_mensagem(self, msg: dict):
+        cid, mid = int(msg["channel_id"]), int(msg["id"])
+        self.mensagens.setdefault(cid, {})[mid] = msg
+        ids = self.ids_mensagens.setdefault(cid, [])
+        if not ids or mid > ids[-1]:
+            ids.append(mid)
+        else:
+            bisect.insort(ids, mid)
+
+    def _apagar_mensagem(self, cid: int, mid: int) -> bool:
+        if self.mensagens.get(cid, {}).pop(mid, None) is None:
+            return False
+        ids = self.ids_mensagens[cid]
+        i = bisect.bisect_left(ids, mid)
+        if i < len(ids) and ids[i] == mid:
+            del ids[i]
+        return True
+
+    def payload_guild(self, gid: int, com_membros: bool = True) -> dict:
+        g = self.guilds[gid]
+        dados = {k: v for k, v in g.items() if not k.startswith("_")}
+        membros = list(g["_membros"].values())
+        dados.update(
+            roles=list(g["_cargos"].values()),
+            channels=list(g["_canais"].values()),
+            member_count=len(membros),
+            large=len(membros) > LIMIAR_GRANDE,
+            members=membros if com_membros and len(membros) <= LIMIAR_GRANDE else [g["_membros"][self.app_id]],
+        )
+        return dados
+
+    # ---------- infraestrutura HTTP ----------
+    def _tabela(self):
+        return [
+            ("GET", "/users/@me", self.r_eu),
+            ("GET", "/users/{usuario}", self.r_usuario),
+            ("GET", "/gateway", self.r_gateway),
+            ("GET", "/gateway/bot", self.r_gateway),
+            ("GET", "/oauth2/applications/@me", self.r_aplicacao),
+            ("GET", "/applications/@me", self.r_aplicacao),
+            ("GET", "/applications/{app}/commands", self.r_comandos),
+            ("PUT", "/applications/{app}/commands", self.r_comandos_sync),
+            ("GET", "/applications/{app}/guilds/{guild}/commands", self.r_comandos),
+            ("PUT", "/applications/{app}/guilds/{guild}/commands", self.r_comandos_sync),
+            ("GET", "/guilds/{guild}", self.r_guild),
+            ("GET", "/guilds/{guild}/channels", self.r_canais),
+            ("POST", "/guilds/{guild}/channels", self.r_criar_canal),
+            ("PATCH", "/guilds/{guild}/channels", self.r_posicoes_canais),
+            ("GET", "/guilds/{guild}/roles", self.r_cargos),
+            ("POST", "/guilds/{guild}/roles", self.r_criar_cargo),
+            ("PATCH", "/guilds/{guild}/roles", self.r_posicoes_cargos),
+            ("PATCH", "/guilds/{guild}/roles/{cargo}", self.r_editar_cargo),
+            ("DELETE", "/guilds/{guild}/roles/{cargo}", self.r_apagar_cargo),
+            ("GET", "/guilds/{guild}/members", self.r_membros),
+            ("GET", "/guilds/{guild}/members/{usuario}", self.r_membro),
+            ("PATCH", "/guilds/{guild}/members/{usuario}", self.r_editar_membro),
+            ("DELETE", "/guilds/{guild}/members/{usuario}", self.r_expulsar),
+            ("PUT", "/guilds/{guild}/members/{usuario}/roles/{cargo}", self.r_dar_cargo),
+            ("DELETE", "/guilds/{guild}/members/{usuario}/roles/{cargo}", self.r_tirar_cargo),
+            ("GET", "/guilds/{guild}/bans/{usuario}", self.r_ver_ban),
+            ("PUT", "/guilds/{guild}/bans/{usuario}", self.r_banir),
+            ("DELETE", "/guilds/{guild}/bans/{usuario}", self.r_desbanir),
+            ("POST", "/guilds/{guild}/bulk-ban", self.r_banir_lote),
+            ("GET", "/guilds/{guild}/webhooks", self.r_webhooks_guild),
+            ("GET", "/channels/{canal}", self.r_canal),
+            ("PATCH", "/channels/{canal}", self.r_editar_canal),
+            ("DELETE", "/channels/{canal}", self.r_apagar_canal),
+            ("PUT", "/channels/{canal}/permissions/{alvo}", self.r_permissao),
+            ("DELETE", "/channels/{canal}/permissions/{alvo}", self.r_tirar_permissao),
+            ("GET", "/channels/{canal}/messages", self.r_historico),
+            ("POST", "/channels/{canal}/messages", self.r_enviar),
+            ("POST", "/channels/{canal}/messages/bulk-delete", self.r_apagar_lote),
+            ("GET", "/channels/{canal}/messages/{msg}", self.r_mensagem),
+            ("PATCH", "/channels/{canal}/messages/{msg}", self.r_editar_mensagem),
+            ("DELETE", "/channels/{canal}/messages/{msg}", self.r_apagar),
+            ("POST", "/channels/{canal}/typing", self.r_vazio),
+            ("GET", "/channels/{canal}/webhooks", self.r_webhooks_canal),
+            ("POST", "/channels/{canal}/webhooks", self.r_criar_webhook),
+            ("DELETE", "/webhooks/{webhook}", self.r_apagar_webhook),
+            ("POST", "/webhooks/{webhook}/{token}", self.r_executar_webhook),
+            ("GET", "/webhooks/{webhook}/{token}/messages/{msg}", self.r_resposta),
+            ("PATCH", "/webhooks/{webhook}/{token}/messages/{msg}", self.r_editar_resposta),
+            ("DELETE", "/webhooks/{webhook}/{token}/messages/{msg}", self.r_apagar_resposta),
+            ("POST", "/interactions/{interacao}/{token}/callback", self.r_callback),
+        ]
+
+    def _balde(self, metodo: str, modelo: str, caminho: str) -> Tuple[_Balde, str]:
+        # Parâmetro "maior" (canal/servidor/webhook) separa baldes da mesma rota, como no Discord
+        partes = caminho.split("/")
+        maior = partes[2] if len(partes) > 2 and partes[1] in ("channels", "guilds", "webhooks") else ""
+        if partes[1:2] == ["webhooks"] and len(partes) > 3:
+            maior += "/" + partes[3]
+        chave = (metodo, modelo, maior)
+        balde = self._baldes.get(chave)
+        if balde is None:
+            balde = self._baldes[chave] = _Balde(*LIMITES_ROTA.get((metodo, modelo), LIMITE_PADRAO))
+        return balde, hashlib.md5(f"{metodo}{modelo}".encode()).hexdigest()[:16]
+
+    def _limitar(self, metodo: str, modelo: str, caminho: str) -> Tuple[Optional[web.Response], Dict[str, str]]:
+        agora = time.monotonic()
+        # Respostas de interação não contam no limite global e cada token tem o seu balde
+        interacao = caminho.startswith("/interactions/") or caminho.startswith(f"/webhooks/{self.app_id}/")
+        if not self.limites or caminho.startswith("/interactions/"):
+            return None, {}
+        if interacao:
+            balde, hash_balde = self._balde(metodo, modelo, caminho)
+            return self._consumir(balde, hash_balde, metodo, modelo, agora)
+        # Global: janela deslizante de 1s
+        self._global = [t for t in self._global if agora - t < 1.0]
+        if len(self._global) >= LIMITE_GLOBAL:
+            espera = 1.0 - (agora - self._global[0])
+            self.limitadas["global"] += 1
+            return _json(
+                {"message": "You are being rate limited.", "retry_after": round(espera, 3), "global": True},
+                status=429, headers={"Retry-After": str(max(1, round(espera))), "X-RateLimit-Global": "true",
+                                     "X-RateLimit-Scope": "global", "Via": "1.1 google"}), {}
+        self._global.append(agora)
+
+        balde, hash_balde = self._balde(metodo, modelo, caminho)
+        return self._consumir(balde, hash_balde, metodo, modelo, agora)
+
+    def _consumir(self, balde: _Balde, hash_balde: str, metodo: str, modelo: str,
+                  agora: float) -> Tuple[Optional[web.Response], Dict[str, str]]:
+        if agora >= balde.reinicia:
+            balde.restantes, balde.reinicia = balde.limite, agora + balde.janela
+        espera = balde.reinicia - agora
+        cabecalhos = {
+            "X-RateLimit-Limit": str(balde.limite),
+            "X-RateLimit-Reset": f"{time.time() + espera:.3f}",
+            "X-RateLimit-Reset-After": f"{espera:.3f}",
+            "X-RateLimit-Bucket": hash_balde,
+        }
+        if balde.restantes <= 0:
+            self.limitadas[f"{metodo} {modelo}"] += 1
+            cabecalhos.update({"X-RateLimit-Remaining": "0", "Retry-After": str(max(1, round(espera))),
+                               "X-RateLimit-Scope": "user", "Via": "1.1 google"})
+            return _json({"message": "You are being rate limited.", "retry_after": round(espera, 3),
+                                      "global": False}, status=429, headers=cabecalhos), {}
+        balde.restantes -= 1
+        cabecalhos["X-RateLimit-Remaining"] = str(balde.restantes)
+        return None, cabecalhos
+
+    async def _corpo(self, request: web.Request) -> Any:
+        if request.content_type.startswith("multipart/"):
+            dados, anexos = {}, []
+            async for parte in await request.multipart():
+                if parte.name == "payload_json":
+                    dados = json.loads(await parte.text())
+                else:
+                    conteudo = await parte.read()
+                    anexos.append({"id": str(self.novo_id()), "filename": parte.filename or "arquivo",
+                                   "size": len(conteudo), "url": "https://cdn.falso/arquivo",
+                                   "proxy_url": "https://cdn.falso/arquivo"})
+            if anexos:
+                dados["attachments"] = anexos
+            return dados
+        if request.can_read_body:
+            texto = await request.text()
+            return json.loads(texto) if texto else {}
+        return {}
+
+    async def _rota_api(self, request: web.Request) -> web.StreamResponse:
+        caminho = request.path[len(API):] or "/"
+        for metodo, regex, modelo, funcao in self._rotas:
+            if metodo != request.method:
+                continue
+            achou = regex.match(caminho)
+            if achou:
+                break
+        else:
+            self.chamadas[f"{request.method} (não emulada) {caminho}"] += 1
+            return _json({"message": "404: Not Found", "code": 0}, status=404)
+
+        self.chamadas[f"{metodo} {modelo}"] += 1
+        limitada, cabecalhos = self._limitar(metodo, modelo, caminho)
+        atraso = max(0.0, self.rng.gauss(self.latencia_ms, self.variacao_ms)) / 1000
+        if atraso:
+            await asyncio.sleep(atraso)
+        if limitada is not None:
+            return limitada
+        cabecalhos["Via"] = "1.1 google"
+        try:
+            resultado = await funcao(request, await self._corpo(request), **achou.groupdict())
+        except ErroDiscord as e:
+            return _json({"message": e.mensagem, "code": e.codigo}, status=e.status, headers=cabecalhos)
+        if resultado is None:
+            return web.Response(status=204, headers=cabecalhos)
+        return _json(resultado, headers=cabecalhos)
+
+    # ---------- helpers de acesso ----------
+    def _g(self, gid) -> dict:
+        g = self.guilds.get(int(gid))
+        if g is None:
+            raise _nao_encontrado("servidor")
+        return g
+
+    def _c(self, cid) -> dict:
+        gid = self.canal_guild.get(int(cid))
+        if gid is None:
+            raise _nao_encontrado("canal")
+        return self.guilds[gid]["_canais"][int(cid)]
+
+    def _m(self, g: dict, uid) -> dict:
+        membro = g["_membros"].get(int(uid))
+        if membro is None:
+            raise _nao_encontrado("membro")
+        return membro
+
+    # ---------- rotas: aplicação / gateway ----------
+    async def r_eu(self, req, corpo):
+        return self.bot_usuario
+
+    async def r_usuario(self, req, corpo, usuario):
+        if usuario == "@me":
+            return self.bot_usuario
+        u = self.usuarios.get(int(usuario))
+        if u is None:
+            raise _nao_encontrado("usuário")
+        return u
+
+    async def r_gateway(self, req, corpo):
+        return {"url": self.url_base.replace("http", "ws", 1) + "/_falso/gateway", "shards": 1,
+                "session_start_limit": {"total": 1000, "remaining": 1000, "reset_after": 0, "max_concurrency": 1}}
+
+    async def r_aplicacao(self, req, corpo):
+        return {"id": str(self.app_id), "name": "lzim-falso", "icon": None, "description": "", "bot_public": True,
+                "bot_require_code_grant": False, "verify_key": "0" * 64, "flags": 0, "bot": self.bot_usuario,
+                "owner": self.usuarios.get(self.dono_id, self.bot_usuario), "team": None}
+
+    async def r_comandos(self, req, corpo, app, guild=None):
+        return self.comandos.get(guild or "global", [])
+
+    async def r_comandos_sync(self, req, corpo, app, guild=None):
+        registrados = []
+        for cmd in corpo:
+            cmd = dict(cmd, id=str(self.novo_id()), application_id=str(self.app_id), version=str(self.novo_id()))
+            if guild:
+                cmd["guild_id"] = guild
+            registrados.append(cmd)
+        self.comandos[guild or "global"] = registrados
+        return registrados
+
+    # ---------- rotas: servidor, canais, cargos ----------
+    async def r_guild(self, req, corpo, guild):
+        dados = self.payload_guild(int(guild), com_membros=False)
+        dados.pop("members")
+        dados.pop("channels")
+        return dados
+
+    async def r_canais(self, req, corpo, guild):
+        return list(self._g(guild)["_canais"].values())
+
+    async def r_criar_canal(self, req, corpo, guild):
+        gid = int(guild)
+        self._g(gid)
+        canal = self._canal(gid, self.novo_id(), corpo.get("name", "canal"), corpo.get("type", 0),
+                            corpo.get("position") or 0, int(corpo["parent_id"]) if corpo.get("parent_id") else None,
+                            corpo.get("permission_overwrites"))
+        if corpo.get("topic"):
+            canal["topic"] = corpo["topic"]
+        self._adicionar_canal(gid, canal)
+        self.emitir("CHANNEL_CREATE", canal, gid)
+        return canal
+
+    async def r_posicoes_canais(self, req, corpo, guild):
+        g = self._g(guild)
+        for item in corpo:
+            canal = g["_canais"].get(int(item["id"]))
+            if canal is None:
+                continue
+            if item.get("position") is not None:
+                canal["position"] = item["position"]
+            if "parent_id" in item:
+                canal["parent_id"] = item["parent_id"]
+            self.emitir("CHANNEL_UPDATE", canal, int(guild))
+        return None
+
+    async def r_cargos(self, req, corpo, guild):
+        return list(self._g(guild)["_cargos"].values())
+
+    async def r_criar_cargo(self, req, corpo, guild):
+        g = self._g(guild)
+        rid = self.novo_id()
+        cargo = self._cargo(rid, corpo.get("name", "new role"), 1, int(corpo.get("permissions") or 0))
+        for campo in ("color", "hoist", "mentionable"):
+            if campo in corpo:
+                cargo[campo] = corpo[campo]
+        g["_cargos"][rid] = cargo
+        self.emitir("GUILD_ROLE_CREATE", {"guild_id": guild, "role": cargo}, int(guild))
+        return cargo
+
+    async def r_posicoes_cargos(self, req, corpo, guild):
+        g = self._g(guild)
+        for item in corpo:
+            cargo = g["_cargos"].get(int(item["id"]))
+            if cargo is not None:
+                cargo["position"] = item["position"]
+                self.emitir("GUILD_ROLE_UPDATE", {"guild_id": guild, "role": cargo}, int(guild))
+        return list(g["_cargos"].values())
+
+    async def r_editar_cargo(self, req, corpo, guild, cargo):
+        g = self._g(guild)
+        dados = g["_cargos"].get(int(cargo))
+        if dados is None:
+            raise _nao_encontrado("cargo")
+        for campo in ("name", "color", "hoist", "mentionable", "permissions"):
+            if campo in corpo:
+                dados[campo] = str(corpo[campo]) if campo == "permissions" else corpo[campo]
+        self.emitir("GUILD_ROLE_UPDATE", {"guild_id": guild, "role": dados}, int(guild))
+        return dados
+
+    async def r_apagar_cargo(self, req, corpo, guild, cargo):
+        g = self._g(guild)
+        if g["_cargos"].pop(int(cargo), None) is None:
+            raise _nao_encontrado("cargo")
+        for membro in g["_membros"].values():
+            if cargo in membro["roles"]:
+                membro["roles"].remove(cargo)
+        self.emitir("GUILD_ROLE_DELETE", {"guild_id": guild, "role_id": cargo}, int(guild))
+        return None
+
+    async def r_canal(self, req, corpo, canal):
+        return self._c(canal)
+
+    async def r_editar_canal(self, req, corpo, canal):
+        dados = self._c(canal)
+        for campo in ("name", "topic", "position", "nsfw", "rate_limit_per_user", "permission_overwrites",
+                      "parent_id", "user_limit", "bitrate"):
+            if campo in corpo:
+                dados[campo] = corpo[campo]
+        self.emitir("CHANNEL_UPDATE", dados, self.canal_guild[int(canal)])
+        return dados
+
+    async def r_apagar_canal(self, req, corpo, canal):
+        dados = self._c(canal)
+        gid = self.canal_guild.pop(int(canal))
+        del self.guilds[gid]["_canais"][int(canal)]
+        self.mensagens.pop(int(canal), None)
+        self.ids_mensagens.pop(int(canal), None)
+        self.emitir("CHANNEL_DELETE", dados, gid)
+        return dados
+
+    async def r_permissao(self, req, corpo, canal, alvo):
+        dados = self._c(canal)
+        novo = {"id": alvo, "type": corpo.get("type", 0), "allow": str(corpo.get("allow", "0")),
+                "deny": str(corpo.get("deny", "0"))}
+        # IDs chegam como int na criação do canal e como str na rota
+        dados["permission_overwrites"] = [o for o in dados["permission_overwrites"] if str(o["id"]) != alvo] + [novo]
+        self.emitir("CHANNEL_UPDATE", dados, self.canal_guild[int(canal)])
+        return None
+
+    async def r_tirar_permissao(self, req, corpo, canal, alvo):
+        dados = self._c(canal)
+        dados["permission_overwrites"] = [o for o in dados["permission_overwrites"] if str(o["id"]) != alvo]
+        self.emitir("CHANNEL_UPDATE", dados, self.canal_guild[int(canal)])
+        return None
+
+    # ---------- rotas: membros e banimentos ----------
+    async def r_membros(self, req, corpo, guild):
+        g = self._g(guild)
+        limite = min(int(req.query.get("limit", 1)), 1000)
+        depois = int(req.query.get("after", 0))
+        ids = sorted(uid for uid in g["_membros"] if uid > depois)[:limite]
+        return [g["_membros"][uid] for uid in ids]
+
+    async def r_membro(self, req, corpo, guild, usuario):
+        return self._m(self._g(guild), usuario)
+
+    async def r_editar_membro(self, req, corpo, guild, usuario):
+        membro = self._m(self._g(guild), usuario)
+        for campo in ("nick", "roles", "communication_disabled_until", "mute", "deaf"):
+            if campo in corpo:
+                membro[campo] = corpo[campo]
+        self.emitir("GUILD_MEMBER_UPDATE", dict(membro, guild_id=guild), int(guild))
+        return membro
+
+    async def r_expulsar(self, req, corpo, guild, usuario):
+        g = self._g(guild)
+        membro = g["_membros"].pop(int(usuario), None)
+        if membro is None:
+            raise _nao_encontrado("membro")
+        self.emitir("GUILD_MEMBER_REMOVE", {"guild_id": guild, "user": membro["user"]}, int(guild))
+        return None
+
+    async def r_dar_cargo(self, req, corpo, guild, usuario, cargo):
+        g = self._g(guild)
+        membro = self._m(g, usuario)
+        if int(cargo) not in g["_cargos"]:
+            raise _nao_encontrado("cargo")
+        if cargo not in membro["roles"]:
+            membro["roles"].append(cargo)
+        self.emitir("GUILD_MEMBER_UPDATE", dict(membro, guild_id=guild), int(guild))
+        return None
+
+    async def r_tirar_cargo(self, req, corpo, guild, usuario, cargo):
+        membro = self._m(self._g(guild), usuario)
+        if cargo in membro["roles"]:
+            membro["roles"].remove(cargo)
+        self.emitir("GUILD_MEMBER_UPDATE", dict(membro, guild_id=guild), int(guild))
+        return None
+
+    def _banir(self, g: dict, uid: int):
+        g["_bans"].add(uid)
+        membro = g["_membros"].pop(uid, None)
+        usuario = (membro or {}).get("user") or self.usuarios.get(uid) or self._usuario(uid, f"usuario{uid}")
+        self.emitir("GUILD_BAN_ADD", {"guild_id": g["id"], "user": usuario}, int(g["id"]))
+        if membro:
+            self.emitir("GUILD_MEMBER_REMOVE", {"guild_id": g["id"], "user": usuario}, int(g["id"]))
+
+    async def r_ver_ban(self, req, corpo, guild, usuario):
+        if int(usuario) not in self._g(guild)["_bans"]:
+            raise _nao_encontrado("ban")
+        return {"reason": None, "user": self.usuarios.get(int(usuario)) or self._usuario(int(usuario), "?")}
+
+    async def r_banir(self, req, corpo, guild, usuario):
+        self._banir(self._g(guild), int(usuario))
+        return None
+
+    async def r_desbanir(self, req, corpo, guild, usuario):
+        g = self._g(guild)
+        if int(usuario) not in g["_bans"]:
+            raise _nao_encontrado("ban")
+        g["_bans"].discard(int(usuario))
+        return None
+
+    async def r_banir_lote(self, req, corpo, guild):
+        g = self._g(guild)
+        ids = [int(u) for u in corpo.get("user_ids", [])]
+        if not ids or len(ids) > 200:
+            raise ErroDiscord(400, 50035, "Invalid Form Body")
+        banidos, falhas = [], []
+        for uid in ids:
+            if uid in g["_bans"]:
+                falhas.append(str(uid))
+            else:
+                self._banir(g, uid)
+                banidos.append(str(uid))
+        if not banidos:
+            raise ErroDiscord(500, 500000, "Failed to ban users")
+        return {"banned_users": banidos, "failed_users": falhas}
+
+    # ---------- rotas: mensagens ----------
+    async def r_historico(self, req, corpo, canal):
+        cid = int(canal)
+        self._c(cid)
+        ids = self.ids_mensagens.get(cid, [])
+        limite = max(1, min(int(req.query.get("limit", 50)), 100))
+        if "after" in req.query:
+            i = bisect.bisect_right(ids, int(req.query["after"]))
+            escolhidos = ids[i:i + limite][::-1]
+        elif "around" in req.query:
+            i = bisect.bisect_left(ids, int(req.query["around"]))
+            escolhidos = ids[max(0, i - limite // 2):i + limite // 2][::-1]
+        else:
+            fim = bisect.bisect_left(ids, int(req.query["before"])) if "before" in req.query else len(ids)
+            escolhidos = ids[max(0, fim - limite):fim][::-1]
+        return [self.mensagens[cid][mid] for mid in escolhidos]
+
+    async def r_enviar(self, req, corpo, canal):
+        cid = int(canal)
+        self._c(cid)
+        msg = self._mensagem(cid, self.bot_usuario, corpo.get("content") or "", embeds=corpo.get("embeds"),
+                             anexos=corpo.get("attachments"), components=corpo.get("components") or [])
+        self._guardar_mensagem(msg)
+        self.emitir("MESSAGE_CREATE", msg, self.canal_guild[cid])
+        return msg
+
+    async def r_mensagem(self, req, corpo, canal, msg):
+        dados = self.mensagens.get(int(canal), {}).get(int(msg))
+        if dados is None:
+            raise _nao_encontrado("mensagem")
+        return dados
+
+    async def r_editar_mensagem(self, req, corpo, canal, msg):
+        dados = await self.r_mensagem(req, corpo, canal, msg)
+        for campo in ("content", "embeds", "components", "attachments"):
+            if campo in corpo:
+                dados[campo] = corpo[campo] or []
+        dados["edited_timestamp"] = dados["timestamp"]
+        self.emitir("MESSAGE_UPDATE", dados, self.canal_guild[int(canal)])
+        return dados
+
+    async def r_apagar(self, req, corpo, canal, msg):
+        if not self._apagar_mensagem(int(canal), int(msg)):
+            raise _nao_encontrado("mensagem")
+        gid = self.canal_guild.get(int(canal))
+        self.emitir("MESSAGE_DELETE", {"id": msg, "channel_id": canal, "guild_id": str(gid)}, gid)
+        return None
+
+    async def r_apagar_lote(self, req, corpo, canal):
+        ids = [int(m) for m in corpo.get("messages", [])]
+        if not 2 <= len(ids) <= 100:
+            raise ErroDiscord(400, 50016, "You must provide at least 2 and fewer than 100 messages to delete")
+        limite_14d = ((int(time.time() * 1000) - 14 * 86400000 - EPOCA_DISCORD_MS) << 22)
+        if any(mid < limite_14d for mid in ids):
+            raise ErroDiscord(400, 50034, "You can only bulk delete messages that are under 14 days old")
+        apagadas = [str(mid) for mid in ids if self._apagar_mensagem(int(canal), mid)]
+        gid = self.canal_guild.get(int(canal))
+        self.emitir("MESSAGE_DELETE_BULK", {"ids": apagadas, "channel_id": canal, "guild_id": str(gid)}, gid)
+        return None
+
+    async def r_vazio(self, req, corpo, **_):
+        return None
+
+    # ---------- rotas: webhooks e interações ----------
+    def _avisar(self, token: str, tipo: str):
+        if self.ao_responder is not None:
+            self.ao_responder(token, tipo)
+
+    async def r_webhooks_canal(self, req, corpo, canal):
+        self._c(canal)
+        return [w for w in self.webhooks.values() if w["channel_id"] == canal]
+
+    async def r_webhooks_guild(self, req, corpo, guild):
+        return [w for w in self.webhooks.values() if w["guild_id"] == guild]
+
+    async def r_criar_webhook(self, req, corpo, canal):
+        self._c(canal)
+        wid = self.novo_id()
+        gid = self.canal_guild[int(canal)]
+        webhook = {"id": str(wid), "type": 1, "token": hashlib.sha1(str(wid).encode()).hexdigest(),
+                   "channel_id": canal, "guild_id": str(gid), "name": corpo.get("name", "webhook"),
+                   "avatar": None, "application_id": None, "user": self.bot_usuario}
+        self.webhooks[wid] = webhook
+        self.emitir("WEBHOOKS_UPDATE", {"guild_id": str(gid), "channel_id": canal}, gid)
+        return webhook
+
+    async def r_apagar_webhook(self, req, corpo, webhook):
+        dados = self.webhooks.pop(int(webhook), None)
+        if dados is None:
+            raise _nao_encontrado("webhook")
+        return None
+
+    async def r_executar_webhook(self, req, corpo, webhook, token):
+        if int(webhook) == self.app_id:
+            # Follow-up de interação: mensagem fica associada ao token
+            msg = self._mensagem(0, self.bot_usuario, corpo.get("content") or "", embeds=corpo.get("embeds"),
+                                 anexos=corpo.get("attachments"), flags=corpo.get("flags", 0),
+                                 components=corpo.get("components") or [])
+            self.respostas.setdefault(token, msg)
+            self.mensagens_interacao[int(msg["id"])] = (token, msg)
+            self._avisar(token, "followup")
+            return msg
+        dados = self.webhooks.get(int(webhook))
+        if dados is None or dados["token"] != token:
+            raise _nao_encontrado("webhook")
+        autor = self._usuario(int(webhook), corpo.get("username") or dados["name"], bot=True)
+        msg = self._mensagem(int(dados["channel_id"]), autor, corpo.get("content") or "",
+                             embeds=corpo.get("embeds"), anexos=corpo.get("attachments"), webhook_id=webhook)
+        self._guardar_mensagem(msg)
+        return msg if req.query.get("wait") in ("1", "true", "True") else None
+
+    def _resposta(self, token: str) -> dict:
+        msg = self.respostas.get(token)
+        if msg is None:
+            raise _nao_encontrado("mensagem")
+        return msg
+
+    async def r_resposta(self, req, corpo, webhook, token, msg):
+        return self._resposta(token)
+
+    async def r_editar_resposta(self, req, corpo, webhook, token, msg):
+        dados = self._resposta(token)
+        for campo in ("content", "embeds", "components", "attachments"):
+            if campo in corpo:
+                dados[campo] = corpo[campo] or []
+        self._avisar(token, "edicao")
+        return dados
+
+    async def r_apagar_resposta(self, req, corpo, webhook, token, msg):
+        self.respostas.pop(token, None)
+        return None
+
+    async def r_callback(self, req, corpo, interacao, token):
+        tipo = corpo.get("type", 4)
+        dados = corpo.get("data") or {}
+        self._avisar(token, f"callback:{tipo}")
+        interacao_info = {"id": interacao, "type": 2, "response_message_loading": tipo == 5,
+                          "response_message_ephemeral": bool((dados.get("flags") or 0) & 64)}
+        if tipo == 1 or tipo == 9:       # pong / modal
+            return {"interaction": interacao_info, "resource": {"type": tipo}}
+        msg = self.respostas.get(token)
+        if msg is None or tipo in (4, 5):
+            msg = self._mensagem(0, self.bot_usuario, dados.get("content") or "", embeds=dados.get("embeds"),
+                                 anexos=dados.get("attachments"), flags=dados.get("flags", 0),
+                                 components=dados.get("components") or [])
+            self.respostas[token] = msg
+            self.mensagens_interacao[int(msg["id"])] = (token, msg)
+        else:
+            for campo in ("content", "embeds", "components"):
+                if campo in dados:
+                    msg[campo] = dados[campo] or []
+        interacao_info["response_message_id"] = msg["id"]
+        return {"interaction": interacao_info, "resource": {"type": tipo, "message": msg}}
+
+    # ---------- gateway ----------
+    def emitir(self, evento: str, dados: dict, guild_id: Optional[int] = None):
+        """Entrega um DISPATCH às sessões conectadas que têm o intent e o shard do servidor."""
+        bit = 0
+        for prefixo, valor in INTENT_EVENTO.items():
+            if evento.startswith(prefixo):
+                bit = valor   # o prefixo mais longo vem depois na tabela
+        for sessao in list(self._sessoes):
+            if bit and not sessao.intents & bit:
+                continue
+            if guild_id is not None and not sessao.cuida_de(guild_id):
+                continue
+            sessao.enviar_evento(evento, dados)
+
+    async def _rota_gateway(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse(max_msg_size=0)
+        await ws.prepare(request)
+        sessao = _SessaoGateway(self, ws)
+        try:
+            await sessao.rodar()
+        finally:
+            if sessao in self._sessoes:
+                self._sessoes.remove(sessao)
+        return ws
+
+    # ---------- controle ----------
+    async def _rota_evento(self, request: web.Request) -> web.Response:
+        corpo = await request.json()
+        eventos = corpo if isinstance(corpo, list) else [corpo]
+        for ev in eventos:
+            self.emitir(ev["t"], ev["d"], int(ev["guild_id"]) if ev.get("guild_id") else None)
+        return _json({"enviados": len(eventos), "sessoes": len(self._sessoes)})
+
+    def estatisticas(self) -> dict:
+        return {"chamadas": dict(self.chamadas.most_common()), "limitadas_429": dict(self.limitadas.most_common()),
+                "total": sum(self.chamadas.values()), "sessoes": len(self._sessoes)}
+
+    async def _rota_estatisticas(self, request: web.Request) -> web.Response:
+        return _json(self.estatisticas())
+
+    async def _rota_zerar(self, request: web.Request) -> web.Response:
+        self.chamadas.clear()
+        self.limitadas.clear()
+        return _json({"ok": True})
+
+    def app(self) -> web.Application:
+        app = web.Application(client_max_size=64 * 1024 * 1024)
+        app.router.add_get("/_falso/gateway", self._rota_gateway)
+        app.router.add_post("/_falso/evento", self._rota_evento)
+        app.router.add_get("/_falso/estatisticas", self._rota_estatisticas)
+        app.router.add_post("/_falso/zerar", self._rota_zerar)
+        app.router.add_route("*", API + "/{caminho:.*}", self._rota_api)
+        return app
+
+    async def iniciar(self, porta: int = 8999, host: str = "127.0.0.1") -> str:
+        self._runner = web.AppRunner(self.app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, porta)
+        await site.start()
+        porta_real = site._server.sockets[0].getsockname()[1]  # porta 0 → escolhida pelo sistema
+        self.url_base = f"http://{host}:{porta_real}"
+        return self.url_base + API
+
+    async def encerrar(self):
+        for sessao in list(self._sessoes):
+            await sessao.ws.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+class _SessaoGateway:
+    HEARTBEAT_MS = 41250
+
+    def __init__(self, falso: DiscordFalso, ws: web.WebSocketResponse):
+        self.falso, self.ws = falso, ws
+        self.intents = 0
+        self.shard = (0, 1)
+        self.seq = 0
+        self._fila: asyncio.Queue = asyncio.Queue()
+
+    def cuida_de(self, guild_id: int) -> bool:
+        return (guild_id >> 22) % self.shard[1] == self.shard[0]
+
+    def enviar_evento(self, evento: str, dados: dict):
+        self.seq += 1
+        self._fila.put_nowait({"op": 0, "t": evento, "s": self.seq, "d": dados})
+
+    async def _escritor(self):
+        while True:
+            payload = await self._fila.get()
+            await self.ws.send_str(json.dumps(payload))
+
+    async def rodar(self):
+        escritor = asyncio.create_task(self._escritor())
+        try:
+            await self.ws.send_str(json.dumps({"op": 10, "d": {"heartbeat_interval": self.HEARTBEAT_MS}}))
+            async for msg in self.ws:
+                if msg.type != web.WSMsgType.TEXT:
+                    continue
+                dados = json.loads(msg.data)
+                op = dados.get("op")
+                if op == 1:
+                    self._fila.put_nowait({"op": 11})
+                elif op == 2:
+                    self._identificar(dados["d"])
+                elif op == 6:
+                    self._fila.put_nowait({"op": 9, "d": False})   # sem resume: o cliente identifica de novo
+                elif op == 8:
+                    self._membros(dados["d"])
+        finally:
+            escritor.cancel()
+
+    def _identificar(self, d: dict):
+        self.intents = d.get("intents", 0)
+        self.shard = tuple(d.get("shard") or (0, 1))
+        self.falso._sessoes.append(self)
+        minhas = [gid for gid in self.falso.guilds if self.cuida_de(gid)]
+        self.enviar_evento("READY", {
+            "v": 10, "user": self.falso.bot_usuario, "session_id": hashlib.md5(str(id(self)).encode()).hexdigest(),
+            "resume_gateway_url": self.falso.url_base.replace("http", "ws", 1) + "/_falso/gateway",
+            "guilds": [{"id": str(gid), "unavailable": True} for gid in minhas], "shard": list(self.shard),
+            "application": {"id": str(self.falso.app_id), "flags": 0}, "private_channels": [],
+            "relationships": [], "presences": [],
+        })
+        for gid in minhas:
+            self.enviar_evento("GUILD_CREATE", self.falso.payload_guild(gid, com_membros=bool(self.intents & 2)))
+
+    def _membros(self, d: dict):
+        g = self.falso.guilds.get(int(d["guild_id"]))
+        if g is None:
+            return
+        if d.get("user_ids"):
+            membros = [g["_membros"][int(u)] for u in d["user_ids"] if int(u) in g["_membros"]]
+        else:
+            consulta = (d.get("query") or "").lower()
+            membros = [m for m in g["_membros"].values() if m["user"]["username"].lower().startswith(consulta)]
+            if d.get("limit"):
+                membros = membros[:d["limit"]]
+        total = max(1, (len(membros) + MEMBROS_POR_CHUNK - 1) // MEMBROS_POR_CHUNK)
+        for i in range(total):
+            self.enviar_evento("GUILD_MEMBERS_CHUNK", {
+                "guild_id": d["guild_id"], "members": membros[i * MEMBROS_POR_CHUNK:(i + 1) * MEMBROS_POR_CHUNK],
+                "chunk_index": i, "chunk_count": total, "nonce": d.get("nonce"),
+            })
+
+
+async def bot_conectado(falso: DiscordFalso, pasta: Optional[str] = None):
+    """
+    Sobe o LzimBot no mesmo processo apontando para este Discord falso e espera o
+    on_ready. Arquivos do bot (sync_hash.json, auditoria.db...) vão para `pasta`
+    (padrão: diretório temporário). Devolve (bot, tarefa); encerrar com bot.close().
+    """
+    import os
+    import sys
+    import tempfile
+
+    raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if raiz not in sys.path:
+        sys.path.insert(0, raiz)
+    os.chdir(pasta or tempfile.mkdtemp(prefix="lzim-falso-"))
+    os.environ["DISCORD_API_BASE"] = falso.url_base + API   # antes do import: config lê na carga
+    os.environ.setdefault("DISCORD_TOKEN", "falso")
+
+    import discord
+    import config
+    import main as bot_main
+
+    config.DISCORD_API_BASE = falso.url_base + API
+    discord.http.Route.BASE = config.DISCORD_API_BASE
+    discord.webhook.async_.Route.BASE = config.DISCORD_API_BASE
+    bot = bot_main.LzimBot(
+        command_prefix="!", intents=bot_main.intents, enable_debug_events=True,
+        tree_cls=bot_main.ArvoreComandos, **bot_main.cache_membros.opcoes_bot(intents=bot_main.intents)
+    )
+    tarefa = asyncio.create_task(bot.start(config.DISCORD_TOKEN or "falso"))
+    while not bot.is_ready():
+        if tarefa.done():
+            tarefa.result()   # propaga o erro do login/conexão
+        await asyncio.sleep(0.05)
+    return bot, tarefa
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Discord falso (REST + gateway) para testes de carga")
+    parser.add_argument("--porta", type=int, default=8999)
+    parser.add_argument("--guilds", type=int, default=1)
+    parser.add_argument("--canais", type=int, default=40)
+    parser.add_argument("--cargos", type=int, default=250)
+    parser.add_argument("--membros", type=int, default=1000)
+    parser.add_argument("--cargos-por-membro", type=int, default=5)
+    parser.add_argument("--mensagens", type=int, default=0, help="mensagens por canal de texto")
+    parser.add_argument("--latencia-ms", type=float, default=40)
+    parser.add_argument("--variacao-ms", type=float, default=20)
+    parser.add_argument("--sem-limites", action="store_true", help="não simula rate limit")
+    args = parser.parse_args()
+
+    async def rodar():
+        falso = DiscordFalso(args.latencia_ms, args.variacao_ms, limites=not args.sem_limites)
+        falso.semear(args.guilds, args.canais, args.cargos, args.membros, args.cargos_por_membro, args.mensagens)
+        base = await falso.iniciar(args.porta)
+        print(f"🧪 Discord falso em {base} (dono do bot: {falso.dono_id})")
+        print(f"   DISCORD_API_BASE={base} DISCORD_TOKEN=falso python main.py")
+        try:
+            await asyncio.Event().wait()
+        finally:
+            print(json.dumps(falso.estatisticas(), indent=2, ensure_ascii=False))
+            await falso.encerrar()
+
+    try:
+        asyncio.run(rodar())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+# benchmarks/micro.py
+"""
+Micro-benchmarks dos caminhos quentes em Python puro, com dados sintéticos
+na escala real (servidor com 250 cargos, membros com 50 cargos cada), e
+trava de regressão contra uma linha de base salva em JSON.
+
+Cada caso é medido em ns por chamada e dividido por um laço de referência
+medido logo antes dele, em REPETICOES rodadas (vale a mediana das razões),
+para a linha de base valer entre máquinas diferentes. Um caso falha quando
+fica mais lento que a base além da tolerância, também numa segunda medição
+(uma rajada de carga não se repete duas vezes seguidas). A linha de base usa a mesma medição, como mediana de PASSADAS_BASE
+processos separados (layout de memória e semente de hash mudam a cada
+processo e deslocam todos os casos juntos; uma base tirada num processo
+atípico faria a trava falhar sem mudança nenhuma no código).
+
+Uso:
+  python benchmarks/micro.py                 # compara com benchmarks/micro_base.json (sai com 1 se regredir)
+  python benchmarks/micro.py --salvar        # grava a linha de base atual (mediana de 5 processos)
+  python benchmarks/micro.py --casos eh_vip --tolerancia 0.15
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import timeit
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Tuple
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+ARQUIVO_BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "micro_base.json")
+TOLERANCIA_PADRAO = 0.25
+REPETICOES = 15
+FRACAO_RODADA = 4       # cada rodada mede 1/4 do que o autorange escolhe (~50 ms)
+PASSADAS_BASE = 5
+
+GUILD_ID = 900000000000000000
+BOT_ID = 1
+N_CARGOS = 250
+CARGOS_POR_MEMBRO = 50
+N_MEMBROS = 2000
+N_PARTICIPANTES = 10000
+NOMES_ESPECIAIS = ["Admin", "Staff", "Moderador", "🔥SUPER VIP", "💎VIP DIAMANTE", "🐸VIP SAPO", "💜VIP GALÁTICO"]
+
+
+# ---------- dados sintéticos ----------
+
+def _cargo(i: int, nome: str, permissoes: int = 0) -> dict:
+    return {"id": str(GUILD_ID + i), "name": nome, "permissions": str(permissoes), "position": i,
+            "color": 0, "hoist": False, "managed": False, "mentionable": False}
+
+
+def _membro(uid: int, cargos: List[int]) -> dict:
+    return {"user": {"id": str(uid), "username": f"membro{uid}", "global_name": None, "discriminator": "0",
+                     "avatar": None},
+            "roles": [str(GUILD_ID + c) for c in cargos], "joined_at": "2024-01-01T00:00:00+00:00",
+            "deaf": False, "mute": False, "flags": 0}
+
+
+def montar_servidor():
+    """Guild real do discord.py (parsers do estado), sem conexão."""
+    import discord
+    from discord.user import ClientUser
+
+    rng = random.Random(42)
+    client = discord.Client(intents=discord.Intents.default() | discord.Intents(members=True))
+    state = client._connection
+    state.user = ClientUser(state=state, data={"id": str(BOT_ID), "username": "bot", "discriminator": "0",
+                                               "avatar": None})
+
+    # Cargos especiais no meio da lista, como num servidor real
+    nomes = [f"cargo-{i}" for i in range(1, N_CARGOS)]
+    for k, nome in enumerate(NOMES_ESPECIAIS):
+        nomes[(k + 1) * 30] = nome
+    cargos = [_cargo(0, "@everyone", 0x6BFFFEC1 & ~8)] + [_cargo(i + 1, n) for i, n in enumerate(nomes)]
+    comuns = [i for i, n in enumerate(nomes, start=1) if n.startswith("cargo-")]
+    especiais = {n: i for i, n in enumerate(nomes, start=1) if not n.startswith("cargo-")}
+
+    membros = [_membro(BOT_ID, [])]
+    membros.append(_membro(2, rng.sample(comuns, CARGOS_POR_MEMBRO)))                                 # comum
+    membros.append(_membro(3, rng.sample(comuns, CARGOS_POR_MEMBRO - 1) + [especiais["Staff"]]))    # staff
+    membros.append(_membro(4, rng.sample(comuns, CARGOS_POR_MEMBRO - 1) + [especiais["💜VIP GALÁTICO"]]))
+    membros += [_membro(100 + i, rng.sample(comuns, 5)) for i in range(N_MEMBROS)]
+
+    canal_ticket = {
+        "id": "800000000000000001", "type": 0, "name": "🎫ticket-membro2", "position": 0,
+        "permission_overwrites": (
+            [{"id": str(GUILD_ID), "type": 0, "allow": "0", "deny": "1024"},
+             {"id": "2", "type": 1, "allow": "3072", "deny": "0"},
+             {"id": "1", "type": 1, "allow": "3088", "deny": "0"}]
+            + [{"id": str(GUILD_ID + especiais[n]), "type": 0, "allow": "3072", "deny": "0"}
+               for n in ("Admin", "Staff", "Moderador")]
+            + [{"id": str(GUILD_ID + c), "type": 0, "allow": "1024", "deny": "0"} for c in comuns[:10]]
+        ),
+    }
+    guild = state._add_guild_from_data({
+        "id": str(GUILD_ID), "name": "sintetico", "member_count": len(membros), "large": True,
+        "roles": cargos, "channels": [canal_ticket], "members": membros, "emojis": [], "stickers": [],
+        "features": [], "voice_states": [],
+    })
+    return guild
+
+
+def _casos(guild) -> Dict[str, Callable[[], object]]:
+    import comandos_utilitarios
+    import mod_org_cargos
+    import mod_painel_admin
+    import mod_sorteio
+    import mod_tickets
+
+    comum, staff, vip = guild.get_member(2), guild.get_member(3), guild.get_member(4)
+    canal = guild.text_channels[0]
+    participantes = [guild.get_member(100 + i % N_MEMBROS) for i in range(N_PARTICIPANTES)]
+    inter_comum = SimpleNamespace(guild=guild, user=comum)   # _tem_permissao só lê .guild e .user
+
+    return {
+        "eh_vip[comum]": lambda: mod_org_cargos.eh_vip(comum),
+        "eh_vip[vip]": lambda: mod_org_cargos.eh_vip(vip),
+        "eh_vip_musica[comum]": lambda: mod_org_cargos.eh_vip_musica(comum),
+        "eh_super_vip[comum]": lambda: mod_org_cargos.eh_super_vip(comum),
+        "_is_admin_or_staff[comum]": lambda: mod_tickets._is_admin_or_staff(comum),
+        "_is_admin_or_staff[staff]": lambda: mod_tickets._is_admin_or_staff(staff),
+        "_tem_permissao[comum]": lambda: mod_painel_admin._tem_permissao(inter_comum),
+        "parse_duration[utilitarios]": lambda: comandos_utilitarios.parse_duration("1d2h30m15s"),
+        "parse_duration[sorteio]": lambda: mod_sorteio.parse_duration("1d2h30m15s"),
+        "overwrites_ticket[250 cargos]": lambda: mod_tickets._overwrites_ticket(guild, comum),
+        "overwrites_lock[privar]": lambda: mod_tickets._overwrites_lock(canal, True),
+        "sortear_vencedores[10k]": lambda: mod_sorteio.sortear_vencedores(participantes, 3),
+    }
+
+
+# ---------- medição ----------
+
+def _referencia():
+    total = 0
+    for i in range(1000):
+        total += i * i
+    return total
+
+
+def _por_chamada(timer: timeit.Timer, numero: int) -> float:
+    return timer.timeit(numero) / numero
+
+
+def medir(funcao: Callable[[], object], referencia: timeit.Timer, n_referencia: int) -> Tuple[float, float]:
+    """
+    (ns por chamada, razão pela referência). Em cada rodada a referência e o
+    caso são medidos um logo após o outro e viram uma razão — uma rajada de
+    carga na máquina atinge os dois lados —, e vale a mediana das REPETICOES
+    razões, que rodadas atípicas não movem.
+    """
+    timer = timeit.Timer(funcao)
+    numero, _ = timer.autorange()
+    numero = max(1, numero // FRACAO_RODADA)
+    casos, razoes = [], []
+    for _ in range(REPETICOES):
+        ref = _por_chamada(referencia, n_referencia)
+        caso = _por_chamada(timer, numero)
+        casos.append(caso)
+        razoes.append(caso / ref)
+    return statistics.median(casos) * 1e9, statistics.median(razoes)
+
+
+def rodar(filtro: List[str]) -> Tuple[Dict[str, Callable[[], object]], Callable, Dict[str, Tuple[float, float]]]:
+    casos = _casos(montar_servidor())
+    if filtro:
+        casos = {n: f for n, f in casos.items() if any(p in n for p in filtro)}
+    referencia = timeit.Timer(_referencia)
+    n_referencia, _ = referencia.autorange()
+    n_referencia = max(1, n_referencia // FRACAO_RODADA)
+
+    def medir_caso(nome: str) -> Tuple[float, float]:
+        return medir(casos[nome], referencia, n_referencia)
+
+    return casos, medir_caso, {nome: medir_caso(nome) for nome in casos}
+
+
+def medir_em_processos(casos: str, passadas: int) -> Dict[str, Tuple[float, float]]:
+    """Mediana de (ns, relativo) de cada caso medido em `passadas` processos separados."""
+    amostras: Dict[str, List[Tuple[float, float]]] = {}
+    for i in range(passadas):
+        print(f"⏳ Passada {i + 1}/{passadas}...", flush=True)
+        saida = subprocess.run([sys.executable, os.path.abspath(__file__), "--json", "--casos", casos],
+                               capture_output=True, text=True, check=True).stdout
+        for nome, (ns, relativo) in json.loads(saida.strip().splitlines()[-1]).items():
+            amostras.setdefault(nome, []).append((ns, relativo))
+    return {nome: (statistics.median(a[0] for a in v), statistics.median(a[1] for a in v))
+            for nome, v in amostras.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--salvar", action="store_true", help="grava os resultados como nova linha de base")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA_PADRAO,
+                        help="quanto mais lento que a base é aceito (0.25 = 25%%)")
+    parser.add_argument("--casos", default="", help="só os casos cujo nome contém um destes termos")
+    parser.add_argument("--base", default=ARQUIVO_BASE)
+    parser.add_argument("--passadas", type=int, default=PASSADAS_BASE,
+                        help="processos medidos para a linha de base (vale a mediana)")
+    parser.add_argument("--json", action="store_true", help=argparse.SUPPRESS)   # uma passada do --salvar
+    args = parser.parse_args()
+
+    filtro = [c for c in args.casos.split(",") if c]
+    if args.json:
+        print(json.dumps(rodar(filtro)[2]))
+        return
+    if args.salvar:
+        resultados = medir_em_processos(args.casos, max(1, args.passadas))
+    else:
+        _, medir_caso, resultados = rodar(filtro)
+    base = {}
+    if os.path.exists(args.base):
+        with open(args.base, "r", encoding="utf-8") as f:
+            base = json.load(f)
+
+    regressoes = []
+    print(f"{'caso':<32} {'ns/chamada':>12} {'relativo':>9} {'base':>9} {'variação':>9}")
+    for nome, (ns, relativo) in resultados.items():
+        anterior = base.get("casos", {}).get(nome)
+        if anterior is None:
+            print(f"{nome:<32} {ns:>12,.0f} {relativo:>9.4f} {'—':>9} {'novo':>9}")
+            continue
+        variacao = relativo / anterior - 1
+        marca = ""
+
+        if variacao > args.tolerancia and not args.salvar:
+            # Confirma antes de acusar: uma rajada de carga não se repete duas vezes seguidas
+            ns2, relativo2 = medir_caso(nome)
+            if relativo2 < relativo:
+                ns, relativo = ns2, relativo2
+                variacao = relativo / anterior - 1
+            if variacao > args.tolerancia:
+                regressoes.append(nome)
+                marca = "  ❌ regressão"
+        print(f"{nome:<32} {ns:>12,.0f} {relativo:>9.4f} {anterior:>9.4f} {variacao:>+8.0%}{marca}")
+
+    if args.salvar:
+        casos = dict(base.get("casos", {}))
+        casos.update({nome: round(relativo, 6) for nome, (_, relativo) in resultados.items()})
+        with open(args.base, "w", encoding="utf-8") as f:
+            json.dump({"unidade": "ns por chamada / ns do laço de referência", "casos": casos},
+                      f, ensure_ascii=False, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\n💾 Linha de base salva em {os.path.relpath(args.base, RAIZ)}")
+        return
+
+    if regressoes:
+        print(f"\n❌ {len(regressoes)} caso(s) acima da tolerância de {args.tolerancia:.0%}: "
+              f"{', '.join(regressoes)}")
+        sys.exit(1)
+    print(f"\n✅ Nenhuma regressão acima de {args.tolerancia:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# cache_membros.py
+import asyncio
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import discord
+
+import config
+
+# Política de cache de membros (config.CACHE_MEMBROS):
+#   completo    → todos os membros em memória, chunking de todos os servidores no login (comportamento antigo)
+#   sob_demanda → todos em cache, mas o chunking de um servidor só acontece no primeiro recurso que precisa da lista
+#   minimo      → só membros em call; buscas pontuais por ID vão ao gateway/API sem guardar o servidor inteiro
+POLITICAS = ("completo", "sob_demanda", "minimo")
+
+QUERY_MAX_IDS = 100   # limite do Discord por pedido de membros por ID no gateway
+
+_chunks: Dict[int, asyncio.Task] = {}
+_intents_membros = True   # sem o intent de membros não há chunking: tudo vira "minimo"
+
+
+def politica() -> str:
+    if not _intents_membros:
+        return "minimo"
+    return config.CACHE_MEMBROS if config.CACHE_MEMBROS in POLITICAS else "sob_demanda"
+
+
+def opcoes_bot(nome: Optional[str] = None, intents: Optional[discord.Intents] = None) -> dict:
+    """member_cache_flags / chunk_guilds_at_startup para o construtor do bot."""
+    global _intents_membros
+    if intents is not None:
+        _intents_membros = intents.members
+    nome = nome or politica()
+    if nome == "minimo":
+        # MemberCacheFlags(voice=True) parte de todas ligadas (= all()); aqui só voice
+        flags = discord.MemberCacheFlags.none()
+        flags.voice = True
+    else:
+        flags = discord.MemberCacheFlags.all()
+    if intents is not None:
+        # Flags sem o intent correspondente são recusadas pelo discord.py
+        flags = flags & discord.MemberCacheFlags.from_intents(intents)
+    return {"member_cache_flags": flags, "chunk_guilds_at_startup": nome == "completo"}
+
+
+async def garantir_membros(guild: discord.Guild):
+    """Faz o chunking do servidor uma única vez (sob_demanda). Nas outras políticas não faz nada."""
+    if politica() != "sob_demanda" or guild.chunked:
+        return
+    # Single-flight: vários sorteios encerrando juntos pedem um só chunk
+    tarefa = _chunks.get(guild.id)
+    if tarefa is None:
+        tarefa = asyncio.create_task(guild.chunk(cache=True), name=f"lzim-chunk-{guild.id}")
+        _chunks[guild.id] = tarefa
+        tarefa.add_done_callback(lambda _t, gid=guild.id: _chunks.pop(gid, None))
+    try:
+        await asyncio.shield(tarefa)
+    except Exception as e:
+        print(f"[CacheMembros] Falha no chunk de {guild.name}: {e}")
+
+
+async def obter_membro(guild: discord.Guild, user_id: int) -> Optional[discord.Member]:
+    """Membro pelo ID: cache primeiro, depois a API (None se não estiver no servidor)."""
+    membro = guild.get_member(user_id)
+    if membro is not None:
+        return membro
+    try:
+        return await guild.fetch_member(user_id)
+    except discord.NotFound:
+        return None
+
+
+async def obter_membros(guild: discord.Guild, ids: Iterable[int]) -> List[discord.Member]:
+    """Vários membros por ID; os que faltam no cache vêm do gateway em lotes de 100."""
+    encontrados: List[discord.Member] = []
+    faltando: List[int] = []
+    for uid in ids:
+        membro = guild.get_member(uid)
+        if membro is not None:
+            encontrados.append(membro)
+        else:
+            faltando.append(uid)
+
+    for i in range(0, len(faltando), QUERY_MAX_IDS):
+        lote = faltando[i:i + QUERY_MAX_IDS]
+        try:
+            encontrados.extend(await guild.query_members(user_ids=lote, limit=len(lote), cache=politica() != "minimo"))
+        except (asyncio.TimeoutError, discord.ClientException) as e:
+            print(f"[CacheMembros] Falha ao buscar {len(lote)} membros em {guild.name}: {e}")
+    return encontrados
+
+
+def resumo(bot) -> Tuple[int, int, int]:
+    """(servidores, servidores com chunk completo, membros em cache)"""
+    guilds = bot.guilds
+    return len(guilds), sum(1 for g in guilds if g.chunked), sum(len(g.members) for g in guilds)
@@ -0,0 +1,115 @@
+# cluster.py
+"""
+Modo cluster: `python cluster.py` sobe CLUSTER_PROCESSOS processos do bot
+(main.py), cada um com uma faixa contígua de shards, e reinicia quem cair.
+Argumentos extras (ex.: --force-sync) são repassados ao processo 0.
+"""
+import asyncio
+import os
+import secrets
+import signal
+import sys
+import time
+from typing import List, Optional, Tuple
+
+import aiohttp
+from dotenv import load_dotenv
+
+load_dotenv()
+
+import config
+import cluster_ipc
+
+REINICIO_MAX_SEG = 60        # espera máxima entre reinícios de um processo que cai em loop
+EXECUCAO_ESTAVEL_SEG = 120   # rodou mais que isso: zera o contador de quedas
+
+
+async def shard_count_recomendado(token: str) -> int:
+    url = f"{config.DISCORD_API_BASE}/gateway/bot"
+    async with aiohttp.ClientSession() as session:
+        async with session.get(url, headers={"Authorization": f"Bot {token}"}) as resp:
+            resp.raise_for_status()
+            dados = await resp.json()
+    return int(dados["shards"])
+
+
+def dividir_shards(shard_count: int, processos: int) -> List[Tuple[int, int]]:
+    processos = max(1, min(processos, shard_count))
+    base, resto = divmod(shard_count, processos)
+    faixas, ini = [], 0
+    for i in range(processos):
+        qtd = base + (1 if i < resto else 0)
+        faixas.append((ini, ini + qtd - 1))
+        ini += qtd
+    return faixas
+
+
+class Supervisor:
+    def __init__(self, shard_count: int, faixas: List[Tuple[int, int]], extras: List[str]):
+        self.shard_count = shard_count
+        self.faixas = faixas
+        self.extras = extras
+        self.token_ipc = secrets.token_hex(16)
+        self._processos: List[Optional[asyncio.subprocess.Process]] = [None] * len(faixas)
+        self._parando = asyncio.Event()
+
+    def _ambiente(self, cluster_id: int) -> dict:
+        env = dict(os.environ)
+        env[cluster_ipc.ENV_CLUSTER_ID] = str(cluster_id)
+        env[cluster_ipc.ENV_SHARD_COUNT] = str(self.shard_count)
+        env[cluster_ipc.ENV_FAIXAS] = cluster_ipc.faixas_para_texto(self.faixas)
+        env[cluster_ipc.ENV_PORTA_BASE] = str(config.IPC_PORTA_BASE)
+        env[cluster_ipc.ENV_TOKEN] = self.token_ipc
+        return env
+
+    async def _manter(self, cluster_id: int):
+        quedas = 0
+        ini, fim = self.faixas[cluster_id]
+        argv = [sys.executable, "main.py"] + (self.extras if cluster_id == 0 else [])
+        while not self._parando.is_set():
+            inicio = time.monotonic()
+            proc = await asyncio.create_subprocess_exec(*argv, env=self._ambiente(cluster_id))
+            self._processos[cluster_id] = proc
+            print(f"🚀 [Cluster] Processo {cluster_id} (shards {ini}-{fim}) iniciado, pid {proc.pid}")
+            codigo = await proc.wait()
+            self._processos[cluster_id] = None
+            if self._parando.is_set():
+                break
+
+            quedas = 0 if time.monotonic() - inicio > EXECUCAO_ESTAVEL_SEG else quedas + 1
+            espera = min(REINICIO_MAX_SEG, 2 ** quedas)
+            print(f"⚠️ [Cluster] Processo {cluster_id} saiu (código {codigo}); reiniciando em {espera}s")
+            try:
+                await asyncio.wait_for(self._parando.wait(), timeout=espera)
+            except asyncio.TimeoutError:
+                pass
+
+    async def parar(self):
+        self._parando.set()
+        for proc in self._processos:
+            if proc and proc.returncode is None:
+                proc.terminate()
+
+    async def executar(self):
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, lambda: asyncio.create_task(self.parar()))
+            except NotImplementedError:
+                pass  # Windows: Ctrl+C cai no KeyboardInterrupt
+        await asyncio.gather(*(self._manter(i) for i in range(len(self.faixas))))
+
+
+async def principal():
+    token = config.DISCORD_TOKEN.strip()
+    if not token:
+        raise SystemExit("❌ DISCORD_TOKEN não encontrado! Coloque no arquivo .env.")
+
+    shard_count = config.SHARD_COUNT or await shard_count_recomendado(token)
+    faixas = dividir_shards(shard_count, config.CLUSTER_PROCESSOS)
+    print(f"🧩 [Cluster] {shard_count} shards em {len(faixas)} processos: {cluster_ipc.faixas_para_texto(faixas)}")
+    await Supervisor(shard_count, faixas, sys.argv[1:]).executar()
+
+
+if __name__ == "__main__":
+    asyncio.run(principal())
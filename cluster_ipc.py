@@ -0,0 +1,160 @@
+# cluster_ipc.py
+import asyncio
+import hmac
+import os
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import aiohttp
+from aiohttp import web
+
+IPC_HOST = "127.0.0.1"
+
+# Variáveis de ambiente preenchidas pelo supervisor (cluster.py) para cada processo
+ENV_CLUSTER_ID = "LZIM_CLUSTER_ID"
+ENV_SHARD_COUNT = "LZIM_SHARD_COUNT"
+ENV_FAIXAS = "LZIM_CLUSTER_FAIXAS"      # "0-3;4-7;8-11": shards de cada processo
+ENV_PORTA_BASE = "LZIM_IPC_PORTA_BASE"  # processo N escuta em porta_base + N
+ENV_TOKEN = "LZIM_IPC_TOKEN"            # segredo compartilhado só entre os processos do cluster
+
+Handler = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+def shard_do_guild(guild_id: int, shard_count: int) -> int:
+    # Fórmula do Discord para saber em qual shard um servidor está
+    return (guild_id >> 22) % shard_count
+
+
+def faixas_para_texto(faixas: List[Tuple[int, int]]) -> str:
+    return ";".join(f"{ini}-{fim}" for ini, fim in faixas)
+
+
+def faixas_de_texto(texto: str) -> List[Tuple[int, int]]:
+    faixas = []
+    for parte in texto.split(";"):
+        ini, fim = parte.split("-")
+        faixas.append((int(ini), int(fim)))
+    return faixas
+
+
+class GuildRemota:
+    """Só o necessário (id e nome) de um servidor que vive em outro processo."""
+    __slots__ = ("id", "name")
+
+    def __init__(self, id: int, name: str):
+        self.id = id
+        self.name = name
+
+
+class ClusterIPC:
+    """
+    Comunicação entre os processos do cluster: cada processo expõe um
+    pequeno servidor HTTP em 127.0.0.1 e chama rotas registradas pelos
+    outros (ex.: "logs_central" no processo que tem o servidor central).
+    Fora do modo cluster nada é iniciado e `ativo` é False.
+    """
+    def __init__(self):
+        self.cluster_id: Optional[int] = None
+        self.shard_count = 1
+        self.faixas: List[Tuple[int, int]] = []
+        self.porta_base = 0
+        self._token = ""
+        self._rotas: Dict[str, Handler] = {}
+        self._runner: Optional[web.AppRunner] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.stats = {"enviadas": 0, "recebidas": 0, "falhas": 0}
+
+    @property
+    def ativo(self) -> bool:
+        return self.cluster_id is not None
+
+    def configurar_pelo_ambiente(self):
+        if not os.getenv(ENV_CLUSTER_ID):
+            return
+        self.cluster_id = int(os.environ[ENV_CLUSTER_ID])
+        self.shard_count = int(os.environ[ENV_SHARD_COUNT])
+        self.faixas = faixas_de_texto(os.environ[ENV_FAIXAS])
+        self.porta_base = int(os.environ[ENV_PORTA_BASE])
+        self._token = os.environ.get(ENV_TOKEN, "")
+
+    def argumentos_bot(self) -> Dict[str, Any]:
+        """shard_ids/shard_count deste processo (vazio fora do cluster)."""
+        if not self.ativo:
+            return {}
+        ini, fim = self.faixas[self.cluster_id]
+        return {"shard_ids": list(range(ini, fim + 1)), "shard_count": self.shard_count}
+
+    @property
+    def principal(self) -> bool:
+        # Tarefas únicas do bot inteiro (ex.: sync de comandos) ficam no processo 0
+        return not self.ativo or self.cluster_id == 0
+
+    def cluster_do_guild(self, guild_id: int) -> int:
+        shard = shard_do_guild(guild_id, self.shard_count)
+        for i, (ini, fim) in enumerate(self.faixas):
+            if ini <= shard <= fim:
+                return i
+        raise ValueError(f"Shard {shard} fora das faixas do cluster")
+
+    def local(self, guild_id: int) -> bool:
+        return not self.ativo or self.cluster_do_guild(guild_id) == self.cluster_id
+
+    # ---------- servidor ----------
+    def registrar_rota(self, nome: str, handler: Handler):
+        # Recarregar um módulo só troca o handler
+        self._rotas[nome] = handler
+
+    async def iniciar(self):
+        if not self.ativo or self._runner is not None:
+            return
+        app = web.Application(client_max_size=32 * 1024 * 1024)
+        app.router.add_post("/ipc/{rota}", self._receber)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, IPC_HOST, self.porta_base + self.cluster_id)
+        await site.start()
+        print(f"🔗 IPC do cluster {self.cluster_id} em {IPC_HOST}:{self.porta_base + self.cluster_id}")
+
+    async def _receber(self, request: web.Request) -> web.Response:
+        if not hmac.compare_digest(request.headers.get("Authorization", ""), self._token):
+            return web.json_response({"erro": "não autorizado"}, status=401)
+        handler = self._rotas.get(request.match_info["rota"])
+        if handler is None:
+            return web.json_response({"erro": "rota desconhecida"}, status=404)
+        self.stats["recebidas"] += 1
+        try:
+            resultado = await handler(await request.json())
+        except Exception as e:
+            print(f"[IPC] Erro na rota {request.match_info['rota']}: {e}")
+            return web.json_response({"erro": str(e)}, status=500)
+        return web.json_response({"resultado": resultado})
+
+    # ---------- cliente ----------
+    def _sessao(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
+        return self._session
+
+    async def chamar(self, cluster_id: int, rota: str, dados: Dict[str, Any]) -> Any:
+        """Chama uma rota em outro processo. Erros (processo caído, 4xx/5xx) sobem."""
+        url = f"http://{IPC_HOST}:{self.porta_base + cluster_id}/ipc/{rota}"
+        try:
+            async with self._sessao().post(url, json=dados, headers={"Authorization": self._token}) as resp:
+                corpo = await resp.json()
+                if resp.status != 200:
+                    raise RuntimeError(f"cluster {cluster_id}/{rota}: {resp.status} {corpo.get('erro')}")
+        except Exception:
+            self.stats["falhas"] += 1
+            raise
+        self.stats["enviadas"] += 1
+        return corpo.get("resultado")
+
+    async def encerrar(self):
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+ipc = ClusterIPC()
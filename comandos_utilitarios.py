@@ -1,4 +1,5 @@
 # comandos_utilitarios.py
+import io
 import re
 import random
 import asyncio
@@ -11,6 +12,7 @@ from discord.ext import commands
 
 import pytz
 import config
+from modulos import MODULOS, registro
 
 br = pytz.timezone(config.TIMEZONE_BR)
 
@@ -172,26 +174,110 @@ async def setup_comandos_utilitarios(bot: commands.Bot):
             return await interaction.response.send_message(
                 "🚫 Apenas administradores.", ephemeral=True)
         await interaction.response.defer(ephemeral=True)
-        import config
+        from sync_comandos import sincronizar
         try:
-            if getattr(config, "GUILD_ID", None):
-                synced = await interaction.client.tree.sync(
-                    guild=discord.Object(id=config.GUILD_ID))
-                await interaction.followup.send(
-                    f"✅ Sync (guild): {len(synced)} comandos.", ephemeral=True)
-            else:
-                synced = await interaction.client.tree.sync()
-                await interaction.followup.send(
-                    f"✅ Sync (global): {len(synced)} comandos.",
-                    ephemeral=True)
+            quantidade = await sincronizar(interaction.client, forcar=True)
+            escopo = "guild" if config.GUILD_ID else "global"
+            await interaction.followup.send(
+                f"✅ Sync ({escopo}): {quantidade} comandos.", ephemeral=True)
         except Exception as e:
             await interaction.followup.send(f"❌ Falha no sync: {e}",
                                             ephemeral=True)
 
+    @tree.command(name="recarregar",
+                  description="(dono) recarrega um módulo do bot sem reiniciar.")
+    @app_commands.describe(modulo="Módulo a recarregar")
+    @app_commands.choices(modulo=[
+        app_commands.Choice(name=m.nome, value=m.nome) for m in MODULOS
+    ])
+    async def recarregar_cmd(interaction: discord.Interaction,
+                             modulo: app_commands.Choice[str]):
+        if not await interaction.client.is_owner(interaction.user):
+            return await interaction.response.send_message(
+                "🚫 Apenas o dono do bot.", ephemeral=True)
+        await interaction.response.defer(ephemeral=True)
+        from sync_comandos import sincronizar
+        try:
+            await registro.recarregar(interaction.client, modulo.value)
+        except Exception as e:
+            print(f"[Módulos] Falha ao recarregar {modulo.value}: {e!r}")
+            return await interaction.followup.send(
+                f"❌ Falha ao recarregar `{modulo.value}`: {e}", ephemeral=True)
+        tempos = registro.tempos[modulo.value]
+        msg = (f"♻️ `{modulo.value}` recarregado "
+               f"({(tempos['import'] + tempos['setup']) * 1000:.0f}ms).")
+        try:
+            if await sincronizar(interaction.client) is not None:
+                msg += "\n✅ Comandos alterados: sync feito."
+        except Exception as e:
+            msg += f"\n⚠️ Falha no sync: {e}"
+        await interaction.followup.send(msg, ephemeral=True)
+
+    @tree.command(name="debug_travamentos",
+                  description="(dono) piores travamentos do event loop, com a pilha.")
+    @app_commands.describe(limpar="Zerar os registros depois de mostrar")
+    async def debug_travamentos_cmd(interaction: discord.Interaction,
+                                    limpar: bool = False):
+        if not await interaction.client.is_owner(interaction.user):
+            return await interaction.response.send_message(
+                "🚫 Apenas o dono do bot.", ephemeral=True)
+        from vigia_loop import vigia
+        piores = vigia.piores(10)
+        if not piores:
+            return await interaction.response.send_message(
+                f"✅ Nenhum travamento acima de {vigia.limiar_seg * 1000:.0f}ms "
+                f"(pior atraso visto: {vigia.pior_atraso_seg * 1000:.0f}ms).",
+                ephemeral=True)
+
+        linhas = [f"🐢 Travamentos acima de {vigia.limiar_seg * 1000:.0f}ms:"]
+        detalhes = []
+        for i, r in enumerate(piores, 1):
+            linhas.append(f"`{i}.` **{r.pior_seg * 1000:.0f}ms** ×{r.ocorrencias} "
+                          f"— `{r.origem}`\n      {r.handler}")
+            detalhes.append(
+                f"#{i} pior {r.pior_seg * 1000:.0f}ms | {r.ocorrencias} vezes | "
+                f"total {r.total_seg * 1000:.0f}ms\n"
+                f"handler: {r.handler}\norigem:  {r.origem}\n{r.pilha}")
+        arquivo = discord.File(
+            io.BytesIO("\n\n".join(detalhes).encode("utf-8")),
+            filename="travamentos.txt")
+        if limpar:
+            vigia.limpar()
+        await interaction.response.send_message(
+            "\n".join(linhas)[:1900], file=arquivo, ephemeral=True)
+
+    @tree.command(name="debug_profile",
+                  description="(dono) perfil de CPU ou memória do bot por alguns segundos.")
+    @app_commands.describe(segundos="Duração da coleta (1 a 60)",
+                           modo="cpu (amostragem) ou mem (tracemalloc)")
+    @app_commands.choices(modo=[
+        app_commands.Choice(name="cpu", value="cpu"),
+        app_commands.Choice(name="mem", value="mem"),
+    ])
+    async def debug_profile_cmd(interaction: discord.Interaction,
+                                segundos: app_commands.Range[int, 1, 60],
+                                modo: app_commands.Choice[str]):
+        if not await interaction.client.is_owner(interaction.user):
+            return await interaction.response.send_message(
+                "🚫 Apenas o dono do bot.", ephemeral=True)
+        import perfilador
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        try:
+            texto = await perfilador.perfilar(modo.value, segundos)
+        except RuntimeError as e:
+            return await interaction.followup.send(f"⚠️ Não iniciado: {e}.",
+                                                   ephemeral=True)
+        arquivo = discord.File(io.BytesIO(texto.encode("utf-8")),
+                               filename=f"perfil_{modo.value}.txt")
+        resumo = "\n".join(texto.splitlines()[:2])
+        await interaction.followup.send(f"📊 ```\n{resumo}\n```",
+                                        file=arquivo, ephemeral=True)
+
     @tree.command(name="calc", description="Calculadora rápida (+ - * /).")
     @app_commands.describe(expr="Ex.: (2+2)*5")
     async def calc(interaction: discord.Interaction, expr: str):
-        if not SAFE_CALC.match(expr):
+        # "**" não está na lista: 9**9**9 travaria o loop do bot inteiro
+        if not SAFE_CALC.match(expr) or "**" in expr:
             await interaction.response.send_message(
                 "❌ Expressão inválida. Use apenas números e + - * / ( ) . ,",
                 ephemeral=True)
@@ -12,6 +12,41 @@ CENTRAL_LOGS_ROLE_ID = 1437103386016350340
 CATEGORIA_LOGS_CENTRAL = "logs-lzim-bot"
 NOME_CANAL_LOG_OPCIONAL = "📜logs-lzim"
 
+# Entrega dos logs: "canal" (channel.send do bot) ou "webhook" (um webhook por canal de log)
+LOGS_ENTREGA = os.getenv("LOGS_ENTREGA", "canal").strip().lower()
+
+# Rajadas: acima de LIMIAR eventos da mesma ação em JANELA segundos, os logs viram um resumo por janela (0 desliga)
+LOGS_RAJADA_LIMIAR = int(os.getenv("LOGS_RAJADA_LIMIAR", "20"))
+LOGS_RAJADA_JANELA_SEG = int(os.getenv("LOGS_RAJADA_JANELA_SEG", "60"))
+
+# Base da API do Discord (trocar aponta o bot para um servidor local de testes)
+DISCORD_API_BASE = os.getenv("DISCORD_API_BASE", "https://discord.com/api/v10").rstrip("/")
+
+# Módulos que não devem ser carregados, separados por vírgula (ex.: "mod_musica,mod_sorteio")
+MODULOS_DESATIVADOS = {m.strip() for m in os.getenv("MODULOS_DESATIVADOS", "").split(",") if m.strip()}
+
+# Intents: calculados a partir dos módulos ativos (modulos.py); aqui só os extras forçados, separados por vírgula
+INTENTS_EXTRAS = {i.strip() for i in os.getenv("INTENTS_EXTRAS", "").split(",") if i.strip()}
+
+# Volume de eventos recebidos do gateway: relatório no console a cada N minutos (0 desliga)
+GATEWAY_RELATORIO_MIN = int(os.getenv("GATEWAY_RELATORIO_MIN", "60"))
+
+# Cache de membros: "completo" (tudo no login), "sob_demanda" (chunk no 1º uso) ou "minimo" (só quem está em call)
+CACHE_MEMBROS = os.getenv("CACHE_MEMBROS", "sob_demanda").strip().lower()
+
+# Métricas Prometheus em http://METRICAS_HOST:METRICAS_PORTA/metrics (0 desliga; no cluster soma o nº do processo)
+METRICAS_PORTA = int(os.getenv("METRICAS_PORTA", "0"))
+METRICAS_HOST = os.getenv("METRICAS_HOST", "127.0.0.1")
+
+# Vigia do event loop: registra a pilha quando o loop fica travado por mais de N ms (0 desliga)
+VIGIA_LOOP_LIMIAR_MS = int(os.getenv("VIGIA_LOOP_LIMIAR_MS", "500"))
+
+# Modo cluster (python cluster.py): processos do bot, shards no total (0 = recomendado pelo Discord)
+# e porta base do IPC local (processo N escuta em IPC_PORTA_BASE + N)
+CLUSTER_PROCESSOS = int(os.getenv("CLUSTER_PROCESSOS", "2"))
+SHARD_COUNT = int(os.getenv("SHARD_COUNT", "0"))
+IPC_PORTA_BASE = int(os.getenv("IPC_PORTA_BASE", "47100"))
+
 CARGO_MEMBRO = "Membro"
 CANAL_BOAS_VINDAS = "📖bate-papo"
 
@@ -0,0 +1,224 @@
+# config_servidores.py
+import asyncio
+import json
+import os
+import tempfile
+from typing import Any, Dict, Optional, Set, Tuple
+
+try:
+    import fcntl  # trava entre processos (modo cluster); não existe no Windows
+except ImportError:
+    fcntl = None
+
+CONFIG_SERVIDORES_FILE = "guild_settings.json"
+
+# Arquivos antigos: migrados na primeira carga, se o arquivo novo ainda não existir
+LEGADO_LOGS_FILE = "logs_config.json"
+LEGADO_LOGS_CENTRAL_FILE = "logs_central.json"
+
+SALVAR_APOS_SEG = 1.0  # write-behind: agrupa alterações próximas em uma gravação
+
+_REMOVIDO = object()
+
+# Chaves cujo valor é um ID de canal (indexadas para busca O(1) pelo canal)
+CHAVES_CANAL = {"logs_canal_id", "logs_central_canal_id", "formulario_destino_id"}
+
+
+class ConfigServidores:
+    """
+    Configurações por servidor (guild_id → {chave: valor}).
+    Carregadas do disco uma vez e servidas da memória; alterações são
+    gravadas em segundo plano (arquivo temporário + rename).
+    No modo cluster vários processos dividem o arquivo: cada gravação relê
+    o disco sob trava e aplica só as chaves alteradas por este processo.
+    """
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+        self._dados: Optional[Dict[int, Dict[str, Any]]] = None
+        self._por_canal: Dict[int, Tuple[int, str]] = {}
+        self._tarefa_salvar: Optional[asyncio.Task] = None
+        self._pendente = False
+        self._sujos: Set[Tuple[int, str]] = set()
+
+    # ---------- carga ----------
+    def carregar(self):
+        dados: Dict[int, Dict[str, Any]] = {}
+        if os.path.exists(self.caminho):
+            with open(self.caminho, "r", encoding="utf-8") as f:
+                dados = {int(gid): valores for gid, valores in json.load(f).items()}
+        else:
+            dados = self._migrar_legado()
+
+        self._dados = dados
+        self._por_canal = {}
+        for gid, valores in dados.items():
+            for chave, valor in valores.items():
+                self._indexar(gid, chave, valor)
+
+        if not os.path.exists(self.caminho) and dados:
+            self._gravar(self._serializar())
+
+    def _migrar_legado(self) -> Dict[int, Dict[str, Any]]:
+        dados: Dict[int, Dict[str, Any]] = {}
+        if os.path.exists(LEGADO_LOGS_FILE):
+            with open(LEGADO_LOGS_FILE, "r", encoding="utf-8") as f:
+                for gid, cfg in json.load(f).items():
+                    valores = dados.setdefault(int(gid), {})
+                    valores["logs_ativado"] = bool(cfg.get("ativado", False))
+                    if cfg.get("canal_id"):
+                        valores["logs_canal_id"] = int(cfg["canal_id"])
+        if os.path.exists(LEGADO_LOGS_CENTRAL_FILE):
+            with open(LEGADO_LOGS_CENTRAL_FILE, "r", encoding="utf-8") as f:
+                for gid, canal_id in json.load(f).items():
+                    dados.setdefault(int(gid), {})["logs_central_canal_id"] = int(canal_id)
+        return dados
+
+    @property
+    def dados(self) -> Dict[int, Dict[str, Any]]:
+        if self._dados is None:
+            self.carregar()
+        return self._dados  # type: ignore[return-value]
+
+    # ---------- leitura ----------
+    def obter(self, guild_id: int, chave: str, padrao: Any = None) -> Any:
+        return self.dados.get(guild_id, {}).get(chave, padrao)
+
+    def canal(self, canal_id: int) -> Optional[Tuple[int, str]]:
+        """(guild_id, chave) da configuração que aponta para este canal, se houver."""
+        if self._dados is None:
+            self.carregar()
+        return self._por_canal.get(canal_id)
+
+    # ---------- escrita ----------
+    def definir(self, guild_id: int, chave: str, valor: Any):
+        valores = self.dados.setdefault(guild_id, {})
+        self._desindexar(valores.get(chave), chave)
+        valores[chave] = valor
+        self._indexar(guild_id, chave, valor)
+        self._sujos.add((guild_id, chave))
+        self.agendar_salvamento()
+
+    def remover(self, guild_id: int, chave: str):
+        valores = self.dados.get(guild_id)
+        if not valores or chave not in valores:
+            return
+        self._desindexar(valores.pop(chave), chave)
+        if not valores:
+            self.dados.pop(guild_id, None)
+        self._sujos.add((guild_id, chave))
+        self.agendar_salvamento()
+
+    def esquecer_canal(self, canal_id: int) -> Optional[Tuple[int, str]]:
+        """Remove a configuração que aponta para um canal apagado."""
+        ref = self.canal(canal_id)
+        if ref:
+            self.remover(*ref)
+        return ref
+
+    def _indexar(self, guild_id: int, chave: str, valor: Any):
+        if chave in CHAVES_CANAL and valor:
+            self._por_canal[int(valor)] = (guild_id, chave)
+
+    def _desindexar(self, valor: Any, chave: str):
+        if chave in CHAVES_CANAL and valor:
+            self._por_canal.pop(int(valor), None)
+
+    # ---------- persistência (write-behind) ----------
+    def _serializar(self) -> str:
+        return json.dumps({str(gid): v for gid, v in self.dados.items()}, indent=2, ensure_ascii=False)
+
+    def _gravar(self, conteudo: str):
+        pasta = os.path.dirname(os.path.abspath(self.caminho))
+        fd, tmp = tempfile.mkstemp(prefix=".guild_settings-", suffix=".tmp", dir=pasta)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(conteudo)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.caminho)
+        except Exception:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+
+    def _alteracoes(self) -> Dict[Tuple[int, str], Any]:
+        # Foto (no loop) do que mudou desde a última gravação
+        alteracoes = {(gid, chave): self.dados.get(gid, {}).get(chave, _REMOVIDO) for gid, chave in self._sujos}
+        self._sujos = set()
+        return alteracoes
+
+    def _mesclar_e_gravar(self, alteracoes: Dict[Tuple[int, str], Any]):
+        trava = open(self.caminho + ".lock", "a") if fcntl else None
+        try:
+            if trava:
+                fcntl.flock(trava, fcntl.LOCK_EX)
+            disco: Dict[str, Dict[str, Any]] = {}
+            if os.path.exists(self.caminho):
+                with open(self.caminho, "r", encoding="utf-8") as f:
+                    disco = json.load(f)
+            for (gid, chave), valor in alteracoes.items():
+                valores = disco.setdefault(str(gid), {})
+                if valor is _REMOVIDO:
+                    valores.pop(chave, None)
+                    if not valores:
+                        disco.pop(str(gid), None)
+                else:
+                    valores[chave] = valor
+            self._gravar(json.dumps(disco, indent=2, ensure_ascii=False))
+        finally:
+            if trava:
+                trava.close()
+
+    def agendar_salvamento(self):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Fora do loop (scripts): grava na hora
+            self._mesclar_e_gravar(self._alteracoes())
+            return
+        self._pendente = True
+        if self._tarefa_salvar is None or self._tarefa_salvar.done():
+            self._tarefa_salvar = loop.create_task(self._salvar_depois(), name="lzim-config-servidores")
+
+    async def _salvar_depois(self):
+        # Alterações feitas durante a gravação disparam mais uma rodada
+        while self._pendente:
+            await asyncio.sleep(SALVAR_APOS_SEG)
+            self._pendente = False
+            alteracoes = self._alteracoes()
+            try:
+                await asyncio.to_thread(self._mesclar_e_gravar, alteracoes)
+            except Exception as e:
+                print(f"[ConfigServidores] Erro ao salvar {self.caminho}: {e}")
+                # Volta para a próxima gravação (nova alteração ou encerrar)
+                self._sujos.update(alteracoes)
+
+    async def salvar_agora(self):
+        """
+        Grava imediatamente o que estiver pendente (ex.: antes de uma operação
+        que depende do dado em disco). Se a gravação falhar, as alterações
+        voltam para a fila e o erro sobe.
+        """
+        # Espera a rodada em andamento em vez de cancelar: a gravação dela pode
+        # já estar na thread e, se falhar, é ela que devolve as alterações a _sujos
+        if self._tarefa_salvar and not self._tarefa_salvar.done():
+            await asyncio.shield(self._tarefa_salvar)
+        if self._pendente or self._sujos:
+            self._pendente = False
+            alteracoes = self._alteracoes()
+            try:
+                await asyncio.to_thread(self._mesclar_e_gravar, alteracoes)
+            except Exception:
+                self._sujos.update(alteracoes)
+                raise
+
+    async def encerrar(self):
+        try:
+            await self.salvar_agora()
+        except Exception as e:
+            print(f"[ConfigServidores] Erro ao salvar {self.caminho} no encerramento: {e}")
+
+
+configs = ConfigServidores(CONFIG_SERVIDORES_FILE)
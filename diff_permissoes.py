@@ -0,0 +1,73 @@
+# diff_permissoes.py
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import discord
+
+# Até quantos alvos alterados vale editar um a um (PUT/DELETE por alvo) em vez
+# de reenviar a lista inteira: a edição por alvo não sobrescreve mudanças que
+# outro admin tenha feito nos demais alvos entre a leitura do cache e a escrita.
+MAX_EDICOES_POR_ALVO = 2
+
+# Status devolvidos (mesmos nomes do relatório de execucao_em_massa)
+SEM_MUDANCA = "sem_mudanca"
+ALTERADO = "alterado"
+
+
+class DiffOverwrites(NamedTuple):
+    alterar: Dict[Any, discord.PermissionOverwrite]
+    remover: List[Any]
+
+    @property
+    def vazio(self) -> bool:
+        return not self.alterar and not self.remover
+
+    def __len__(self) -> int:
+        return len(self.alterar) + len(self.remover)
+
+
+def diferenca(channel: discord.abc.GuildChannel, alvo: Dict[Any, discord.PermissionOverwrite]) -> DiffOverwrites:
+    """
+    O que muda para o canal ficar com os overwrites `alvo`, comparando com o
+    estado em cache (sem chamada à API). Alvos são comparados pelo ID, então
+    um membro fora do cache (discord.Object) casa com o Member equivalente.
+    """
+    atuais = {t.id: ow.pair() for t, ow in channel.overwrites.items()}
+    alvo_ids = set()
+    alterar: Dict[Any, discord.PermissionOverwrite] = {}
+    for target, ow in alvo.items():
+        alvo_ids.add(target.id)
+        atual = atuais.get(target.id)
+        if atual is None:
+            if not ow.is_empty():
+                alterar[target] = ow
+        elif atual != ow.pair():
+            alterar[target] = ow
+    remover = [t for t in channel.overwrites if t.id not in alvo_ids]
+    return DiffOverwrites(alterar, remover)
+
+
+def _editavel_por_alvo(target: Any) -> bool:
+    # set_permissions só aceita Role/Member; alvo fora do cache vai na edição completa
+    return isinstance(target, (discord.Role, discord.Member))
+
+
+async def aplicar_overwrites(
+    channel: discord.abc.GuildChannel,
+    alvo: Dict[Any, discord.PermissionOverwrite],
+    reason: Optional[str] = None,
+) -> str:
+    """
+    Aplica os overwrites só se algo mudou. Devolve SEM_MUDANCA (nenhuma
+    chamada à API) ou ALTERADO; falhas sobem como exceção.
+    """
+    diff = diferenca(channel, alvo)
+    if diff.vazio:
+        return SEM_MUDANCA
+    if len(diff) <= MAX_EDICOES_POR_ALVO and all(map(_editavel_por_alvo, [*diff.alterar, *diff.remover])):
+        for target, ow in diff.alterar.items():
+            await channel.set_permissions(target, overwrite=ow, reason=reason)
+        for target in diff.remover:
+            await channel.set_permissions(target, overwrite=None, reason=reason)
+    else:
+        await channel.edit(overwrites=alvo, reason=reason)
+    return ALTERADO
@@ -0,0 +1,53 @@
+# eventos_gateway.py
+import asyncio
+import time
+from collections import Counter
+from typing import Optional
+
+TOP_RELATORIO = 15
+
+
+class ContadorGateway:
+    """
+    Volume de eventos recebidos do gateway, por tipo (MESSAGE_CREATE,
+    GUILD_MEMBER_UPDATE...), mais o total de bytes já descomprimidos.
+    Alimentado direto do dispatch do bot (sem criar tarefas por evento).
+    """
+    def __init__(self):
+        self.eventos: Counter = Counter()
+        self.bytes_total = 0
+        self.inicio = time.monotonic()
+        self._tarefa: Optional[asyncio.Task] = None
+
+    def evento(self, tipo: str):
+        self.eventos[tipo] += 1
+
+    def recebido(self, tamanho: int):
+        self.bytes_total += tamanho
+
+    def relatorio(self, top: int = TOP_RELATORIO) -> str:
+        minutos = max((time.monotonic() - self.inicio) / 60, 1 / 60)
+        total = sum(self.eventos.values())
+        linhas = [f"📡 Gateway: {total} eventos, {self.bytes_total / 1024 / 1024:.1f} MB em {minutos:.0f} min"]
+        for tipo, qtd in self.eventos.most_common(top):
+            linhas.append(f"   {tipo:<32} {qtd:>9}  ({qtd / minutos:8.1f}/min, {qtd * 100 / total:5.1f}%)")
+        return "\n".join(linhas)
+
+    def iniciar_relatorios(self, intervalo_min: int):
+        if intervalo_min <= 0 or (self._tarefa and not self._tarefa.done()):
+            return
+        self._tarefa = asyncio.create_task(self._ciclo(intervalo_min * 60), name="lzim-gateway-relatorio")
+
+    async def _ciclo(self, intervalo_seg: float):
+        while True:
+            await asyncio.sleep(intervalo_seg)
+            if self.eventos:
+                print(self.relatorio())
+
+    def encerrar(self):
+        if self._tarefa and not self._tarefa.done():
+            self._tarefa.cancel()
+        self._tarefa = None
+
+
+contador_gateway = ContadorGateway()
@@ -0,0 +1,260 @@
+# execucao_em_massa.py
+import asyncio
+import io
+import time
+from collections import Counter
+from typing import Any, Awaitable, Callable, Generic, List, NamedTuple, Optional, TypeVar
+
+import discord
+
+from metricas import metricas
+
+CONCORRENCIA_PADRAO = 5        # pedidos em voo ao mesmo tempo (o discord.py ainda fila por bucket)
+INTERVALO_PROGRESSO_SEG = 2.0  # edição do embed de progresso
+MAX_LINHAS_EMBED = 20          # além disso o relatório por item vai em anexo
+
+# Status que a ação pode devolver (None = "ok"), sozinho ou como (status, detalhe); exceção vira "falha"
+EMOJI_STATUS = {"ok": "✅", "alterado": "✅", "sem_mudanca": "➖", "falha": "❌", "cancelado": "⏹️"}
+
+T = TypeVar("T")
+
+
+class ResultadoItem(NamedTuple):
+    item: Any
+    status: str
+    detalhe: str = ""
+
+
+class ExecucaoEmMassa(Generic[T]):
+    """
+    Aplica uma ação assíncrona a vários itens (canais, membros...) com
+    concorrência limitada e adaptativa: cada 429 visto durante a execução
+    corta a concorrência pela metade, e ela volta a subir de um em um
+    depois de uma sequência de itens sem 429. O discord.py já espera o
+    reset de cada bucket; o limite aqui evita empilhar pedidos no mesmo
+    bucket e estourar o limite global.
+
+    cancelar() não interrompe o que já está em voo (a não ser pelo
+    ao_cancelar, se a ação souber parar no meio): os itens restantes saem
+    como "cancelado".
+    """
+    def __init__(self, itens: List[T], acao: Callable[[T], Awaitable[Any]],
+                 concorrencia: int = CONCORRENCIA_PADRAO, ao_cancelar: Optional[Callable[[], None]] = None):
+        self.itens = list(itens)
+        self.acao = acao
+        self.ao_cancelar = ao_cancelar
+        self.concorrencia = max(1, concorrencia)
+        self.limite = self.concorrencia
+        self.resultados: List[Optional[ResultadoItem]] = [None] * len(self.itens)
+        self.limitados = 0
+        self.cancelado = False
+        self.inicio = 0.0
+        self.fim = 0.0
+        self._fila: asyncio.Queue = asyncio.Queue()
+        self._visto_429 = 0.0
+        self._seguidos_sem_429 = 0
+
+    # ---------- estado ----------
+    @property
+    def feitos(self) -> int:
+        return sum(1 for r in self.resultados if r is not None)
+
+    def contagem(self) -> Counter:
+        return Counter(r.status for r in self.resultados if r is not None)
+
+    @property
+    def duracao(self) -> float:
+        return (self.fim or time.perf_counter()) - self.inicio if self.inicio else 0.0
+
+    def cancelar(self):
+        self.cancelado = True
+        if self.ao_cancelar:
+            self.ao_cancelar()
+
+    # ---------- execução ----------
+    async def executar(self) -> List[ResultadoItem]:
+        self.inicio = time.perf_counter()
+        self._visto_429 = metricas.total_429()
+        for indice in range(len(self.itens)):
+            self._fila.put_nowait(indice)
+        trabalhadores = [asyncio.create_task(self._trabalhador(n)) for n in range(min(self.concorrencia, len(self.itens)))]
+        try:
+            await asyncio.gather(*trabalhadores)
+        finally:
+            for t in trabalhadores:
+                t.cancel()
+            self.fim = time.perf_counter()
+        for indice, resultado in enumerate(self.resultados):
+            if resultado is None:
+                self.resultados[indice] = ResultadoItem(self.itens[indice], "cancelado")
+        return self.resultados  # type: ignore[return-value]
+
+    async def _trabalhador(self, numero: int):
+        while not self.cancelado and not self._fila.empty():
+            if numero >= self.limite:
+                # Concorrência reduzida por 429: este trabalhador espera a vez
+                await asyncio.sleep(0.5)
+                continue
+            indice = self._fila.get_nowait()
+            item = self.itens[indice]
+            try:
+                retorno = await self.acao(item) or "ok"
+                if isinstance(retorno, tuple):
+                    self.resultados[indice] = ResultadoItem(item, *retorno)
+                else:
+                    self.resultados[indice] = ResultadoItem(item, retorno)
+            except Exception as e:
+                self.resultados[indice] = ResultadoItem(item, "falha", str(e)[:200])
+            self._ajustar_limite()
+
+    def _ajustar_limite(self):
+        total = metricas.total_429()
+        if total > self._visto_429:
+            self.limitados += int(total - self._visto_429)
+            self._visto_429 = total
+            self.limite = max(1, self.limite // 2)
+            self._seguidos_sem_429 = 0
+            return
+        self._seguidos_sem_429 += 1
+        if self.limite < self.concorrencia and self._seguidos_sem_429 >= self.limite * 2:
+            self.limite += 1
+            self._seguidos_sem_429 = 0
+
+
+# ---------- progresso e relatório no Discord ----------
+
+def _barra(feitos: int, total: int, largura: int = 20) -> str:
+    cheio = round(largura * feitos / total) if total else largura
+    return "▰" * cheio + "▱" * (largura - cheio)
+
+
+def _resumo(execucao: ExecucaoEmMassa) -> str:
+    contagem = execucao.contagem()
+    partes = [f"{EMOJI_STATUS.get(s, '•')} {s}: **{n}**" for s, n in sorted(contagem.items())]
+    return " • ".join(partes) or "—"
+
+
+def embed_progresso(titulo: str, execucao: ExecucaoEmMassa) -> discord.Embed:
+    total = len(execucao.itens)
+    embed = discord.Embed(title=f"⏳ {titulo}", color=discord.Color.blurple())
+    embed.description = f"{_barra(execucao.feitos, total)} {execucao.feitos}/{total}\n{_resumo(execucao)}"
+    rodape = f"{execucao.duracao:.0f}s • concorrência {execucao.limite}/{execucao.concorrencia}"
+    if execucao.limitados:
+        rodape += f" • {execucao.limitados} rate limit(s)"
+    embed.set_footer(text=rodape)
+    return embed
+
+
+def relatorio_final(titulo: str, execucao: ExecucaoEmMassa, rotulo: Callable[[Any], str],
+                    resumo_extra: Optional[Callable[[], str]] = None) -> "tuple[discord.Embed, Optional[discord.File]]":
+    """Embed com o resumo e a lista por item (em anexo .txt se for longa)."""
+    cancelado = execucao.cancelado and execucao.contagem().get("cancelado")
+    embed = discord.Embed(
+        title=f"{'⏹️' if cancelado else '✅'} {titulo}",
+        color=discord.Color.orange() if cancelado or execucao.contagem().get("falha") else discord.Color.green(),
+    )
+    linhas = [
+        f"{EMOJI_STATUS.get(r.status, '•')} {rotulo(r.item)} — {r.status}" + (f": {r.detalhe}" if r.detalhe else "")
+        for r in execucao.resultados if r is not None
+    ]
+    embed.description = _resumo(execucao) + (f"\n{resumo_extra()}" if resumo_extra else "")
+    arquivo = None
+    if len(linhas) <= MAX_LINHAS_EMBED:
+        embed.add_field(name="Por item", value="\n".join(linhas)[:1024] or "—", inline=False)
+    else:
+        texto = "\n".join(linhas)
+        arquivo = discord.File(io.BytesIO(texto.encode("utf-8")), filename="relatorio.txt")
+        embed.add_field(name="Por item", value=f"{len(linhas)} itens — veja o anexo.", inline=False)
+    embed.set_footer(text=f"{execucao.duracao:.1f}s" + (f" • {execucao.limitados} rate limit(s)" if execucao.limitados else ""))
+    return embed, arquivo
+
+
+class CancelarExecucaoView(discord.ui.View):
+    """Botão de cancelar, só para quem disparou a execução (qualquer objeto com cancelar())."""
+    def __init__(self, autor_id: int, execucao: Any):
+        super().__init__(timeout=None)
+        self.autor_id = autor_id
+        self.execucao = execucao
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.autor_id:
+            await interaction.response.send_message("🚫 Apenas quem iniciou pode cancelar.", ephemeral=True)
+            return False
+        return True
+
+    @discord.ui.button(label="Cancelar", style=discord.ButtonStyle.danger, emoji="⏹️")
+    async def cancelar(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.execucao.cancelar()
+        button.disabled = True
+        button.label = "Cancelando..."
+        await interaction.response.edit_message(view=self)
+
+
+async def acompanhar(
+    interaction: discord.Interaction,
+    cancelavel: Any,
+    trabalho: Awaitable[Any],
+    gerar_embed: Callable[[], discord.Embed],
+    ephemeral: bool = True,
+) -> "tuple[Any, discord.WebhookMessage]":
+    """
+    Mostra o embed de progresso (editado a cada INTERVALO_PROGRESSO_SEG, com
+    botão que chama cancelavel.cancelar()) enquanto o trabalho roda.
+    Devolve (resultado do trabalho, mensagem) para a exibição final.
+    A interação precisa já ter sido deferida.
+    """
+    view = CancelarExecucaoView(interaction.user.id, cancelavel)
+    msg = await interaction.followup.send(embed=gerar_embed(), view=view, ephemeral=ephemeral, wait=True)
+
+    tarefa = asyncio.ensure_future(trabalho)
+    while not tarefa.done():
+        await asyncio.wait({tarefa}, timeout=INTERVALO_PROGRESSO_SEG)
+        if tarefa.done():
+            break
+        try:
+            await msg.edit(embed=gerar_embed(), view=view)
+        except Exception as e:
+            print(f"[ExecucaoEmMassa] Falha ao atualizar progresso: {e}")
+    view.stop()
+    return await tarefa, msg
+
+
+async def mostrar_final(interaction: discord.Interaction, msg: discord.WebhookMessage,
+                        embed: discord.Embed, arquivo: Optional[discord.File] = None):
+    """Troca o progresso pelo resultado (sem o botão)."""
+    try:
+        if arquivo:
+            await msg.edit(embed=embed, view=None, attachments=[arquivo])
+        else:
+            await msg.edit(embed=embed, view=None)
+    except Exception as e:
+        # Token da interação expira em 15 min: o relatório vai como mensagem nova no canal
+        print(f"[ExecucaoEmMassa] Falha ao mostrar relatório: {e}")
+        if interaction.channel:
+            if arquivo:
+                arquivo.reset()
+            await interaction.channel.send(embed=embed, **({"file": arquivo} if arquivo else {}))
+
+
+async def executar_com_progresso(
+    interaction: discord.Interaction,
+    titulo: str,
+    itens: List[T],
+    acao: Callable[[T], Awaitable[Any]],
+    rotulo: Callable[[T], str] = str,
+    concorrencia: int = CONCORRENCIA_PADRAO,
+    ephemeral: bool = True,
+    ao_cancelar: Optional[Callable[[], None]] = None,
+    resumo_extra: Optional[Callable[[], str]] = None,
+) -> ExecucaoEmMassa:
+    """
+    Roda a execução em massa com progresso ao vivo e botão de cancelar, e
+    troca pelo relatório final (resumo_extra acrescenta totais próprios da
+    ação). A interação precisa já ter sido deferida.
+    """
+    execucao = ExecucaoEmMassa(itens, acao, concorrencia, ao_cancelar)
+    _, msg = await acompanhar(interaction, execucao, execucao.executar(),
+                              lambda: embed_progresso(titulo, execucao), ephemeral)
+    embed, arquivo = relatorio_final(titulo, execucao, rotulo, resumo_extra)
+    await mostrar_final(interaction, msg, embed, arquivo)
+    return execucao
@@ -0,0 +1,129 @@
+# indice_cargos.py
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+import discord
+
+from config_servidores import configs
+
+# Classes de cargo usadas nas checagens de permissão. "admin" também inclui
+# qualquer cargo com a permissão Administrador, seja qual for o nome.
+CLASSES = ("admin", "staff", "vip", "vip_musica", "super_vip")
+
+# Nomes padrão de cada classe (comparados sem diferenciar maiúsculas);
+# cada servidor pode trocar a lista de uma classe com /configurar_classes_cargos
+NOMES_PADRAO: Dict[str, FrozenSet[str]] = {
+    "admin": frozenset(),
+    "staff": frozenset({"staff", "moderador", "moderators", "staff team", "admin", "adm"}),
+    "vip": frozenset({"🔥SUPER VIP", "💎VIP DIAMANTE", "🐸VIP SAPO", "💜VIP GALÁTICO", "🪙Vip"}),
+    "vip_musica": frozenset({"🔥SUPER VIP", "💎VIP DIAMANTE", "💜VIP GALÁTICO"}),
+    "super_vip": frozenset({"🔥SUPER VIP"}),
+}
+
+CHAVE_CONFIG = "classes_cargos"   # guild_settings.json: {classe: [nomes]}
+
+
+def _normalizar(nome: str) -> str:
+    return nome.strip().casefold()
+
+
+class IndiceCargos:
+    """
+    Índice por servidor: classe → IDs dos cargos daquela classe.
+    Montado na primeira checagem do servidor e mantido em dia pelos eventos
+    de cargo (criar/editar/apagar), então cada checagem vira uma interseção
+    de conjuntos de IDs em vez de percorrer os cargos comparando nomes.
+    """
+    def __init__(self):
+        self._classes: Dict[int, Dict[str, Set[int]]] = {}
+        self._nomes: Dict[int, Dict[str, FrozenSet[str]]] = {}
+
+    # ---------- nomes por servidor ----------
+    def nomes(self, guild_id: int) -> Dict[str, FrozenSet[str]]:
+        nomes = self._nomes.get(guild_id)
+        if nomes is None:
+            personalizados = configs.obter(guild_id, CHAVE_CONFIG, {}) or {}
+            nomes = {
+                classe: frozenset(_normalizar(n) for n in personalizados.get(classe, NOMES_PADRAO[classe]))
+                for classe in CLASSES
+            }
+            self._nomes[guild_id] = nomes
+        return nomes
+
+    def definir_nomes(self, guild_id: int, classe: str, nomes: Optional[Iterable[str]]):
+        """Troca os nomes de uma classe no servidor (None = volta ao padrão) e refaz o índice."""
+        if classe not in CLASSES:
+            raise ValueError(f"Classe desconhecida: {classe}")
+        personalizados = dict(configs.obter(guild_id, CHAVE_CONFIG, {}) or {})
+        if nomes is None:
+            personalizados.pop(classe, None)
+        else:
+            personalizados[classe] = sorted({n.strip() for n in nomes if n.strip()})
+        if personalizados:
+            configs.definir(guild_id, CHAVE_CONFIG, personalizados)
+        else:
+            configs.remover(guild_id, CHAVE_CONFIG)
+        self.invalidar(guild_id)
+
+    # ---------- índice ----------
+    def _classes_do_cargo(self, role: discord.Role) -> List[str]:
+        nomes = self.nomes(role.guild.id)
+        nome = _normalizar(role.name)
+        classes = [classe for classe in CLASSES if nome in nomes[classe]]
+        if role.permissions.administrator and "admin" not in classes:
+            classes.append("admin")
+        return classes
+
+    def _indice(self, guild: discord.Guild) -> Dict[str, Set[int]]:
+        indice = self._classes.get(guild.id)
+        if indice is None:
+            indice = {classe: set() for classe in CLASSES}
+            for role in guild.roles:
+                for classe in self._classes_do_cargo(role):
+                    indice[classe].add(role.id)
+            self._classes[guild.id] = indice
+        return indice
+
+    def atualizar_cargo(self, role: discord.Role):
+        """Cargo criado ou editado (nome ou permissões podem ter mudado)."""
+        indice = self._classes.get(role.guild.id)
+        if indice is None:
+            return   # servidor ainda não indexado: será montado na primeira checagem
+        for ids in indice.values():
+            ids.discard(role.id)
+        for classe in self._classes_do_cargo(role):
+            indice[classe].add(role.id)
+
+    def remover_cargo(self, role: discord.Role):
+        indice = self._classes.get(role.guild.id)
+        if indice is not None:
+            for ids in indice.values():
+                ids.discard(role.id)
+
+    def invalidar(self, guild_id: int):
+        self._classes.pop(guild_id, None)
+        self._nomes.pop(guild_id, None)
+
+    # ---------- checagens ----------
+    def cargos(self, guild: discord.Guild, *classes: str) -> Set[int]:
+        """IDs dos cargos do servidor que pertencem a alguma das classes."""
+        indice = self._indice(guild)
+        if len(classes) == 1:
+            return indice[classes[0]]
+        return set().union(*(indice[c] for c in classes))
+
+    def cargo_eh(self, role: discord.Role, *classes: str) -> bool:
+        indice = self._indice(role.guild)
+        return any(role.id in indice[c] for c in classes)
+
+    def membro_eh(self, member: discord.Member, *classes: str) -> bool:
+        """O membro tem algum cargo das classes? ("admin" também vale para o dono do servidor)."""
+        guild = member.guild
+        indice = self._indice(guild)
+        if "admin" in classes and (member.id == guild.owner_id or guild.id in indice["admin"]):
+            return True   # dono, ou @everyone com Administrador
+        # _roles: IDs crus do payload, sem montar/ordenar os objetos Role como member.roles faz
+        ids_membro = member._roles
+        return any(not indice[c].isdisjoint(ids_membro) for c in classes)
+
+
+indice_cargos = IndiceCargos()
@@ -0,0 +1,271 @@
+# limpeza.py
+import asyncio
+import re
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Pattern
+
+import discord
+
+from comandos_utilitarios import parse_duration
+
+try:
+    from re import _constants as _sre, _parser as _sre_parse   # Python 3.11+
+except ImportError:
+    import sre_constants as _sre, sre_parse as _sre_parse       # type: ignore[no-redef]
+
+# O Discord só apaga em lote mensagens com menos de 14 dias (margem para o relógio)
+IDADE_MAX_LOTE = timedelta(days=14) - timedelta(minutes=5)
+TAMANHO_LOTE = 100             # limite do bulk delete
+PAUSA_ANTIGAS_SEG = 0.2        # entre deletes individuais, além da espera do bucket (evita rajadas no limite oculto)
+REGEX_MAX = 200                # tamanho máximo do padrão informado pelo usuário
+
+LINK_REGEX = re.compile(r"https?://|discord\.gg/", re.IGNORECASE)
+
+
+def _filhos(op, av) -> list:
+    if op in (_sre.MAX_REPEAT, _sre.MIN_REPEAT):
+        return [av[2]]
+    if op is _sre.SUBPATTERN:
+        return [av[-1]]
+    if op is _sre.BRANCH:
+        return av[1]
+    if op in (_sre.ASSERT, _sre.ASSERT_NOT):
+        return [av[1]]
+    return []
+
+
+def regex_arriscada(padrao: str) -> Optional[str]:
+    """
+    Motivo para recusar um padrão que pode levar a backtracking catastrófico,
+    ou None. O re roda no event loop (e segura o GIL mesmo numa thread), então
+    um padrão como (a+)+$ travaria o bot inteiro. re.error sobe se for inválido.
+    """
+    def visitar(sub, em_repeticao: bool, em_ilimitada: bool) -> Optional[str]:
+        for op, av in sub:
+            if op in (_sre.MAX_REPEAT, _sre.MIN_REPEAT) and av[1] > 1:
+                if em_repeticao:
+                    return "quantificadores aninhados, como (a+)+"
+                motivo = visitar(av[2], True, av[1] == _sre.MAXREPEAT)
+            elif op is _sre.BRANCH and em_ilimitada:
+                return "alternativas dentro de repetição, como (a|ab)*"
+            elif op in (_sre.GROUPREF, _sre.GROUPREF_EXISTS):
+                return "referência a grupo, como \\1"
+            else:
+                motivo = None
+                for filho in _filhos(op, av):
+                    motivo = motivo or visitar(filho, em_repeticao, em_ilimitada)
+            if motivo:
+                return motivo
+        return None
+
+    return visitar(_sre_parse.parse(padrao), False, False)
+
+
+class FiltroLimpeza:
+    """
+    Filtros combináveis (todos precisam bater). Regex, links e anexos leem o
+    conteúdo da mensagem, que o Discord só entrega com o intent message_content.
+    """
+    def __init__(
+        self,
+        autor_id: Optional[int] = None,
+        regex: Optional[str] = None,
+        com_anexo: bool = False,
+        so_bots: bool = False,
+        com_links: bool = False,
+        depois: Optional[datetime] = None,
+        antes: Optional[datetime] = None,
+    ):
+        if regex and len(regex) > REGEX_MAX:
+            raise ValueError(f"regex com mais de {REGEX_MAX} caracteres")
+        motivo = regex_arriscada(regex) if regex else None   # re.error sobe
+        if motivo:
+            raise ValueError(f"regex recusada ({motivo}): pode travar o bot")
+        self.autor_id = autor_id
+        self.regex: Optional[Pattern] = re.compile(regex, re.IGNORECASE) if regex else None  # re.error sobe
+        self.com_anexo = com_anexo
+        self.so_bots = so_bots
+        self.com_links = com_links
+        self.depois = depois
+        self.antes = antes
+
+    @property
+    def precisa_conteudo(self) -> bool:
+        return bool(self.regex or self.com_anexo or self.com_links)
+
+    @property
+    def vazio(self) -> bool:
+        return not (self.autor_id or self.so_bots or self.precisa_conteudo)
+
+    def aceita(self, msg: discord.Message) -> bool:
+        if self.autor_id is not None and msg.author.id != self.autor_id:
+            return False
+        if self.so_bots and not msg.author.bot:
+            return False
+        if self.com_anexo and not msg.attachments:
+            return False
+        if self.com_links and not LINK_REGEX.search(msg.content):
+            return False
+        if self.regex is not None and not self.regex.search(msg.content):
+            return False
+        return True
+
+    def descrever(self) -> str:
+        partes = []
+        if self.autor_id:
+            partes.append(f"autor <@{self.autor_id}>")
+        if self.so_bots:
+            partes.append("só bots")
+        if self.com_anexo:
+            partes.append("com anexo")
+        if self.com_links:
+            partes.append("com links")
+        if self.regex is not None:
+            partes.append(f"regex `{self.regex.pattern}`")
+        if self.depois:
+            partes.append(f"desde <t:{int(self.depois.timestamp())}:f>")
+        if self.antes:
+            partes.append(f"até <t:{int(self.antes.timestamp())}:f>")
+        return ", ".join(partes) or "nenhum"
+
+
+class Limpeza:
+    """
+    Percorre o histórico do canal uma única vez (páginas de 100, do mais novo
+    para o mais antigo), sem guardar as mensagens: as que passam no filtro vão
+    para um lote de até 100, apagado em bulk enquanto a próxima página é
+    buscada. Ao chegar nas mensagens com mais de 14 dias, que o bulk delete
+    recusa, passa para deletes individuais com pausa entre eles.
+    """
+    def __init__(
+        self,
+        canal: discord.abc.Messageable,
+        filtro: FiltroLimpeza,
+        limite_apagar: int,
+        limite_varrer: Optional[int] = None,
+        reason: Optional[str] = None,
+    ):
+        self.canal = canal
+        self.filtro = filtro
+        self.limite_apagar = limite_apagar
+        self.limite_varrer = limite_varrer
+        self.reason = reason
+        self.varridas = 0
+        self.selecionadas = 0
+        self.apagadas = 0
+        self.antigas = 0
+        self.falhas = 0
+        self.cancelado = False
+        self.inicio = 0.0
+        self.fim = 0.0
+        self._lote: List[discord.Message] = []
+        self._apagando: Optional[asyncio.Task] = None
+
+    @property
+    def duracao(self) -> float:
+        return (self.fim or time.perf_counter()) - self.inicio if self.inicio else 0.0
+
+    @property
+    def terminou(self) -> bool:
+        return bool(self.fim)
+
+    def cancelar(self):
+        self.cancelado = True
+
+    async def executar(self) -> "Limpeza":
+        self.inicio = time.perf_counter()
+        try:
+            async for msg in self.canal.history(limit=self.limite_varrer, before=self.filtro.antes,
+                                                 after=self.filtro.depois, oldest_first=False):
+                if self.cancelado or self.selecionadas >= self.limite_apagar:
+                    break
+                self.varridas += 1
+                if not self.filtro.aceita(msg):
+                    continue
+                self.selecionadas += 1
+                # Idade vista agora (varreduras longas atravessam a margem dos 14 dias)
+                if msg.created_at > discord.utils.utcnow() - IDADE_MAX_LOTE:
+                    self._lote.append(msg)
+                    if len(self._lote) >= TAMANHO_LOTE:
+                        await self._enviar_lote()
+                else:
+                    # Daqui em diante (mais antigas) não cabe bulk: esvazia o lote e segue uma a uma
+                    await self._enviar_lote()
+                    await self._apagar_antiga(msg)
+            await self._enviar_lote()
+            if self._apagando is not None:
+                await self._apagando
+        finally:
+            self.fim = time.perf_counter()
+        return self
+
+    async def _enviar_lote(self):
+        # Um lote em voo por vez: enquanto ele é apagado, o history busca a próxima página
+        if self._apagando is not None:
+            await self._apagando
+            self._apagando = None
+        if not self._lote:
+            return
+        lote, self._lote = self._lote, []
+        self._apagando = asyncio.create_task(self._apagar_lote(lote))
+
+    async def _apagar_lote(self, lote: List[discord.Message]):
+        try:
+            if len(lote) == 1:
+                await lote[0].delete()
+            else:
+                await self.canal.delete_messages(lote, reason=self.reason)  # type: ignore[attr-defined]
+            self.apagadas += len(lote)
+        except discord.NotFound:
+            # Alguma já tinha sido apagada: o lote inteiro é recusado, tenta uma a uma
+            for msg in lote:
+                await self._apagar_uma(msg)
+        except Exception as e:
+            print(f"[Limpeza] Falha ao apagar lote de {len(lote)} em {self.canal}: {e}")
+            self.falhas += len(lote)
+
+    async def _apagar_uma(self, msg: discord.Message) -> bool:
+        try:
+            await msg.delete()
+            self.apagadas += 1
+            return True
+        except discord.NotFound:
+            return False
+        except Exception as e:
+            print(f"[Limpeza] Falha ao apagar {msg.id} em {self.canal}: {e}")
+            self.falhas += 1
+            return False
+
+    async def _apagar_antiga(self, msg: discord.Message):
+        if await self._apagar_uma(msg):
+            self.antigas += 1
+        await asyncio.sleep(PAUSA_ANTIGAS_SEG)
+
+    # ---------- exibição ----------
+    def resumo(self) -> str:
+        linhas = [f"🔎 Varridas: **{self.varridas}** • 🧹 Apagadas: **{self.apagadas}**"]
+        if self.antigas:
+            linhas.append(f"🐢 {self.antigas} com mais de 14 dias (apagadas uma a uma)")
+        if self.falhas:
+            linhas.append(f"❌ Falhas: **{self.falhas}**")
+        return "\n".join(linhas)
+
+    def embed(self, titulo: str) -> discord.Embed:
+        if not self.terminou:
+            cor, emoji = discord.Color.blurple(), "⏳"
+        elif self.cancelado:
+            cor, emoji = discord.Color.orange(), "⏹️"
+        else:
+            cor, emoji = (discord.Color.orange(), "⚠️") if self.falhas else (discord.Color.green(), "✅")
+        embed = discord.Embed(title=f"{emoji} {titulo}", description=self.resumo(), color=cor)
+        embed.add_field(name="Filtros", value=self.filtro.descrever()[:1024], inline=False)
+        embed.set_footer(text=f"{self.duracao:.0f}s • até {self.limite_apagar} mensagem(ns)")
+        return embed
+
+
+def periodo(texto: Optional[str]) -> Optional[datetime]:
+    """'2h', '3d', '1d12h' → instante (UTC) de tanto tempo atrás; vazio → None. ValueError se inválido."""
+    if not texto:
+        return None
+    return datetime.now(timezone.utc) - timedelta(seconds=parse_duration(texto))
@@ -0,0 +1,116 @@
+# logs_rajadas.py
+import asyncio
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+import discord
+
+MAX_LINHAS_POR_RESUMO = 5000   # acima disso o resumo só conta os eventos
+
+
+class _Rajada:
+    def __init__(self, guild: discord.Guild, acao: str):
+        self.guild = guild
+        self.acao = acao
+        self.linhas: List[str] = []
+        self.total = 0
+        self.inicio = time.monotonic()
+        self.tarefa: Optional[asyncio.Task] = None
+
+
+class AgregadorRajadas:
+    """
+    Detecta rajadas da mesma ação por servidor (ex.: banimentos em massa).
+    Até o limiar, cada evento vira uma embed normal; passando dele, os eventos
+    são acumulados e sai uma embed de resumo por janela ("Ban ×143 em 60s"),
+    com os detalhes num anexo .txt. Quando o ritmo cai abaixo do limiar,
+    volta ao log evento a evento.
+    """
+    def __init__(self, limiar: int, janela_seg: int, emitir: Callable[[discord.Guild, discord.Embed, Tuple[str, bytes]], None]):
+        self.limiar = limiar
+        self.janela_seg = janela_seg
+        self._emitir = emitir
+        self._recentes: Dict[Tuple[int, str], Deque[float]] = {}
+        self._rajadas: Dict[Tuple[int, str], _Rajada] = {}
+        self.stats = {"rajadas": 0, "eventos_agrupados": 0, "resumos_enviados": 0}
+
+    def em_rajada(self) -> int:
+        return len(self._rajadas)
+
+    def registrar(self, guild: discord.Guild, acao: str, linha: Callable[[], str]) -> bool:
+        """True = enviar o evento normalmente; False = absorvido por um resumo."""
+        if self.limiar <= 0:
+            return True
+        chave = (guild.id, acao)
+
+        rajada = self._rajadas.get(chave)
+        if rajada is not None:
+            self._acumular(rajada, linha)
+            return False
+
+        agora = time.monotonic()
+        recentes = self._recentes.setdefault(chave, deque())
+        recentes.append(agora)
+        while recentes and recentes[0] < agora - self.janela_seg:
+            recentes.popleft()
+        if len(recentes) <= self.limiar:
+            return True
+
+        # Passou do limiar: a partir daqui tudo vai para o resumo
+        self._recentes.pop(chave, None)
+        rajada = _Rajada(guild, acao)
+        self._acumular(rajada, linha)
+        rajada.tarefa = asyncio.create_task(self._ciclo(chave, rajada), name=f"lzim-rajada-{guild.id}")
+        self._rajadas[chave] = rajada
+        self.stats["rajadas"] += 1
+        return False
+
+    def _acumular(self, rajada: _Rajada, linha: Callable[[], str]):
+        rajada.total += 1
+        self.stats["eventos_agrupados"] += 1
+        if len(rajada.linhas) < MAX_LINHAS_POR_RESUMO:
+            rajada.linhas.append(linha())
+
+    async def _ciclo(self, chave: Tuple[int, str], rajada: _Rajada):
+        try:
+            while True:
+                await asyncio.sleep(self.janela_seg)
+                total = self._publicar(rajada)
+                if total < self.limiar:
+                    # Ritmo caiu: volta ao log por evento
+                    break
+        finally:
+            self._rajadas.pop(chave, None)
+
+    def _publicar(self, rajada: _Rajada) -> int:
+        total, linhas = rajada.total, rajada.linhas
+        decorrido = max(1, int(time.monotonic() - rajada.inicio))
+        rajada.total, rajada.linhas, rajada.inicio = 0, [], time.monotonic()
+        if not total:
+            return 0
+
+        embed = discord.Embed(
+            title=f"📦 {rajada.acao} ×{total} em {decorrido}s",
+            description="Rajada detectada: os eventos foram agrupados. Detalhes no anexo.",
+            color=discord.Color.dark_orange(),
+        )
+        embed.add_field(name="Servidor", value=f"{rajada.guild.name} (`{rajada.guild.id}`)", inline=True)
+        embed.add_field(name="Eventos", value=str(total), inline=True)
+        if total > len(linhas):
+            embed.add_field(name="Anexo", value=f"Primeiros {len(linhas)} eventos listados.", inline=True)
+
+        nome = f"rajada-{rajada.guild.id}-{int(time.time())}.txt"
+        conteudo = f"{rajada.acao} — {total} evento(s) em {decorrido}s\n\n" + "\n".join(linhas) + "\n"
+        self._emitir(rajada.guild, embed, (nome, conteudo.encode("utf-8")))
+        self.stats["resumos_enviados"] += 1
+        return total
+
+    def encerrar(self):
+        """Publica o que estiver acumulado (chamado antes de esvaziar as filas)."""
+        for chave, rajada in list(self._rajadas.items()):
+            if rajada.tarefa and not rajada.tarefa.done():
+                rajada.tarefa.cancel()
+            self._publicar(rajada)
+        self._rajadas.clear()
+
@@ -0,0 +1,145 @@
+# logs_webhook.py
+import asyncio
+import json
+import time
+from typing import Dict, List, Optional, Tuple
+
+import aiohttp
+import discord
+
+import config
+
+NOME_WEBHOOK = "Lzim Logs"
+FALHA_CRIACAO_SEG = 600   # sem permissão para criar webhook: não tenta de novo por 10 min
+MAX_TENTATIVAS_429 = 3
+
+
+class EntregaWebhook:
+    """
+    Entrega de logs por webhook: um webhook por canal de log, criado uma vez
+    e mantido em cache. Os envios usam uma sessão HTTP própria, com limites
+    de taxa separados dos comandos do bot.
+    Se o webhook sumir (404/401), o chamador cai para channel.send.
+    """
+    def __init__(self, api_base: str):
+        self.api_base = api_base
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._webhooks: Dict[int, Tuple[int, str]] = {}       # canal_id -> (webhook_id, token)
+        self._criando: Dict[int, asyncio.Task] = {}
+        self._sem_permissao: Dict[int, float] = {}            # canal_id -> monotonic até quando não tentar
+        self._bloqueado_ate: Dict[int, float] = {}            # webhook_id -> monotonic (bucket esgotado)
+        self.stats = {"enviados": 0, "fallbacks": 0, "criados": 0, "limitados": 0}
+
+    def _sessao(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=15))
+        return self._session
+
+    def esquecer(self, canal_id: int):
+        self._webhooks.pop(canal_id, None)
+
+    # ---------- webhook por canal ----------
+    async def _obter_webhook(self, canal: discord.TextChannel) -> Optional[Tuple[int, str]]:
+        hook = self._webhooks.get(canal.id)
+        if hook:
+            return hook
+        if self._sem_permissao.get(canal.id, 0) > time.monotonic():
+            return None
+
+        # Single-flight: vários lotes simultâneos não criam vários webhooks
+        tarefa = self._criando.get(canal.id)
+        if tarefa is None:
+            tarefa = asyncio.create_task(self._criar_webhook(canal))
+            self._criando[canal.id] = tarefa
+            tarefa.add_done_callback(lambda _t, cid=canal.id: self._criando.pop(cid, None))
+        return await asyncio.shield(tarefa)
+
+    async def _criar_webhook(self, canal: discord.TextChannel) -> Optional[Tuple[int, str]]:
+        try:
+            me = canal.guild.me
+            # Reaproveita um webhook nosso que já exista no canal
+            for wh in await canal.webhooks():
+                if wh.token and wh.user and me and wh.user.id == me.id and wh.name == NOME_WEBHOOK:
+                    self._webhooks[canal.id] = (wh.id, wh.token)
+                    return self._webhooks[canal.id]
+            wh = await canal.create_webhook(name=NOME_WEBHOOK, reason="Entrega de logs do Lzim via webhook")
+            self.stats["criados"] += 1
+            self._webhooks[canal.id] = (wh.id, wh.token)  # type: ignore[assignment]
+            return self._webhooks[canal.id]
+        except (discord.Forbidden, discord.HTTPException) as e:
+            print(f"[Logs/Webhook] Não consegui preparar webhook em #{canal}: {e}")
+            self._sem_permissao[canal.id] = time.monotonic() + FALHA_CRIACAO_SEG
+            return None
+
+    # ---------- envio ----------
+    async def enviar(self, canal: discord.TextChannel, embeds: List[discord.Embed], arquivos: Optional[List[Tuple[str, bytes]]] = None) -> bool:
+        """Tenta entregar pelo webhook. False = use channel.send."""
+        hook = await self._obter_webhook(canal)
+        if not hook:
+            self.stats["fallbacks"] += 1
+            return False
+        webhook_id, token = hook
+        url = f"{self.api_base}/webhooks/{webhook_id}/{token}"
+        payload = {"embeds": [e.to_dict() for e in embeds]}
+
+        for _ in range(MAX_TENTATIVAS_429):
+            espera = self._bloqueado_ate.get(webhook_id, 0) - time.monotonic()
+            if espera > 0:
+                await asyncio.sleep(espera)
+
+            async with self._sessao().post(url, **self._corpo(payload, arquivos)) as resp:
+                self._ler_limites(webhook_id, resp)
+                if resp.status in (200, 204):
+                    self.stats["enviados"] += 1
+                    return True
+                if resp.status in (401, 404):
+                    # Webhook apagado/inválido: esquece e deixa o chamador usar send
+                    self.esquecer(canal.id)
+                    self.stats["fallbacks"] += 1
+                    return False
+                if resp.status == 429:
+                    self.stats["limitados"] += 1
+                    try:
+                        dados = await resp.json()
+                        retry_after = float(dados.get("retry_after", 1))
+                    except Exception:
+                        retry_after = 1.0
+                    self._bloqueado_ate[webhook_id] = time.monotonic() + retry_after
+                    continue
+                print(f"[Logs/Webhook] Envio falhou em #{canal} ({resp.status}): {(await resp.text())[:200]}")
+                break
+
+        self.stats["fallbacks"] += 1
+        return False
+
+    @staticmethod
+    def _corpo(payload: dict, arquivos: Optional[List[Tuple[str, bytes]]]) -> dict:
+        if not arquivos:
+            return {"json": payload}
+        # Com anexos o webhook exige multipart (payload_json + files[n]); recriado a cada tentativa
+        form = aiohttp.FormData()
+        form.add_field("payload_json", json.dumps(payload), content_type="application/json")
+        for i, (nome, dados) in enumerate(arquivos):
+            form.add_field(f"files[{i}]", dados, filename=nome, content_type="text/plain")
+        return {"data": form}
+
+    def _ler_limites(self, webhook_id: int, resp: aiohttp.ClientResponse):
+        # Bucket esgotado: próximos envios esperam o reset em vez de tomar 429
+        if resp.headers.get("X-RateLimit-Remaining") == "0":
+            try:
+                reset_after = float(resp.headers.get("X-RateLimit-Reset-After", "1"))
+            except ValueError:
+                reset_after = 1.0
+            self._bloqueado_ate[webhook_id] = time.monotonic() + reset_after
+
+    async def encerrar(self):
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+entrega_webhook = EntregaWebhook(config.DISCORD_API_BASE)
+
+
+def webhook_ativo() -> bool:
+    return config.LOGS_ENTREGA == "webhook"
@@ -1,54 +1,119 @@
 import os
+import sys
 import discord
 from discord.ext import commands
 from dotenv import load_dotenv
 import config
+from config_servidores import configs
+from auditoria import auditoria
+from sync_comandos import sincronizar
+from cluster_ipc import ipc
+import cache_membros
+from eventos_gateway import contador_gateway
+from indice_cargos import indice_cargos
+from metricas import ArvoreComandos, metricas, registrar_comando
+from vigia_loop import vigia
 
 # Carregar variáveis do .env
 load_dotenv()
 
-# módulos
-from comandos_utilitarios import setup_comandos_utilitarios
-from mod_logs import setup_mod_logs
-from mod_tickets import setup_mod_tickets
-from mod_moderacao import setup_mod_moderacao
-from mod_permissoes import setup_mod_permissoes
-from mod_musica import setup_mod_musica
-from mod_sorteio import setup_mod_sorteio
-from mod_painel_admin import setup_mod_painel_admin
-from mod_org_cargos import setup_mod_org_cargos
-from mod_formulario import setup_mod_formulario
-from mod_equipes import setup_mod_equipes
-
-intents = discord.Intents.default()
-intents.members = True
-intents.message_content = True
-
-class LzimBot(commands.Bot):
+# módulos: importados sob demanda pelo registro (ver modulos.py)
+from modulos import registro
+
+# Só os intents que os módulos ativos declaram (nenhum módulo lê mensagens: sem message_content)
+intents = registro.intents()
+
+class LzimBot(commands.AutoShardedBot):
+    # --force-sync na linha de comando ignora o hash salvo e sincroniza sempre
+    forcar_sync = False
+
+    def dispatch(self, event_name: str, /, *args, **kwargs):
+        # Eventos de depuração do gateway: contados aqui mesmo, sem virar tarefa
+        if event_name == "socket_event_type":
+            contador_gateway.evento(args[0])
+            return
+        if event_name == "socket_raw_receive":
+            contador_gateway.recebido(len(args[0]))
+            return
+        super().dispatch(event_name, *args, **kwargs)
+
     async def setup_hook(self):
-        await setup_comandos_utilitarios(self)
-        await setup_mod_logs(self)
-        await setup_mod_tickets(self)
-        await setup_mod_moderacao(self)
-        await setup_mod_permissoes(self)
-        await setup_mod_musica(self)
-        await setup_mod_sorteio(self)
-        await setup_mod_painel_admin(self)
-        await setup_mod_org_cargos(self)
-        await setup_mod_formulario(self)
-        await setup_mod_equipes(self)
-
-        # sync
-        if config.GUILD_ID:
-            await self.tree.sync(guild=discord.Object(id=int(config.GUILD_ID)))
-            print(f"✅ Slash sync (guild): {config.GUILD_ID}")
-        else:
-            await self.tree.sync()
-            print("✅ Slash sync global")
+        # Vigia do loop: o quanto antes, para pegar travamentos da própria inicialização
+        vigia.iniciar(config.VIGIA_LOOP_LIMIAR_MS)
+
+        # Configurações por servidor: lidas do disco uma única vez
+        configs.carregar()
+
+        # Modo cluster: canal local para falar com os outros processos
+        await ipc.iniciar()
+
+        # Métricas (opcional): porta 0 = desligado
+        porta = config.METRICAS_PORTA + (ipc.cluster_id or 0) if config.METRICAS_PORTA else 0
+        await metricas.iniciar(self, porta)
+        metricas.medidor("lzim_auditoria_fila", "Eventos aguardando gravação no SQLite", auditoria.profundidade)
+        metricas.medidor(
+            "lzim_gateway_eventos", "Eventos recebidos do gateway por tipo (acumulado)",
+            lambda: {(("tipo", tipo),): qtd for tipo, qtd in contador_gateway.eventos.items()}
+        )
+        metricas.medidor(
+            "lzim_loop_travamentos", "Travamentos do event loop acima do limiar (acumulado)",
+            lambda: sum(r.ocorrencias for r in vigia.registros.values())
+        )
+        metricas.medidor("lzim_loop_pior_atraso_segundos", "Maior atraso do event loop visto pelo vigia",
+                         lambda: vigia.pior_atraso_seg)
+
+        await registro.carregar_todos(self)
+        print(registro.relatorio())
+        print("🔌 Intents: " + ", ".join(nome for nome, ativo in self.intents if ativo))
+        contador_gateway.iniciar_relatorios(config.GATEWAY_RELATORIO_MIN)
+
+        # sync (só quando a árvore de comandos mudou; no cluster, só o processo 0)
+        if ipc.principal:
+            await sincronizar(self, forcar=self.forcar_sync)
+
+    async def close(self):
+        # Esvazia a fila de logs antes de desconectar
+        if "mod_logs" in sys.modules:
+            await sys.modules["mod_logs"].encerrar_dispatcher()
+        await auditoria.encerrar()
+        await configs.encerrar()
+        await ipc.encerrar()
+        contador_gateway.encerrar()
+        await metricas.encerrar()
+        vigia.encerrar()
+        if contador_gateway.eventos:
+            print(contador_gateway.relatorio())
+        await super().close()
+
+    async def on_app_command_completion(self, interaction: discord.Interaction, command):
+        registrar_comando(interaction, command)
+
+    # Índice de classes de cargo (admin/staff/VIP): acompanha os cargos sem reler o servidor
+    async def on_guild_role_create(self, role: discord.Role):
+        indice_cargos.atualizar_cargo(role)
+
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        indice_cargos.atualizar_cargo(after)
+
+    async def on_guild_role_delete(self, role: discord.Role):
+        indice_cargos.remover_cargo(role)
+
+    async def on_guild_remove(self, guild: discord.Guild):
+        indice_cargos.invalidar(guild.id)
+
+    # Cargos criados/renomeados enquanto o bot estava fora (novo IDENTIFY, queda do servidor)
+    # não geram eventos de cargo: o índice é remontado na próxima checagem
+    async def on_guild_available(self, guild: discord.Guild):
+        indice_cargos.invalidar(guild.id)
+
+    async def on_guild_join(self, guild: discord.Guild):
+        indice_cargos.invalidar(guild.id)
 
     async def on_ready(self):
         await self.change_presence(activity=discord.Game(name="✨ Lzim em ação"))
         print(f"🤖 Logado como {self.user} (id: {self.user.id})")
+        servidores, completos, membros = cache_membros.resumo(self)
+        print(f"👥 Cache de membros ({cache_membros.politica()}): {membros} membros, {completos}/{servidores} servidores completos")
 
 def run():
     token = config.DISCORD_TOKEN.strip()
@@ -56,7 +121,18 @@ def run():
     if not token:
         raise SystemExit("❌ DISCORD_TOKEN não encontrado! Coloque no arquivo .env.")
 
-    bot = LzimBot(command_prefix="!", intents=intents)
+    # DISCORD_API_BASE fora do padrão: REST (e o gateway que ele anunciar) vão para outro servidor,
+    # ex.: benchmarks/discord_falso.py
+    discord.http.Route.BASE = config.DISCORD_API_BASE
+    discord.webhook.async_.Route.BASE = config.DISCORD_API_BASE
+
+    # Lançado pelo cluster.py: este processo cuida só da sua faixa de shards
+    ipc.configurar_pelo_ambiente()
+    bot = LzimBot(
+        command_prefix="!", intents=intents, enable_debug_events=True, tree_cls=ArvoreComandos,
+        **cache_membros.opcoes_bot(intents=intents), **ipc.argumentos_bot()
+    )
+    bot.forcar_sync = "--force-sync" in sys.argv[1:]
     bot.run(token)
 
 if __name__ == "__main__":
@@ -0,0 +1,218 @@
+# metricas.py
+"""
+Métricas no formato texto do Prometheus, servidas por aiohttp em
+METRICAS_PORTA (0 = desligado). Contadores e histogramas são só somas em
+memória; medidores (filas, latência do gateway, atraso do loop) são lidos
+na hora do scrape, então sem ninguém coletando o custo é praticamente zero.
+"""
+import asyncio
+import bisect
+import logging
+import re
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import discord
+from aiohttp import web
+from discord import app_commands
+
+import config
+
+BUCKETS_SEG = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 30.0)
+
+Rotulos = Tuple[Tuple[str, str], ...]
+
+# IDs viram {id} nas rotas para não explodir a cardinalidade
+_SNOWFLAKE = re.compile(r"/\d{15,21}")
+_TOKEN_WEBHOOK = re.compile(r"(/webhooks/\{id\})/[^/?]+")
+
+
+def _rotulos(**kw) -> Rotulos:
+    return tuple(sorted((k, str(v)) for k, v in kw.items()))
+
+
+def _escapar(valor: str) -> str:
+    return valor.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _fmt_rotulos(rotulos: Rotulos, extra: Optional[Tuple[str, str]] = None) -> str:
+    partes = [f'{k}="{_escapar(v)}"' for k, v in rotulos]
+    if extra:
+        partes.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(partes) + "}" if partes else ""
+
+
+class Contador:
+    def __init__(self, nome: str, ajuda: str):
+        self.nome, self.ajuda = nome, ajuda
+        self.valores: Dict[Rotulos, float] = {}
+
+    def inc(self, valor: float = 1.0, **rotulos):
+        chave = _rotulos(**rotulos)
+        self.valores[chave] = self.valores.get(chave, 0.0) + valor
+
+    def exportar(self) -> Iterable[str]:
+        yield f"# HELP {self.nome} {self.ajuda}"
+        yield f"# TYPE {self.nome} counter"
+        for rot, v in self.valores.items():
+            yield f"{self.nome}{_fmt_rotulos(rot)} {v}"
+
+
+class Histograma:
+    def __init__(self, nome: str, ajuda: str, buckets: Tuple[float, ...] = BUCKETS_SEG):
+        self.nome, self.ajuda, self.buckets = nome, ajuda, buckets
+        self.valores: Dict[Rotulos, List[float]] = {}   # [contagem por bucket..., +Inf, soma]
+
+    def observar(self, valor: float, **rotulos):
+        chave = _rotulos(**rotulos)
+        dados = self.valores.get(chave)
+        if dados is None:
+            dados = self.valores[chave] = [0.0] * (len(self.buckets) + 2)
+        dados[bisect.bisect_left(self.buckets, valor)] += 1
+        dados[-1] += valor
+
+    def exportar(self) -> Iterable[str]:
+        yield f"# HELP {self.nome} {self.ajuda}"
+        yield f"# TYPE {self.nome} histogram"
+        for rot, dados in self.valores.items():
+            acumulado = 0.0
+            for limite, qtd in zip(self.buckets, dados):
+                acumulado += qtd
+                yield f"{self.nome}_bucket{_fmt_rotulos(rot, ('le', str(limite)))} {acumulado}"
+            acumulado += dados[len(self.buckets)]
+            yield f"{self.nome}_bucket{_fmt_rotulos(rot, ('le', '+Inf'))} {acumulado}"
+            yield f"{self.nome}_sum{_fmt_rotulos(rot)} {dados[-1]}"
+            yield f"{self.nome}_count{_fmt_rotulos(rot)} {acumulado}"
+
+
+# Medidor: função chamada no scrape → número ou {rótulos: número}
+Medidor = Callable[[], "float | Dict[Rotulos, float]"]
+
+
+class Metricas:
+    def __init__(self):
+        self.comandos = Histograma("lzim_comando_segundos", "Duração dos slash commands (do check ao fim do callback)")
+        self.operacoes = Histograma("lzim_operacao_segundos", "Duração de operações internas (ex.: criar ticket)")
+        self.limites_http = Contador("lzim_http_429_total", "Respostas 429 da API do Discord por rota")
+        self.limites_globais = Contador("lzim_http_429_global_total", "Dessas respostas 429, quantas foram do limite global")
+        self._medidores: Dict[str, Tuple[str, Medidor]] = {}
+        self._runner: Optional[web.AppRunner] = None
+        self.bot = None
+
+    # ---------- registro ----------
+    def medidor(self, nome: str, ajuda: str, funcao: Medidor):
+        # Recarregar um módulo só troca a função
+        self._medidores[nome] = (ajuda, funcao)
+
+    def total_429(self) -> float:
+        """Soma de todos os 429 vistos até agora (execuções em massa comparam antes/depois)."""
+        return sum(self.limites_http.valores.values())
+
+    @contextmanager
+    def medir(self, operacao: str):
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.operacoes.observar(time.perf_counter() - inicio, operacao=operacao)
+
+    # ---------- exportação ----------
+    async def _atraso_loop(self) -> float:
+        inicio = time.perf_counter()
+        await asyncio.sleep(0)
+        return time.perf_counter() - inicio
+
+    async def texto(self) -> str:
+        linhas: List[str] = []
+        for metrica in (self.comandos, self.operacoes, self.limites_http, self.limites_globais):
+            linhas.extend(metrica.exportar())
+
+        linhas += [
+            "# HELP lzim_loop_atraso_segundos Atraso do event loop medido no scrape",
+            "# TYPE lzim_loop_atraso_segundos gauge",
+            f"lzim_loop_atraso_segundos {await self._atraso_loop()}",
+        ]
+        if self.bot is not None:
+            linhas += [
+                "# HELP lzim_gateway_latencia_segundos Latência do heartbeat por shard",
+                "# TYPE lzim_gateway_latencia_segundos gauge",
+            ]
+            for shard_id, latencia in self.bot.latencies:
+                if latencia == latencia and latencia != float("inf"):  # NaN/inf antes do primeiro heartbeat
+                    linhas.append(f'lzim_gateway_latencia_segundos{{shard="{shard_id}"}} {latencia}')
+
+        for nome, (ajuda, funcao) in self._medidores.items():
+            try:
+                valor = funcao()
+            except Exception as e:
+                print(f"[Métricas] Falha em {nome}: {e}")
+                continue
+            linhas += [f"# HELP {nome} {ajuda}", f"# TYPE {nome} gauge"]
+            if isinstance(valor, dict):
+                linhas += [f"{nome}{_fmt_rotulos(rot)} {v}" for rot, v in valor.items()]
+            else:
+                linhas.append(f"{nome} {valor}")
+        return "\n".join(linhas) + "\n"
+
+    async def _rota(self, request: web.Request) -> web.Response:
+        return web.Response(text=await self.texto(), content_type="text/plain", charset="utf-8",
+                            headers={"X-Content-Type-Options": "nosniff"})
+
+    async def iniciar(self, bot, porta: int):
+        self.bot = bot
+        if porta <= 0 or self._runner is not None:
+            return
+        app = web.Application()
+        app.router.add_get("/metrics", self._rota)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, config.METRICAS_HOST, porta).start()
+        print(f"📈 Métricas em http://{config.METRICAS_HOST}:{porta}/metrics")
+
+    async def encerrar(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+metricas = Metricas()
+
+
+def rota_normalizada(url: str) -> str:
+    rota = url.split("?", 1)[0].replace(config.DISCORD_API_BASE, "")
+    return _TOKEN_WEBHOOK.sub(r"\1/{token}", _SNOWFLAKE.sub("/{id}", rota))
+
+
+class _Captura429(logging.Handler):
+    # O discord.py não expõe evento para 429: os avisos do logger discord.http viram contagem
+    def emit(self, record: logging.LogRecord):
+        msg = record.msg if isinstance(record.msg, str) else ""
+        if "responded with 429" in msg and len(record.args or ()) >= 2:
+            metodo, url = record.args[0], str(record.args[1])
+            metricas.limites_http.inc(metodo=metodo, rota=rota_normalizada(url))
+        elif msg.startswith("Global rate limit"):
+            # Vem logo depois do "responded with 429" da mesma resposta, já contada acima
+            metricas.limites_globais.inc()
+
+
+_captura = _Captura429(level=logging.WARNING)
+logging.getLogger("discord.http").addHandler(_captura)
+
+
+class ArvoreComandos(app_commands.CommandTree):
+    """CommandTree que mede a duração de cada slash command."""
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        interaction.extras["lzim_inicio"] = time.perf_counter()
+        return True
+
+    async def on_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
+        registrar_comando(interaction, interaction.command, "erro")
+        await super().on_error(interaction, error)
+
+
+def registrar_comando(interaction: discord.Interaction, comando, resultado: str = "ok"):
+    inicio = interaction.extras.pop("lzim_inicio", None)
+    if inicio is None or comando is None:
+        return
+    metricas.comandos.observar(time.perf_counter() - inicio, comando=comando.qualified_name, resultado=resultado)
@@ -7,6 +7,9 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
+from config_servidores import configs
+from modulos import guardar_estado, restaurar_estado
+
 # Integração de logs (se existir)
 try:
     from mod_logs import registrar_log
@@ -32,8 +35,7 @@ PAINEL_DESCR = (
 # ESTADOS EM MEMÓRIA
 # =========================
 
-# guild_id -> channel_id (destino onde vão as candidaturas)
-FORM_DESTINO: Dict[int, int] = {}
+# Destino das candidaturas (guild_id -> channel_id) fica em config_servidores: "formulario_destino_id"
 
 # message_id (da embed postada no canal de destino) -> (guild_id, candidato_id)
 CANDIDATURAS: Dict[int, Tuple[int, int]] = {}
@@ -283,7 +285,7 @@ class PainelFormularioView(discord.ui.View):
         if not inter.guild or not isinstance(inter.user, discord.Member):
             return await inter.response.send_message("❌ Use no servidor.", ephemeral=True)
 
-        destino_id = FORM_DESTINO.get(inter.guild.id)
+        destino_id = configs.obter(inter.guild.id, "formulario_destino_id")
         if not destino_id:
             return await inter.response.send_message("⚠️ Nenhum canal de destino configurado. Peça a um admin para usar **/painelformstaff**.", ephemeral=True)
 
@@ -297,7 +299,14 @@ class PainelFormularioView(discord.ui.View):
 # SETUP / SLASH
 # =========================
 
+def teardown_mod_formulario(bot: commands.Bot):
+    # Recarga a quente: candidaturas pendentes continuam ligadas às mensagens
+    guardar_estado(__name__, CANDIDATURAS=CANDIDATURAS)
+
 async def setup_mod_formulario(bot: commands.Bot):
+    global CANDIDATURAS
+    CANDIDATURAS = restaurar_estado(__name__).get("CANDIDATURAS", CANDIDATURAS)
+
     # Registrar views persistentes
     bot.add_view(PainelFormularioView(bot))
     bot.add_view(DecisaoCandidaturaView(bot, candidato_id=0))  # para registrar os botões como persistentes
@@ -319,7 +328,7 @@ async def setup_mod_formulario(bot: commands.Bot):
         if not inter.guild:
             return await inter.response.send_message("❌ Use no servidor.", ephemeral=True)
 
-        FORM_DESTINO[inter.guild.id] = destino_candidaturas.id
+        configs.definir(inter.guild.id, "formulario_destino_id", destino_candidaturas.id)
 
         target = painel or inter.channel
         if not isinstance(target, discord.TextChannel):
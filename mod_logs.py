@@ -1,24 +1,22 @@
 # mod_logs.py
+import asyncio
+import base64
+import io
 import discord
 from discord import app_commands
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
 import pytz
 import config
-import json
-import os
+from auditoria import auditoria
+from cluster_ipc import GuildRemota, ipc
+from config_servidores import configs
+from logs_rajadas import AgregadorRajadas
+from logs_webhook import entrega_webhook, webhook_ativo
+from metricas import metricas
+from modulos import guardar_estado, restaurar_estado
 
 brasil = pytz.timezone(config.TIMEZONE_BR)
-LOGS_DB_FILE = "logs_config.json"
-
-def carregar_logs_config():
-    if os.path.exists(LOGS_DB_FILE):
-        with open(LOGS_DB_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return {}
-
-def salvar_logs_config(data):
-    with open(LOGS_DB_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
 
 def base_embed(title: str, color=discord.Color.blurple()):
     e = discord.Embed(title=title, color=color)
@@ -42,74 +40,495 @@ async def registrar_log(bot, guild, acao, usuario, detalhes="", moderador=None):
     if detalhes:
         embed.add_field(name="Detalhes", value=detalhes, inline=False)
 
-    await enviar_log_central(bot, guild, embed)
-    await enviar_log_opcional(guild, embed)
+    # Cópia pesquisável (SQLite) — também só enfileira
+    auditoria.registrar(guild, acao, usuario=usuario, moderador=moderador, detalhes=detalhes)
+
+    # Só enfileira: o envio acontece em segundo plano, em lotes
+    dispatcher = obter_dispatcher(bot)
+
+    # Em rajada, o evento entra no resumo da janela em vez de virar uma embed
+    def linha() -> str:
+        mod_id = getattr(moderador, "id", "—")
+        texto = (detalhes or "").replace("\n", " | ")
+        return f"[{datetime.now(brasil).strftime('%H:%M:%S')}] usuário {uid} • moderador {mod_id} • {texto}"
+    if not dispatcher.rajadas.registrar(guild, acao, linha):
+        return
+
+    dispatcher.enfileirar("central", guild, embed)
+    if logs_locais_ativos(guild):
+        dispatcher.enfileirar("local", guild, embed)
+
+# -------------------------
+# Despacho em lote (uma fila por destino)
+# -------------------------
+LOTE_MAX_EMBEDS = 10          # limite do Discord por mensagem
+LOTE_MAX_CARACTERES = 6000    # limite do Discord somando todas as embeds da mensagem
+LOTE_PRAZO_SEG = 1.5          # espera máxima antes de enviar um lote incompleto
+FILA_MAX_POR_DESTINO = 500    # acima disso os logs mais antigos são descartados
+FILA_OCIOSA_SEG = 300         # worker sem trabalho por esse tempo é encerrado
+
+class LogDispatcher:
+    """
+    Recebe embeds de log e envia em segundo plano.
+    Cada destino (central/local de um servidor) tem sua própria fila e worker;
+    as embeds são agrupadas (até 10 por mensagem) e enviadas quando o lote
+    enche ou quando o prazo curto expira.
+    """
+    def __init__(self, bot):
+        self.bot = bot
+        self.rajadas = AgregadorRajadas(config.LOGS_RAJADA_LIMIAR, config.LOGS_RAJADA_JANELA_SEG, self._emitir_resumo)
+        self._filas: Dict[Tuple[str, int], asyncio.Queue] = {}
+        self._workers: Dict[Tuple[str, int], asyncio.Task] = {}
+        self.stats = {
+            "enfileirados": 0,
+            "descartados": 0,
+            "embeds_enviadas": 0,
+            "mensagens_enviadas": 0,
+            "falhas": 0,
+            "pico_fila": 0,
+        }
+
+    def _emitir_resumo(self, guild: discord.Guild, embed: discord.Embed, arquivo: Tuple[str, bytes]):
+        self.enfileirar("central", guild, embed, arquivo)
+        if logs_locais_ativos(guild):
+            self.enfileirar("local", guild, embed, arquivo)
+
+    def enfileirar(self, destino: str, guild: discord.Guild, embed: discord.Embed, arquivo: Optional[Tuple[str, bytes]] = None):
+        chave = (destino, guild.id)
+        fila = self._filas.get(chave)
+        if fila is None:
+            fila = asyncio.Queue(maxsize=FILA_MAX_POR_DESTINO)
+            self._filas[chave] = fila
+
+        # Backpressure: fila cheia → descarta o mais antigo para não travar quem chamou
+        if fila.full():
+            try:
+                fila.get_nowait()
+                self.stats["descartados"] += 1
+            except asyncio.QueueEmpty:
+                pass
+        fila.put_nowait((guild, embed, arquivo))
+        self.stats["enfileirados"] += 1
+        self.stats["pico_fila"] = max(self.stats["pico_fila"], fila.qsize())
+
+        worker = self._workers.get(chave)
+        if worker is None or worker.done():
+            self._workers[chave] = asyncio.create_task(self._worker(chave, fila), name=f"lzim-logs-{destino}-{guild.id}")
+
+    def profundidade(self) -> int:
+        return sum(f.qsize() for f in self._filas.values())
+
+    def resumo(self) -> Dict[str, int]:
+        dados = dict(self.stats)
+        dados["na_fila"] = self.profundidade()
+        dados["destinos_ativos"] = sum(1 for w in self._workers.values() if not w.done())
+        dados.update(self.rajadas.stats)
+        dados["em_rajada"] = self.rajadas.em_rajada()
+        return dados
+
+    async def _proximo_item(self, fila: asyncio.Queue, timeout: float):
+        if not fila.empty():
+            return fila.get_nowait()
+        if timeout <= 0:
+            return None
+        try:
+            return await asyncio.wait_for(fila.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def _worker(self, chave: Tuple[str, int], fila: asyncio.Queue):
+        destino = chave[0]
+        loop = asyncio.get_running_loop()
+        sobra = None  # item que não coube no lote anterior
+        while True:
+            item = sobra or await self._proximo_item(fila, FILA_OCIOSA_SEG)
+            sobra = None
+            if item is None:
+                if not fila.empty():
+                    continue
+                # Ocioso: libera o worker (é recriado no próximo enfileirar)
+                self._workers.pop(chave, None)
+                self._filas.pop(chave, None)
+                return
+
+            guild, embed, arquivo = item
+            lote = [embed]
+            arquivos = [arquivo] if arquivo else []
+            tamanho = len(embed)
+            prazo = loop.time() + LOTE_PRAZO_SEG
+            while len(lote) < LOTE_MAX_EMBEDS:
+                item = await self._proximo_item(fila, prazo - loop.time())
+                if item is None:
+                    break
+                if tamanho + len(item[1]) > LOTE_MAX_CARACTERES:
+                    sobra = item
+                    break
+                guild = item[0]
+                lote.append(item[1])
+                if item[2]:
+                    arquivos.append(item[2])
+                tamanho += len(item[1])
+
+            try:
+                if destino == "central":
+                    enviado = await enviar_log_central(self.bot, guild, lote, arquivos)
+                else:
+                    enviado = await enviar_log_opcional(guild, lote, arquivos)
+                if enviado:
+                    self.stats["mensagens_enviadas"] += 1
+                    self.stats["embeds_enviadas"] += len(lote)
+            except Exception as e:
+                self.stats["falhas"] += 1
+                print(f"[Logs] Erro no envio em lote ({destino}/{guild.id}): {e}")
+
+    async def encerrar(self, timeout: float = 5.0):
+        """Dá um tempo para as filas esvaziarem e encerra os workers."""
+        self.rajadas.encerrar()
+        limite = asyncio.get_running_loop().time() + timeout
+        while self.profundidade() and asyncio.get_running_loop().time() < limite:
+            await asyncio.sleep(0.1)
+        for worker in list(self._workers.values()):
+            worker.cancel()
+        self._workers.clear()
+
+_dispatcher: Optional[LogDispatcher] = None
+
+def obter_dispatcher(bot) -> LogDispatcher:
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = LogDispatcher(bot)
+    return _dispatcher
+
+async def encerrar_dispatcher():
+    if _dispatcher is not None:
+        await _dispatcher.encerrar()
+    await entrega_webhook.encerrar()
+
+# -------------------------
+# Canais do servidor central (guild_id → channel_id)
+# -------------------------
+# Mapa persistido em config_servidores ("logs_central_canal_id"); evita varrer a categoria por nome a cada log
+_categoria_central_id: Optional[int] = None
+_lock_categoria = asyncio.Lock()
+_criacoes_centrais: Dict[int, asyncio.Task] = {}
 
 async def _garantir_categoria_central(servidor_central: discord.Guild) -> discord.CategoryChannel | None:
+    global _categoria_central_id
     if not servidor_central:
         return None
 
-    categoria = discord.utils.get(servidor_central.categories, name=config.CATEGORIA_LOGS_CENTRAL)
-    if categoria:
+    if _categoria_central_id:
+        categoria = servidor_central.get_channel(_categoria_central_id)
+        if isinstance(categoria, discord.CategoryChannel):
+            return categoria
+
+    # Lock: dois logs simultâneos não podem criar duas categorias
+    async with _lock_categoria:
+        categoria = discord.utils.get(servidor_central.categories, name=config.CATEGORIA_LOGS_CENTRAL)
+        if categoria:
+            _categoria_central_id = categoria.id
+            return categoria
+
+        # Cria categoria com @everyone bloqueado e role id liberado
+        overwrites = {
+            servidor_central.default_role: discord.PermissionOverwrite(view_channel=False)
+        }
+
+        # Concede visão ao cargo específico de logs (se existir)
+        role_logs = servidor_central.get_role(config.CENTRAL_LOGS_ROLE_ID) if config.CENTRAL_LOGS_ROLE_ID else None
+        if role_logs:
+            overwrites[role_logs] = discord.PermissionOverwrite(view_channel=True, read_message_history=True, send_messages=False)
+
+        categoria = await servidor_central.create_category(config.CATEGORIA_LOGS_CENTRAL, overwrites=overwrites, reason="Criando hub central de logs do Lzim")
+        _categoria_central_id = categoria.id
         return categoria
 
-    # Cria categoria com @everyone bloqueado e role id liberado
-    overwrites = {
-        servidor_central.default_role: discord.PermissionOverwrite(view_channel=False)
-    }
+async def _criar_canal_central(servidor_central: discord.Guild, guild: discord.Guild) -> discord.TextChannel | None:
+    # Garante categoria com perms corretas
+    categoria = await _garantir_categoria_central(servidor_central)
+    if not categoria:
+        return None
+
+    # Reaproveita canal já existente (o tópico guarda o ID; o nome antigo é fallback)
+    nome_canal_log = f"📜logs-{guild.name.lower().replace(' ', '-')}"
+    marcador = f"(ID: {guild.id})"
+    canal_log = discord.utils.find(
+        lambda c: isinstance(c, discord.TextChannel) and marcador in (c.topic or ""),
+        categoria.channels
+    ) or discord.utils.get(categoria.text_channels, name=nome_canal_log)
+
+    if not canal_log:
+        # Herda perms da categoria (já bloqueia everyone e libera o cargo de logs)
+        canal_log = await categoria.create_text_channel(
+            nome_canal_log,
+            topic=f"Logs do servidor {guild.name} {marcador}",
+            reason="Criando canal de logs por servidor no central"
+        )
+
+    configs.definir(guild.id, "logs_central_canal_id", canal_log.id)
+    return canal_log
 
-    # Concede visão ao cargo específico de logs (se existir)
-    role_logs = servidor_central.get_role(config.CENTRAL_LOGS_ROLE_ID) if config.CENTRAL_LOGS_ROLE_ID else None
-    if role_logs:
-        overwrites[role_logs] = discord.PermissionOverwrite(view_channel=True, read_message_history=True, send_messages=False)
+async def _canal_central(servidor_central: discord.Guild, guild: discord.Guild) -> discord.TextChannel | None:
+    canal_id = configs.obter(guild.id, "logs_central_canal_id")
+    if canal_id:
+        canal = servidor_central.get_channel(canal_id)
+        if isinstance(canal, discord.TextChannel):
+            return canal
+        configs.esquecer_canal(canal_id)
 
-    categoria = await servidor_central.create_category(config.CATEGORIA_LOGS_CENTRAL, overwrites=overwrites, reason="Criando hub central de logs do Lzim")
-    return categoria
+    # Single-flight: criações simultâneas para o mesmo servidor compartilham a mesma tarefa
+    tarefa = _criacoes_centrais.get(guild.id)
+    if tarefa is None:
+        tarefa = asyncio.create_task(_criar_canal_central(servidor_central, guild))
+        _criacoes_centrais[guild.id] = tarefa
+        tarefa.add_done_callback(lambda _t, gid=guild.id: _criacoes_centrais.pop(gid, None))
+    return await asyncio.shield(tarefa)
 
-async def enviar_log_central(bot, guild, embed):
+async def enviar_log_central(bot, guild, embeds: List[discord.Embed], arquivos: Optional[List[Tuple[str, bytes]]] = None) -> bool:
     if not config.SERVIDOR_CENTRAL_ID:
-        return
+        return False
     try:
         servidor_central = bot.get_guild(config.SERVIDOR_CENTRAL_ID)
         if not servidor_central:
-            return
-
-    # Garante categoria com perms corretas
-        categoria = await _garantir_categoria_central(servidor_central)
-        if not categoria:
-            return
-
-        # Nome de canal por servidor
-        nome_canal_log = f"📜logs-{guild.name.lower().replace(' ', '-')}"
+            # Cluster: o servidor central está em outro processo
+            if not ipc.local(config.SERVIDOR_CENTRAL_ID):
+                return await _encaminhar_central(guild, embeds, arquivos)
+            return False
 
-        canal_log = discord.utils.get(categoria.channels, name=nome_canal_log)
+        canal_log = await _canal_central(servidor_central, guild)
         if not canal_log:
-            # Herda perms da categoria (já bloqueia everyone e libera o cargo de logs)
-            canal_log = await categoria.create_text_channel(
-                nome_canal_log,
-                topic=f"Logs do servidor {guild.name} (ID: {guild.id})",
-                reason="Criando canal de logs por servidor no central"
-            )
+            return False
 
-        await canal_log.send(embed=embed)
+        await _entregar(canal_log, embeds, arquivos)
+        return True
 
     except Exception as e:
         print(f"Erro ao enviar log central: {e}")
+        return False
 
-async def enviar_log_opcional(guild, embed):
-    logs_config = carregar_logs_config()
-    guild_id_str = str(guild.id)
+async def _encaminhar_central(guild, embeds: List[discord.Embed], arquivos: Optional[List[Tuple[str, bytes]]]) -> bool:
+    dados = {
+        "guild_id": guild.id,
+        "guild_nome": guild.name,
+        "embeds": [e.to_dict() for e in embeds],
+        "arquivos": [[nome, base64.b64encode(conteudo).decode("ascii")] for nome, conteudo in (arquivos or [])],
+    }
+    return bool(await ipc.chamar(ipc.cluster_do_guild(config.SERVIDOR_CENTRAL_ID), "logs_central", dados))
 
-    if guild_id_str not in logs_config or not logs_config[guild_id_str].get("ativado", False):
-        return
+async def _receber_central(bot, dados: Dict[str, Any]) -> bool:
+    # Lado do processo que tem o servidor central
+    guild = GuildRemota(int(dados["guild_id"]), dados["guild_nome"])
+    embeds = [discord.Embed.from_dict(e) for e in dados["embeds"]]
+    arquivos = [(nome, base64.b64decode(conteudo)) for nome, conteudo in dados.get("arquivos", [])]
+    return await enviar_log_central(bot, guild, embeds, arquivos)
+
+async def _entregar(canal: discord.TextChannel, embeds: List[discord.Embed], arquivos: Optional[List[Tuple[str, bytes]]] = None):
+    # Modo webhook tira os logs dos limites de taxa do bot; qualquer falha cai para send
+    if webhook_ativo():
+        try:
+            if await entrega_webhook.enviar(canal, embeds, arquivos):
+                return
+        except Exception as e:
+            print(f"[Logs] Webhook falhou, usando send: {e}")
+    files = [discord.File(io.BytesIO(dados), filename=nome) for nome, dados in (arquivos or [])]
+    await canal.send(embeds=embeds, files=files)
+
+def logs_locais_ativos(guild: discord.Guild) -> bool:
+    return bool(configs.obter(guild.id, "logs_ativado", False))
+
+async def enviar_log_opcional(guild, embeds: List[discord.Embed], arquivos: Optional[List[Tuple[str, bytes]]] = None) -> bool:
+    if not logs_locais_ativos(guild):
+        return False
     try:
-        canal_log = discord.utils.get(guild.text_channels, name=config.NOME_CANAL_LOG_OPCIONAL)
-        if canal_log:
-            await canal_log.send(embed=embed)
+        canal_id = configs.obter(guild.id, "logs_canal_id")
+        canal_log = guild.get_channel(canal_id) if canal_id else None
+        if isinstance(canal_log, discord.TextChannel):
+            await _entregar(canal_log, embeds, arquivos)
+            return True
     except Exception as e:
         print(f"Erro ao enviar log opcional: {e}")
+    return False
+
+# -------------------------
+# Busca no histórico de auditoria
+# -------------------------
+BUSCA_POR_PAGINA = 10
+
+def _embed_busca(guild: discord.Guild, eventos: List[Dict[str, Any]], pagina: int, filtros_txt: str) -> discord.Embed:
+    embed = base_embed(f"🔎 Logs de {guild.name} — página {pagina}")
+    if filtros_txt:
+        embed.description = f"Filtros: {filtros_txt}"
+    if not eventos:
+        embed.add_field(name="Nada encontrado", value="Nenhum registro com esses filtros.", inline=False)
+        return embed
+    for ev in eventos:
+        partes = [f"<t:{int(ev['ts'])}:f>"]
+        if ev.get("moderador_id"):
+            partes.append(f"mod <@{ev['moderador_id']}>")
+        if ev.get("alvo_id"):
+            partes.append(f"alvo <@{ev['alvo_id']}>")
+        elif ev.get("usuario_id"):
+            partes.append(f"usuário <@{ev['usuario_id']}>")
+        detalhes = (ev.get("detalhes") or "").replace("\n", " • ")
+        if len(detalhes) > 150:
+            detalhes = detalhes[:147] + "..."
+        valor = " • ".join(partes) + (f"\n> {detalhes}" if detalhes else "")
+        embed.add_field(name=f"#{ev['id']} {ev['acao']}"[:256], value=valor[:1024], inline=False)
+    return embed
+
+class BuscaLogsView(discord.ui.View):
+    """Paginação por cursor (id): cada página guarda onde a anterior começou."""
+    def __init__(self, autor_id: int, guild: discord.Guild, filtros: Dict[str, Any], filtros_txt: str):
+        super().__init__(timeout=300)
+        self.autor_id = autor_id
+        self.guild = guild
+        self.filtros = filtros
+        self.filtros_txt = filtros_txt
+        self.cursores: List[Optional[int]] = [None]  # antes_de_id de cada página já vista
+        self.eventos: List[Dict[str, Any]] = []
+
+    async def carregar(self) -> discord.Embed:
+        # Busca um a mais para saber se existe próxima página
+        eventos = await auditoria.buscar(self.guild.id, limite=BUSCA_POR_PAGINA + 1, antes_de_id=self.cursores[-1], **self.filtros)
+        self.eventos = eventos[:BUSCA_POR_PAGINA]
+        self.anterior.disabled = len(self.cursores) <= 1
+        self.proxima.disabled = len(eventos) <= BUSCA_POR_PAGINA
+        return _embed_busca(self.guild, self.eventos, len(self.cursores), self.filtros_txt)
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.autor_id:
+            await interaction.response.send_message("🚫 Apenas quem fez a busca pode navegar.", ephemeral=True)
+            return False
+        return True
+
+    @discord.ui.button(label="◀️ Anterior", style=discord.ButtonStyle.secondary)
+    async def anterior(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if len(self.cursores) > 1:
+            self.cursores.pop()
+        embed = await self.carregar()
+        await interaction.response.edit_message(embed=embed, view=self)
+
+    @discord.ui.button(label="Próxima ▶️", style=discord.ButtonStyle.secondary)
+    async def proxima(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if self.eventos:
+            self.cursores.append(self.eventos[-1]["id"])
+        embed = await self.carregar()
+        await interaction.response.edit_message(embed=embed, view=self)
+
+def teardown_mod_logs(bot):
+    # Recarga a quente: filas pendentes e caches do servidor central são mantidos
+    guardar_estado(
+        __name__,
+        _dispatcher=_dispatcher,
+        _categoria_central_id=_categoria_central_id,
+        _criacoes_centrais=_criacoes_centrais,
+    )
 
 async def setup_mod_logs(bot):
+    global _dispatcher, _categoria_central_id, _criacoes_centrais
+    estado = restaurar_estado(__name__)
+    _dispatcher = estado.get("_dispatcher", _dispatcher)
+    _categoria_central_id = estado.get("_categoria_central_id", _categoria_central_id)
+    _criacoes_centrais = estado.get("_criacoes_centrais", _criacoes_centrais)
+
+    obter_dispatcher(bot)
+    ipc.registrar_rota("logs_central", lambda dados: _receber_central(bot, dados))
+    metricas.medidor("lzim_logs_fila", "Embeds de log aguardando envio", lambda: obter_dispatcher(bot).profundidade())
+    metricas.medidor("lzim_logs_rajadas_ativas", "Ações em modo rajada (logs resumidos)", lambda: obter_dispatcher(bot).rajadas.em_rajada())
+    metricas.medidor("lzim_logs_webhook_429", "429 recebidos na entrega por webhook (acumulado)", lambda: entrega_webhook.stats["limitados"])
+
+    async def on_guild_channel_delete(channel: discord.abc.GuildChannel):
+        global _categoria_central_id
+        if channel.id == _categoria_central_id:
+            _categoria_central_id = None
+        configs.esquecer_canal(channel.id)
+
+    bot.add_listener(on_guild_channel_delete)
+
+    async def on_webhooks_update(channel: discord.abc.GuildChannel):
+        # Webhook do canal mudou (ex.: apagado manualmente): revalida no próximo envio
+        entrega_webhook.esquecer(channel.id)
+
+    bot.add_listener(on_webhooks_update)
+
+    @bot.tree.command(name="logs_buscar", description="(Admin) Pesquisa o histórico de logs deste servidor.")
+    @app_commands.describe(
+        usuario="Usuário (autor ou alvo da ação)",
+        moderador="Quem executou a ação",
+        acao="Parte do nome da ação (ex.: Ban, Ticket)",
+        dias="Somente os últimos N dias",
+        texto="Palavras nos detalhes"
+    )
+    async def logs_buscar(
+        interaction: discord.Interaction,
+        usuario: Optional[discord.User] = None,
+        moderador: Optional[discord.User] = None,
+        acao: Optional[str] = None,
+        dias: Optional[app_commands.Range[int, 1, 3650]] = None,
+        texto: Optional[str] = None
+    ):
+        if not interaction.guild or not interaction.user.guild_permissions.administrator:
+            await interaction.response.send_message("🚫 Apenas administradores podem usar este comando.", ephemeral=True)
+            return
+
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        filtros: Dict[str, Any] = {}
+        descricao = []
+        if usuario:
+            filtros["usuario_id"] = usuario.id
+            descricao.append(f"usuário {usuario.mention}")
+        if moderador:
+            filtros["moderador_id"] = moderador.id
+            descricao.append(f"moderador {moderador.mention}")
+        if acao:
+            filtros["acao"] = acao
+            descricao.append(f"ação `{acao}`")
+        if dias:
+            filtros["desde"] = (datetime.now(brasil) - timedelta(days=dias)).timestamp()
+            descricao.append(f"últimos {dias} dia(s)")
+        if texto:
+            filtros["texto"] = texto
+            descricao.append(f"texto `{texto}`")
+
+        view = BuscaLogsView(interaction.user.id, interaction.guild, filtros, " • ".join(descricao))
+        try:
+            embed = await view.carregar()
+        except Exception as e:
+            print("[/logs_buscar] erro:", e)
+            await interaction.followup.send("❌ Falha ao pesquisar os logs.", ephemeral=True)
+            return
+        await interaction.followup.send(embed=embed, view=view, ephemeral=True)
+
+    @bot.tree.command(name="logs_status", description="(Admin) Mostra a fila de envio dos logs.")
+    async def logs_status(interaction: discord.Interaction):
+        if not interaction.user.guild_permissions.administrator:
+            await interaction.response.send_message("🚫 Apenas administradores podem usar este comando.", ephemeral=True)
+            return
+
+        dados = obter_dispatcher(bot).resumo()
+        embed = base_embed("📊 Fila de logs")
+        embed.add_field(name="Na fila", value=str(dados["na_fila"]), inline=True)
+        embed.add_field(name="Pico da fila", value=str(dados["pico_fila"]), inline=True)
+        embed.add_field(name="Destinos ativos", value=str(dados["destinos_ativos"]), inline=True)
+        embed.add_field(name="Enfileirados", value=str(dados["enfileirados"]), inline=True)
+        embed.add_field(name="Descartados", value=str(dados["descartados"]), inline=True)
+        embed.add_field(name="Falhas", value=str(dados["falhas"]), inline=True)
+        embed.add_field(
+            name="Enviados",
+            value=f"{dados['embeds_enviadas']} embeds em {dados['mensagens_enviadas']} mensagens",
+            inline=False
+        )
+        embed.add_field(
+            name="Rajadas",
+            value=(
+                f"Ativas: {dados['em_rajada']} • Detectadas: {dados['rajadas']}\n"
+                f"Eventos agrupados: {dados['eventos_agrupados']} • Resumos: {dados['resumos_enviados']}\n"
+                f"Limiar: {config.LOGS_RAJADA_LIMIAR} eventos / {config.LOGS_RAJADA_JANELA_SEG}s"
+            ),
+            inline=False
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
     @bot.tree.command(name="logs", description="Ativa/desativa sistema de logs locais (apenas admins)")
     @app_commands.describe(ativar="True para ativar logs locais, False para desativar")
     async def logs_comando(interaction: discord.Interaction, ativar: bool):
@@ -119,11 +538,12 @@ async def setup_mod_logs(bot):
 
         await interaction.response.defer(thinking=True)
         guild = interaction.guild
-        guild_id_str = str(guild.id)
-        logs_config = carregar_logs_config()
+        canal_id = configs.obter(guild.id, "logs_canal_id")
+        canal_log = guild.get_channel(canal_id) if canal_id else None
+        if not isinstance(canal_log, discord.TextChannel):
+            canal_log = discord.utils.get(guild.text_channels, name=config.NOME_CANAL_LOG_OPCIONAL)
 
         if ativar:
-            canal_log = discord.utils.get(guild.text_channels, name=config.NOME_CANAL_LOG_OPCIONAL)
             if not canal_log:
                 # @everyone não vê | administradores veem
                 overwrites = {
@@ -140,15 +560,13 @@ async def setup_mod_logs(bot):
                     reason="Ativando logs locais"
                 )
 
-            logs_config[guild_id_str] = {"ativado": True, "canal_id": canal_log.id}
-            salvar_logs_config(logs_config)
+            configs.definir(guild.id, "logs_ativado", True)
+            configs.definir(guild.id, "logs_canal_id", canal_log.id)
             await interaction.followup.send(f"✅ Logs locais **ativadas**. Canal: {canal_log.mention}")
         else:
-            if guild_id_str in logs_config:
-                logs_config[guild_id_str]["ativado"] = False
-                salvar_logs_config(logs_config)
+            configs.definir(guild.id, "logs_ativado", False)
+            configs.remover(guild.id, "logs_canal_id")
 
-            canal_log = discord.utils.get(guild.text_channels, name=config.NOME_CANAL_LOG_OPCIONAL)
             if canal_log:
                 try:
                     await canal_log.delete(reason="Logs locais desativadas")
@@ -1,12 +1,19 @@
 # mod_moderacao.py
 import re
 from datetime import timedelta
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+from ban_em_massa import extrair_ids, ler_anexo, rodar_ban_em_massa
+from cache_membros import obter_membro
+from config_servidores import configs
+from diff_permissoes import SEM_MUDANCA, aplicar_overwrites
+from execucao_em_massa import acompanhar, executar_com_progresso, mostrar_final
+from limpeza import FiltroLimpeza, Limpeza, periodo
+
 # Logs (opcional)
 try:
     from mod_logs import registrar_log
@@ -40,6 +47,86 @@ async def _log(bot: commands.Bot, guild: discord.Guild, acao: str, autor: discor
         except Exception:
             pass
 
+
+# ========= Limpeza de mensagens =========
+
+VARRER_PADRAO_FILTRADO = 5000   # com filtros, quantas mensagens olhar se o usuário não disser
+
+async def _rodar_limpeza(inter: discord.Interaction, filtro: FiltroLimpeza, quantidade: int,
+                         varrer: Optional[int], motivo: str, acao_log: str,
+                         alvo: Optional[discord.abc.User] = None):
+    """Roda a limpeza no canal da interação (já deferida) com progresso ao vivo e registra um log."""
+    if filtro.precisa_conteudo and not inter.client.intents.message_content:
+        return await inter.followup.send(
+            "⚠️ Filtros de **regex/links/anexos** leem o conteúdo das mensagens e precisam do intent "
+            "`message_content` (`INTENTS_EXTRAS=message_content` + ativar no portal do Discord).", ephemeral=True)
+    if varrer is None:
+        varrer = quantidade if filtro.vazio and not (filtro.depois or filtro.antes) else max(quantidade, VARRER_PADRAO_FILTRADO)
+    canal = inter.channel
+    limpeza = Limpeza(canal, filtro, limite_apagar=quantidade, limite_varrer=varrer,  # type: ignore[arg-type]
+                      reason=f"{acao_log} por {inter.user}")
+    titulo = f"{acao_log} em #{getattr(canal, 'name', '?')}"
+    _, msg = await acompanhar(inter, limpeza, limpeza.executar(), lambda: limpeza.embed(titulo))
+    await mostrar_final(inter, msg, limpeza.embed(titulo))
+    # "Alvo: ... (id)" é o que a auditoria indexa para o /logs_buscar por alvo
+    linha_alvo = ""
+    if filtro.autor_id:
+        linha_alvo = f"Alvo: {alvo or f'<@{filtro.autor_id}>'} ({filtro.autor_id})\n"
+    await _log(inter.client, inter.guild, acao_log, inter.user,  # type: ignore
+               linha_alvo + f"Canal: {getattr(canal, 'mention', '#?')}\nFiltros: {filtro.descrever()}\n"
+               f"Varridas: {limpeza.varridas} • Apagadas: {limpeza.apagadas}"
+               + (f" • Falhas: {limpeza.falhas}" if limpeza.falhas else "")
+               + (" • ⏹️ cancelada" if limpeza.cancelado else "") + f"\nMotivo: {motivo}")
+
+def _canais_varredura(guild: discord.Guild) -> List[discord.abc.Messageable]:
+    """Canais de texto e threads ativas onde o bot consegue ler o histórico e apagar."""
+    canais = []
+    for canal in [*guild.text_channels, *guild.threads]:
+        perms = canal.permissions_for(guild.me)
+        if perms.view_channel and perms.read_message_history and perms.manage_messages:
+            canais.append(canal)
+    return canais
+
+
+# ========= Lockdown (servidor inteiro) =========
+
+# guild_settings.json: {"canais": {canal_id: [allow, deny] | None}, "por": user_id, "motivo": str}
+# None = o canal não tinha overwrite de @everyone (o fim do lockdown remove o que foi criado)
+CHAVE_LOCKDOWN = "lockdown"
+
+PERMS_LOCKDOWN = dict(
+    send_messages=False, send_messages_in_threads=False,
+    create_public_threads=False, create_private_threads=False,
+)
+
+def _canais_lockdown(guild: discord.Guild) -> List[discord.abc.GuildChannel]:
+    # A API não repassa overwrites da categoria para os canais já existentes, então
+    # cada canal é editado; a categoria também é trancada para que canais criados
+    # ou sincronizados durante o lockdown já nasçam trancados.
+    return [*guild.categories, *guild.text_channels]
+
+def _everyone_atual(canal: discord.abc.GuildChannel) -> Optional[List[int]]:
+    for alvo, ow in canal.overwrites.items():
+        if alvo.id == canal.guild.id:
+            allow, deny = ow.pair()
+            return [allow.value, deny.value]
+    return None
+
+def _overwrites_com_everyone(canal: discord.abc.GuildChannel, par: Optional[List[int]]) -> Dict[Any, discord.PermissionOverwrite]:
+    """Overwrites atuais do canal com o de @everyone trocado pelo par (allow, deny), ou removido se None."""
+    overwrites = {alvo: ow for alvo, ow in canal.overwrites.items() if alvo.id != canal.guild.id}
+    if par is not None:
+        overwrites[canal.guild.default_role] = discord.PermissionOverwrite.from_pair(
+            discord.Permissions(par[0]), discord.Permissions(par[1])
+        )
+    return overwrites
+
+def _overwrites_trancado(canal: discord.abc.GuildChannel) -> Dict[Any, discord.PermissionOverwrite]:
+    atual = canal.overwrites_for(canal.guild.default_role)
+    atual.update(**PERMS_LOCKDOWN)
+    allow, deny = atual.pair()
+    return _overwrites_com_everyone(canal, [allow.value, deny.value])
+
 # ========= Setup =========
 
 async def setup_mod_moderacao(bot: commands.Bot):
@@ -80,7 +167,7 @@ async def setup_mod_moderacao(bot: commands.Bot):
             if not uid:
                 return await inter.followup.send("⚠️ Informe uma **menção** ou **ID** válido.", ephemeral=True)
 
-            membro = inter.guild.get_member(uid)
+            membro = await obter_membro(inter.guild, uid)
             if membro and membro.top_role >= inter.guild.me.top_role:  # type: ignore
                 return await inter.followup.send("❌ Não posso banir: cargo do alvo é igual/maior que o meu.", ephemeral=True)
 
@@ -92,6 +179,42 @@ async def setup_mod_moderacao(bot: commands.Bot):
             print("[/ban] erro:", e)
             await inter.followup.send("❌ Falha ao banir.", ephemeral=True)
 
+    # ----- /massban -----
+    @tree.command(name="massban", description="Bane vários usuários de uma vez (IDs, menções ou arquivo .txt).")
+    @app_commands.describe(
+        ids="IDs ou menções separados por espaço, vírgula ou linha",
+        arquivo="Arquivo de texto com os IDs (opcional, soma com o campo ids)",
+        deletar_horas="Deletar mensagens antigas (0–168h)",
+        motivo="Motivo (opcional)",
+    )
+    async def massban_cmd(
+        inter: discord.Interaction,
+        ids: Optional[str] = None,
+        arquivo: Optional[discord.Attachment] = None,
+        deletar_horas: app_commands.Range[int, 0, 168] = 0,
+        motivo: str = "—",
+    ):
+        if not _mod_perms_ok(inter.user, "ban"):  # type: ignore
+            return await inter.response.send_message("🚫 Você precisa de **Banir Membros**.", ephemeral=True)
+        await inter.response.defer(ephemeral=True, thinking=True)
+        try:
+            texto = ids or ""
+            if arquivo:
+                texto += "\n" + await ler_anexo(arquivo)
+        except Exception as e:
+            return await inter.followup.send(f"⚠️ Não consegui ler o arquivo: {e}", ephemeral=True)
+        alvos = extrair_ids(texto)
+        if not alvos:
+            return await inter.followup.send("⚠️ Nenhum **ID** ou **menção** válido encontrado.", ephemeral=True)
+        try:
+            ban = await rodar_ban_em_massa(inter, alvos, motivo, deletar_horas * 3600)
+        except Exception as e:
+            print("[/massban] erro:", e)
+            return await inter.followup.send("❌ Falha no ban em massa.", ephemeral=True)
+        if ban:
+            await _log(inter.client, inter.guild, "Ban em massa", inter.user,  # type: ignore
+                       ban.detalhes_log() + f"\nApagar: {deletar_horas}h")
+
     # ----- /unban -----
     @tree.command(name="unban", description="Desbane um usuário pelo ID.")
     @app_commands.describe(user_id="ID do usuário a desbanir")
@@ -142,38 +265,132 @@ async def setup_mod_moderacao(bot: commands.Bot):
             await inter.followup.send("❌ Falha ao remover timeout.", ephemeral=True)
 
     # ----- /clear (limpar mensagens) -----
-    @tree.command(name="clear", description="Apaga mensagens em massa.")
-    @app_commands.describe(quantidade="Quantas mensagens apagar (1–200)", motivo="Motivo (opcional)")
-    async def clear_cmd(inter: discord.Interaction, quantidade: int, motivo: str = "—"):
+    @tree.command(name="clear", description="Apaga mensagens em massa (com filtros opcionais).")
+    @app_commands.describe(
+        quantidade="Quantas mensagens apagar (1–100000)",
+        usuario="Só mensagens deste usuário",
+        regex="Só mensagens cujo texto casa com este padrão",
+        anexos="Só mensagens com anexo",
+        bots="Só mensagens de bots",
+        links="Só mensagens com links",
+        desde="Só mensagens mais novas que isso (ex.: 2h, 3d)",
+        ate="Só mensagens mais velhas que isso (ex.: 30m)",
+        varrer="Quantas mensagens olhar no máximo (padrão: quantidade, ou 5000 com filtros)",
+        motivo="Motivo (opcional)",
+    )
+    async def clear_cmd(
+        inter: discord.Interaction,
+        quantidade: app_commands.Range[int, 1, 100000],
+        usuario: Optional[discord.User] = None,
+        regex: Optional[str] = None,
+        anexos: bool = False,
+        bots: bool = False,
+        links: bool = False,
+        desde: Optional[str] = None,
+        ate: Optional[str] = None,
+        varrer: Optional[app_commands.Range[int, 1, 1000000]] = None,
+        motivo: str = "—",
+    ):
         if not _mod_perms_ok(inter.user, "manage_messages"):  # type: ignore
             return await inter.response.send_message("🚫 Você precisa de **Gerenciar Mensagens**.", ephemeral=True)
+        try:
+            filtro = FiltroLimpeza(autor_id=usuario.id if usuario else None, regex=regex, com_anexo=anexos,
+                                   so_bots=bots, com_links=links, depois=periodo(desde), antes=periodo(ate))
+        except (ValueError, re.error) as e:
+            return await inter.response.send_message(f"⚠️ Filtro inválido: {e}", ephemeral=True)
         await inter.response.defer(ephemeral=True, thinking=True)
         try:
-            quantidade = max(1, min(200, quantidade))
-            deleted = await inter.channel.purge(limit=quantidade)  # type: ignore
-            await inter.followup.send(f"🧹 Apaguei **{len(deleted)}** mensagens.", ephemeral=True)
-            await _log(inter.client, inter.guild, "Clear", inter.user, f"Canal: {getattr(inter.channel, 'mention', '#?')}\nQtd: {len(deleted)}\nMotivo: {motivo}")  # type: ignore
+            await _rodar_limpeza(inter, filtro, quantidade, varrer, motivo, "Clear", alvo=usuario)
         except Exception as e:
             print("[/clear] erro:", e)
             await inter.followup.send("❌ Falha ao apagar mensagens.", ephemeral=True)
 
     # ----- /clear_user (apaga mensagens de um usuário) -----
-    @tree.command(name="clear_user", description="Apaga mensagens recentes de um usuário neste canal.")
-    @app_commands.describe(usuario="Quem limpar", quantidade="Quantas buscar (1–200)", motivo="Motivo (opcional)")
-    async def clear_user_cmd(inter: discord.Interaction, usuario: discord.Member, quantidade: int = 50, motivo: str = "—"):
+    @tree.command(name="clear_user", description="Apaga mensagens de um usuário neste canal.")
+    @app_commands.describe(
+        usuario="Quem limpar",
+        quantidade="Quantas mensagens dele apagar (1–100000)",
+        varrer="Quantas mensagens do canal olhar no máximo (padrão 5000)",
+        motivo="Motivo (opcional)",
+    )
+    async def clear_user_cmd(
+        inter: discord.Interaction,
+        usuario: discord.User,
+        quantidade: app_commands.Range[int, 1, 100000] = 50,
+        varrer: Optional[app_commands.Range[int, 1, 1000000]] = None,
+        motivo: str = "—",
+    ):
         if not _mod_perms_ok(inter.user, "manage_messages"):  # type: ignore
             return await inter.response.send_message("🚫 Você precisa de **Gerenciar Mensagens**.", ephemeral=True)
         await inter.response.defer(ephemeral=True, thinking=True)
         try:
-            quantidade = max(1, min(200, quantidade))
-            def is_user(m: discord.Message): return m.author.id == usuario.id
-            deleted = await inter.channel.purge(limit=quantidade, check=is_user)  # type: ignore
-            await inter.followup.send(f"🧽 Apaguei **{len(deleted)}** mensagens de {usuario.mention}.", ephemeral=True)
-            await _log(inter.client, inter.guild, "Clear User", inter.user, f"Canal: {getattr(inter.channel, 'mention', '#?')}\nAlvo: {usuario} ({usuario.id})\nQtd: {len(deleted)}\nMotivo: {motivo}")  # type: ignore
+            await _rodar_limpeza(inter, FiltroLimpeza(autor_id=usuario.id), quantidade, varrer, motivo, "Clear User",
+                                 alvo=usuario)
         except Exception as e:
             print("[/clear_user] erro:", e)
             await inter.followup.send("❌ Falha ao apagar mensagens do usuário.", ephemeral=True)
 
+    # ----- /limpar_usuario_servidor (todos os canais) -----
+    @tree.command(name="limpar_usuario_servidor", description="Apaga as mensagens recentes de um usuário em todos os canais e threads.")
+    @app_commands.describe(
+        usuario="Quem limpar",
+        varrer_por_canal="Quantas mensagens olhar em cada canal (1–10000, padrão 500)",
+        desde="Só mensagens mais novas que isso (ex.: 2h, 1d)",
+        motivo="Motivo (opcional)",
+    )
+    async def limpar_usuario_servidor_cmd(
+        inter: discord.Interaction,
+        usuario: discord.User,
+        varrer_por_canal: app_commands.Range[int, 1, 10000] = 500,
+        desde: Optional[str] = None,
+        motivo: str = "—",
+    ):
+        if not _mod_perms_ok(inter.user, "manage_messages"):  # type: ignore
+            return await inter.response.send_message("🚫 Você precisa de **Gerenciar Mensagens**.", ephemeral=True)
+        try:
+            filtro = FiltroLimpeza(autor_id=usuario.id, depois=periodo(desde))
+        except ValueError as e:
+            return await inter.response.send_message(f"⚠️ Período inválido: {e}", ephemeral=True)
+        await inter.response.defer(ephemeral=True, thinking=True)
+        canais = _canais_varredura(inter.guild)  # type: ignore
+        if not canais:
+            return await inter.followup.send("❌ Não tenho acesso a nenhum canal para limpar.", ephemeral=True)
+
+        # Cada canal é uma limpeza em streaming; o executor limita quantas rodam juntas e recua em 429
+        ativas: set = set()
+        totais = {"varridas": 0, "apagadas": 0}
+
+        async def limpar(canal) -> tuple:
+            limpeza = Limpeza(canal, filtro, limite_apagar=varrer_por_canal, limite_varrer=varrer_por_canal,
+                              reason=f"Limpeza de {usuario} por {inter.user}")
+            ativas.add(limpeza)
+            try:
+                await limpeza.executar()
+            finally:
+                ativas.discard(limpeza)
+                totais["varridas"] += limpeza.varridas
+                totais["apagadas"] += limpeza.apagadas
+            if limpeza.falhas:
+                raise RuntimeError(f"{limpeza.apagadas} apagadas, {limpeza.falhas} falharam")
+            detalhe = f"{limpeza.apagadas} de {limpeza.varridas}" + (" (interrompida)" if limpeza.cancelado else "")
+            return ("alterado" if limpeza.apagadas else "sem_mudanca", detalhe)
+
+        def parar_ativas():
+            for limpeza in list(ativas):
+                limpeza.cancelar()
+
+        execucao = await executar_com_progresso(
+            inter, f"Limpando {usuario} em {len(canais)} canal(is)", canais, limpar,
+            rotulo=lambda c: c.mention, ao_cancelar=parar_ativas,
+            resumo_extra=lambda: f"🔎 Varridas: **{totais['varridas']}** • 🧹 Apagadas: **{totais['apagadas']}**"
+        )
+        contagem = execucao.contagem()
+        await _log(inter.client, inter.guild, "Limpeza de usuário (servidor)", inter.user,  # type: ignore
+                   f"Alvo: {usuario} ({usuario.id})\nCanais: {len(canais)} • com mensagens: {contagem['alterado']}"
+                   f" • ❌ {contagem['falha']} falha(s)" + (f" • ⏹️ {contagem['cancelado']} cancelado(s)" if contagem["cancelado"] else "")
+                   + f"\nVarridas: {totais['varridas']} • Apagadas: {totais['apagadas']}"
+                   + (f"\nDesde: {desde}" if desde else "") + f"\nMotivo: {motivo}")
+
     # ----- /lock (bloqueia canal) -----
     @tree.command(name="lock", description="Bloqueia o canal (membros não podem enviar mensagens).")
     async def lock_cmd(inter: discord.Interaction):
@@ -186,7 +403,8 @@ async def setup_mod_moderacao(bot: commands.Bot):
             default = overw.get(inter.guild.default_role, discord.PermissionOverwrite())  # type: ignore
             default.send_messages = False
             overw[inter.guild.default_role] = default  # type: ignore
-            await ch.edit(overwrites=overw, reason=f"Lock por {inter.user}")
+            if await aplicar_overwrites(ch, overw, reason=f"Lock por {inter.user}") == SEM_MUDANCA:
+                return await inter.followup.send("🔒 O canal já estava **bloqueado**.", ephemeral=True)
             await inter.followup.send("🔒 Canal **bloqueado** (somente Staff pode falar).", ephemeral=True)
             await _log(inter.client, inter.guild, "Lock canal", inter.user, f"Canal: {ch.mention}")  # type: ignore
         except Exception as e:
@@ -205,13 +423,93 @@ async def setup_mod_moderacao(bot: commands.Bot):
             default = overw.get(inter.guild.default_role, discord.PermissionOverwrite())  # type: ignore
             default.send_messages = True
             overw[inter.guild.default_role] = default  # type: ignore
-            await ch.edit(overwrites=overw, reason=f"Unlock por {inter.user}")
+            if await aplicar_overwrites(ch, overw, reason=f"Unlock por {inter.user}") == SEM_MUDANCA:
+                return await inter.followup.send("🔓 O canal já estava **desbloqueado**.", ephemeral=True)
             await inter.followup.send("🔓 Canal **desbloqueado**.", ephemeral=True)
             await _log(inter.client, inter.guild, "Unlock canal", inter.user, f"Canal: {ch.mention}")  # type: ignore
         except Exception as e:
             print("[/unlock] erro:", e)
             await inter.followup.send("❌ Falha ao desbloquear canal.", ephemeral=True)
 
+    # ----- /lockdown (servidor inteiro) -----
+    @tree.command(name="lockdown", description="Tranca todos os canais de texto (guarda o estado atual para o /lockdown_fim).")
+    @app_commands.describe(motivo="Motivo (opcional)")
+    async def lockdown_cmd(inter: discord.Interaction, motivo: str = "—"):
+        if not _mod_perms_ok(inter.user, "manage_channels"):  # type: ignore
+            return await inter.response.send_message("🚫 Você precisa de **Gerenciar Canais**.", ephemeral=True)
+        await inter.response.defer(thinking=True)
+        guild = inter.guild
+        foto = configs.obter(guild.id, CHAVE_LOCKDOWN) or {"canais": {}, "por": inter.user.id, "motivo": motivo}  # type: ignore
+        canais = _canais_lockdown(guild)  # type: ignore
+        if not canais:
+            return await inter.followup.send("❌ Não tenho acesso a nenhum canal para trancar.")
+
+        # Lockdown já ativo: a foto só ganha os canais novos (os outros guardam o estado de antes do
+        # primeiro /lockdown), mas todos são trancados de novo: quem falhou ou foi cancelado é refeito
+        # e quem já está trancado sai como "sem mudança", sem chamada à API.
+        novos = {str(c.id): _everyone_atual(c) for c in canais if str(c.id) not in foto["canais"]}
+        if novos:
+            # Foto no disco antes de mexer em qualquer canal: o /lockdown_fim precisa dela mesmo após um reinício
+            foto = {**foto, "canais": {**foto["canais"], **novos}}
+            configs.definir(guild.id, CHAVE_LOCKDOWN, foto)  # type: ignore
+            try:
+                await configs.salvar_agora()
+            except Exception as e:
+                print("[/lockdown] erro ao salvar foto:", e)
+                if len(foto["canais"]) == len(novos):   # foto nova: não fica lockdown "ativo" sem canal trancado
+                    configs.remover(guild.id, CHAVE_LOCKDOWN)  # type: ignore
+                return await inter.followup.send("❌ Não consegui salvar o estado atual dos canais; nada foi alterado.")
+
+        async def trancar(canal: discord.abc.GuildChannel) -> str:
+            return await aplicar_overwrites(canal, _overwrites_trancado(canal), reason=f"Lockdown por {inter.user}")
+
+        execucao = await executar_com_progresso(
+            inter, f"Lockdown em {len(canais)} canal(is)", canais, trancar,
+            rotulo=lambda c: c.mention, ephemeral=False
+        )
+        contagem = execucao.contagem()
+        await _log(inter.client, guild, "Lockdown", inter.user,  # type: ignore
+                   f"Motivo: {motivo}\nCanais: {len(canais)} • ✅ {contagem['alterado']} trancado(s) • "
+                   f"➖ {contagem['sem_mudanca']} já estavam • ❌ {contagem['falha']} falha(s)"
+                   + (f" • ⏹️ {contagem['cancelado']} cancelado(s)" if contagem["cancelado"] else ""))
+
+    # ----- /lockdown_fim -----
+    @tree.command(name="lockdown_fim", description="Encerra o lockdown devolvendo cada canal ao estado de antes.")
+    async def lockdown_fim_cmd(inter: discord.Interaction):
+        if not _mod_perms_ok(inter.user, "manage_channels"):  # type: ignore
+            return await inter.response.send_message("🚫 Você precisa de **Gerenciar Canais**.", ephemeral=True)
+        guild = inter.guild
+        foto = configs.obter(guild.id, CHAVE_LOCKDOWN)  # type: ignore
+        if not foto:
+            return await inter.response.send_message("ℹ️ Não há lockdown ativo neste servidor.", ephemeral=True)
+        await inter.response.defer(thinking=True)
+
+        itens = []
+        for cid, par in foto["canais"].items():
+            canal = guild.get_channel(int(cid))  # type: ignore
+            if canal is not None:   # canal apagado durante o lockdown: nada a restaurar
+                itens.append((canal, par))
+
+        async def restaurar(item) -> str:
+            canal, par = item
+            return await aplicar_overwrites(canal, _overwrites_com_everyone(canal, par), reason=f"Fim do lockdown por {inter.user}")
+
+        execucao = await executar_com_progresso(
+            inter, f"Fim do lockdown em {len(itens)} canal(is)", itens, restaurar,
+            rotulo=lambda item: item[0].mention, ephemeral=False
+        )
+        # Falhas e cancelados continuam na foto: rodar de novo tenta só esses
+        pendentes = {str(r.item[0].id): r.item[1] for r in execucao.resultados if r.status in ("falha", "cancelado")}
+        if pendentes:
+            configs.definir(guild.id, CHAVE_LOCKDOWN, {**foto, "canais": pendentes})  # type: ignore
+        else:
+            configs.remover(guild.id, CHAVE_LOCKDOWN)  # type: ignore
+        contagem = execucao.contagem()
+        await _log(inter.client, guild, "Fim do lockdown", inter.user,  # type: ignore
+                   f"Canais: {len(itens)} • ✅ {contagem['alterado']} restaurado(s) • "
+                   f"➖ {contagem['sem_mudanca']} sem mudança • ❌ {contagem['falha']} falha(s)"
+                   + (f"\n⚠️ {len(pendentes)} canal(is) ainda pendentes: rode `/lockdown_fim` de novo" if pendentes else ""))
+
     # ----- /slowmode -----
     @tree.command(name="slowmode", description="Define slowmode do canal (segundos). Use 0 para desativar.")
     @app_commands.describe(segundos="0–21600 (6h)")
@@ -7,8 +7,6 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
-import yt_dlp
-
 # Integra com logs se existir
 try:
     from mod_logs import registrar_log
@@ -66,8 +64,21 @@ async def _get_or_join_vc(interaction: discord.Interaction) -> discord.VoiceClie
 
     raise MusicError("Entre numa call de voz ou crie uma chamada chamada **Músicas**.")
 
+_yt_dlp = None
+
+def _ytdlp():
+    # yt_dlp é pesado: só é importado no primeiro /play (já dentro da thread de extração)
+    global _yt_dlp
+    if _yt_dlp is None:
+        try:
+            import yt_dlp
+        except ImportError:
+            raise MusicError("yt-dlp não está instalado. Instale com `pip install yt-dlp` e reinicie.")
+        _yt_dlp = yt_dlp
+    return _yt_dlp
+
 def _extract_stream(url_or_query: str) -> tuple[str, dict]:
-    with yt_dlp.YoutubeDL(YTDLP_OPTS) as ydl:
+    with _ytdlp().YoutubeDL(YTDLP_OPTS) as ydl:
         info = ydl.extract_info(url_or_query, download=False)
         if "entries" in info:
             info = info["entries"][0]
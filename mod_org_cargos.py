@@ -3,41 +3,23 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 
-# Nomes de cargos VIP reconhecidos pelo sistema
-CARGOS_VIP = {
-    "🔥SUPER VIP",
-    "💎VIP DIAMANTE", 
-    "🐸VIP SAPO",
-    "💜VIP GALÁTICO",
-    "🪙Vip"
-}
-
-CARGOS_VIP_MUSICA = {
-    "🔥SUPER VIP",
-    "💎VIP DIAMANTE",
-    "💜VIP GALÁTICO"
-}
+from indice_cargos import CLASSES, NOMES_PADRAO, indice_cargos
+
+# Nomes padrão dos cargos VIP (cada servidor pode trocar com /configurar_classes_cargos)
+CARGOS_VIP = NOMES_PADRAO["vip"]
+CARGOS_VIP_MUSICA = NOMES_PADRAO["vip_musica"]
 
 def eh_vip(member: discord.Member) -> bool:
     """Verifica se o membro possui algum cargo VIP."""
-    for role in member.roles:
-        if role.name in CARGOS_VIP:
-            return True
-    return False
+    return indice_cargos.membro_eh(member, "vip")
 
 def eh_vip_musica(member: discord.Member) -> bool:
     """Verifica se o membro pode usar comandos de música (VIP GALÁTICO, DIAMANTE ou SUPER VIP)."""
-    for role in member.roles:
-        if role.name in CARGOS_VIP_MUSICA:
-            return True
-    return False
+    return indice_cargos.membro_eh(member, "vip_musica")
 
 def eh_super_vip(member: discord.Member) -> bool:
     """Verifica se o membro é SUPER VIP."""
-    for role in member.roles:
-        if role.name == "🔥SUPER VIP":
-            return True
-    return False
+    return indice_cargos.membro_eh(member, "super_vip")
 
 async def setup_mod_org_cargos(bot: commands.Bot):
 
@@ -219,3 +201,36 @@ async def setup_mod_org_cargos(bot: commands.Bot):
         msg += "💡 *Os cargos foram reorganizados por quantidade de permissões (mais permissões = mais alto).*"
 
         await inter.followup.send(msg, ephemeral=True)
+
+    @bot.tree.command(name="configurar_classes_cargos", description="(Admin) Define quais nomes de cargo contam como Staff, VIP etc. neste servidor.")
+    @app_commands.describe(
+        classe="Classe de cargo a configurar.",
+        nomes="Nomes dos cargos separados por vírgula (vazio = só mostrar; \"padrao\" = voltar ao padrão)."
+    )
+    @app_commands.choices(
+        classe=[app_commands.Choice(name=c, value=c) for c in CLASSES]
+    )
+    @app_commands.checks.has_permissions(administrator=True)
+    async def configurar_classes_cargos(
+        inter: discord.Interaction,
+        classe: app_commands.Choice[str],
+        nomes: str = ""
+    ):
+        guild = inter.guild
+        if not guild:
+            return await inter.response.send_message("❌ Este comando só pode ser usado dentro de um servidor.", ephemeral=True)
+
+        nomes = nomes.strip()
+        if nomes.lower() == "padrao":
+            indice_cargos.definir_nomes(guild.id, classe.value, None)
+        elif nomes:
+            indice_cargos.definir_nomes(guild.id, classe.value, nomes.split(","))
+
+        atuais = sorted(indice_cargos.nomes(guild.id)[classe.value])
+        encontrados = [guild.get_role(rid) for rid in indice_cargos.cargos(guild, classe.value)]
+        msg = f"🏷️ **Classe `{classe.value}`**\n"
+        msg += "📝 **Nomes:** " + (", ".join(f"`{n}`" for n in atuais) or "*nenhum*") + "\n"
+        if classe.value == "admin":
+            msg += "🔒 *Cargos com a permissão Administrador sempre contam como admin.*\n"
+        msg += "✅ **Cargos neste servidor:** " + (", ".join(r.mention for r in encontrados if r) or "*nenhum*")
+        await inter.response.send_message(msg, ephemeral=True, allowed_mentions=discord.AllowedMentions.none())
@@ -4,6 +4,10 @@ from discord.ext import commands
 from discord import app_commands
 from typing import Optional
 
+from ban_em_massa import extrair_ids, rodar_ban_em_massa
+from cache_membros import obter_membro
+from indice_cargos import NOMES_PADRAO, indice_cargos
+
 # Integração com logs (opcional)
 try:
     from mod_logs import registrar_log
@@ -11,19 +15,13 @@ except Exception:
     registrar_log = None
 
 # Cargos que podem USAR o painel (além de Administrador)
-STAFF_ROLE_NAMES = {"staff", "moderador", "moderators", "staff team", "admin", "adm"}
+STAFF_ROLE_NAMES = NOMES_PADRAO["staff"]
 
 def _tem_permissao(inter: discord.Interaction) -> bool:
     """Quem pode usar os botões do painel."""
     if not inter.guild or not isinstance(inter.user, discord.Member):
         return False
-    m: discord.Member = inter.user
-    if m.guild_permissions.administrator:
-        return True
-    for r in m.roles:
-        if r.name.lower() in STAFF_ROLE_NAMES:
-            return True
-    return False
+    return indice_cargos.membro_eh(inter.user, "admin", "staff")
 
 # -------------------------
 # Modais (coleta de dados)
@@ -47,7 +45,7 @@ class BanModal(discord.ui.Modal, title="Banir usuário"):
             uid = int(str(self.user_id).strip())
             motivo = str(self.motivo).strip() or f"Banido por {self.invocador} via painel."
 
-            membro = inter.guild.get_member(uid)
+            membro = await obter_membro(inter.guild, uid)
             if membro and (membro.top_role >= inter.guild.me.top_role):
                 return await inter.followup.send("❌ Não posso banir: cargo do alvo é igual/maior que o meu.", ephemeral=True)
 
@@ -61,6 +59,39 @@ class BanModal(discord.ui.Modal, title="Banir usuário"):
             print("[PainelAdmin] Ban erro:", e)
 
 
+class MassBanModal(discord.ui.Modal, title="Ban em massa"):
+    ids = discord.ui.TextInput(label="IDs ou menções", style=discord.TextStyle.paragraph,
+                               placeholder="Um por linha, ou separados por espaço/vírgula", required=True, max_length=4000)
+    motivo = discord.ui.TextInput(label="Motivo (opcional)", style=discord.TextStyle.paragraph, required=False, max_length=300)
+
+    def __init__(self, invocador: discord.Member):
+        super().__init__()
+        self.invocador = invocador
+
+    async def on_submit(self, inter: discord.Interaction):
+        if not _tem_permissao(inter):
+            return await inter.response.send_message("🚫 Sem permissão.", ephemeral=True)
+        if not inter.guild:
+            return await inter.response.send_message("❌ Use no servidor.", ephemeral=True)
+        perms = inter.user.guild_permissions  # type: ignore
+        if not (perms.ban_members or perms.administrator):
+            return await inter.response.send_message("🚫 Ban em massa exige **Banir Membros**.", ephemeral=True)
+
+        alvos = extrair_ids(str(self.ids))
+        if not alvos:
+            return await inter.response.send_message("⚠️ Nenhum **ID** ou **menção** válido encontrado.", ephemeral=True)
+        await inter.response.defer(ephemeral=True, thinking=True)
+        try:
+            motivo = str(self.motivo).strip() or f"Banido por {self.invocador} via painel."
+            ban = await rodar_ban_em_massa(inter, alvos, motivo)
+            if ban and registrar_log:
+                await registrar_log(inter.client, inter.guild, "Ban em massa (Painel)", inter.user,
+                                    detalhes=ban.detalhes_log(), moderador=inter.user)
+        except Exception as e:
+            await inter.followup.send("❌ Falha no ban em massa. Verifique IDs e permissões.", ephemeral=True)
+            print("[PainelAdmin] Ban em massa erro:", e)
+
+
 class KickModal(discord.ui.Modal, title="Expulsar usuário"):
     user_id = discord.ui.TextInput(label="ID do usuário", required=True, min_length=5, max_length=25)
     motivo = discord.ui.TextInput(label="Motivo (opcional)", style=discord.TextStyle.paragraph, required=False, max_length=300)
@@ -80,7 +111,7 @@ class KickModal(discord.ui.Modal, title="Expulsar usuário"):
             uid = int(str(self.user_id).strip())
             motivo = str(self.motivo).strip() or f"Expulso por {self.invocador} via painel."
 
-            membro = inter.guild.get_member(uid)
+            membro = await obter_membro(inter.guild, uid)
             if not membro:
                 return await inter.followup.send("❌ Membro não encontrado no servidor.", ephemeral=True)
             if membro.top_role >= inter.guild.me.top_role:
@@ -116,7 +147,7 @@ class TimeoutModal(discord.ui.Modal, title="Castigo (Timeout)"):
             from datetime import timedelta
             uid = int(str(self.user_id).strip())
             mins = max(1, int(str(self.minutos).strip()))
-            membro = inter.guild.get_member(uid)
+            membro = await obter_membro(inter.guild, uid)
             if not membro:
                 return await inter.followup.send("❌ Membro não encontrado.", ephemeral=True)
             if membro.top_role >= inter.guild.me.top_role:
@@ -156,7 +187,7 @@ class RoleModal(discord.ui.Modal, title="Gerenciar cargo (add/remove)"):
             acao = str(self.acao).strip().lower()
             motivo = str(self.motivo).strip() or f"Gerenciar cargo por {self.invocador} via painel."
 
-            membro = inter.guild.get_member(uid)
+            membro = await obter_membro(inter.guild, uid)
             cargo = inter.guild.get_role(rid)
             if not membro or not cargo:
                 return await inter.followup.send("❌ Membro ou cargo inválido.", ephemeral=True)
@@ -255,6 +286,10 @@ class PainelAdminView(discord.ui.View):
     async def btn_ban(self, inter: discord.Interaction, button: discord.ui.Button):
         await inter.response.send_modal(BanModal(self.invocador))
 
+    @discord.ui.button(label="Ban em massa", style=discord.ButtonStyle.danger, emoji="⛔")
+    async def btn_massban(self, inter: discord.Interaction, button: discord.ui.Button):
+        await inter.response.send_modal(MassBanModal(self.invocador))
+
     @discord.ui.button(label="Expulsar", style=discord.ButtonStyle.danger, emoji="👢")
     async def btn_kick(self, inter: discord.Interaction, button: discord.ui.Button):
         await inter.response.send_modal(KickModal(self.invocador))
@@ -315,7 +350,7 @@ async def setup_mod_painel_admin(bot: commands.Bot):
                 "Este painel é **público** para visualização.\n"
                 "**Somente Admin/Staff** podem clicar e executar ações.\n\n"
                 "Use os botões abaixo:\n"
-                "🔨 **Banir** • 👢 **Expulsar** • ⏳ **Castigo** • 🎗️ **Gerenciar cargo** • 📅 **Criar evento** • 🎤 **Criar palco**\n\n"
+                "🔨 **Banir** • ⛔ **Ban em massa** • 👢 **Expulsar** • ⏳ **Castigo** • 🎗️ **Gerenciar cargo** • 📅 **Criar evento** • 🎤 **Criar palco**\n\n"
                 "Todas as ações são registradas em **logs**."
             ),
             color=discord.Color.orange()
@@ -7,6 +7,8 @@ from discord import app_commands
 from discord.ext import commands
 
 import config
+from diff_permissoes import aplicar_overwrites
+from execucao_em_massa import executar_com_progresso
 # Se quiser logar cada operação:
 from mod_logs import registrar_log
 from datetime import datetime
@@ -30,7 +32,7 @@ def _admin_roles(guild: discord.Guild) -> List[discord.Role]:
     return [r for r in guild.roles if r.permissions.administrator]
 
 
-async def _apply_read_only(channel: discord.TextChannel, bot_member: discord.Member):
+async def _apply_read_only(channel: discord.TextChannel, bot_member: discord.Member) -> str:
     overwrites = channel.overwrites or {}
 
     # @everyone: vê, mas não escreve
@@ -54,10 +56,10 @@ async def _apply_read_only(channel: discord.TextChannel, bot_member: discord.Mem
         current.send_messages = True
         overwrites[bot_member] = current
 
-    await channel.edit(overwrites=overwrites, reason="Lzim: aplicar preset ler_somente")
+    return await aplicar_overwrites(channel, overwrites, reason="Lzim: aplicar preset ler_somente")
 
 
-async def _apply_unlock(channel: discord.TextChannel):
+async def _apply_unlock(channel: discord.TextChannel) -> str:
     overwrites = channel.overwrites or {}
 
     # @everyone: pode ver e escrever
@@ -73,10 +75,10 @@ async def _apply_unlock(channel: discord.TextChannel):
         current.send_messages = True
         overwrites[role] = current
 
-    await channel.edit(overwrites=overwrites, reason="Lzim: aplicar preset desbloquear")
+    return await aplicar_overwrites(channel, overwrites, reason="Lzim: aplicar preset desbloquear")
 
 
-async def _apply_private(channel: discord.TextChannel, bot_member: discord.Member):
+async def _apply_private(channel: discord.TextChannel, bot_member: discord.Member) -> str:
     overwrites = channel.overwrites or {}
 
     # @everyone: não vê
@@ -96,7 +98,7 @@ async def _apply_private(channel: discord.TextChannel, bot_member: discord.Membe
             view_channel=True, read_message_history=True, send_messages=True
         )
 
-    await channel.edit(overwrites=overwrites, reason="Lzim: aplicar preset privado")
+    return await aplicar_overwrites(channel, overwrites, reason="Lzim: aplicar preset privado")
 
 
 async def setup_mod_permissoes(bot: commands.Bot):
@@ -129,26 +131,32 @@ async def setup_mod_permissoes(bot: commands.Bot):
             await interaction.followup.send("⚠️ Você precisa **marcar os canais** com `#` (ex.: `#geral #regras`).", ephemeral=True)
             return
 
-        ok, fail = 0, 0
-        for ch in canais_list:
-            try:
-                if tipo == "ler_somente":
-                    await _apply_read_only(ch, bot_member)
-                elif tipo == "desbloquear":
-                    await _apply_unlock(ch)
-                elif tipo == "privado":
-                    await _apply_private(ch, bot_member)
-                ok += 1
-            except Exception as e:
-                print(f"[chatatualizarperms] Falha em {ch}:", e)
-                fail += 1
+        # Cada preset devolve "alterado" ou "sem_mudanca" (canal já estava assim: nenhuma chamada)
+        async def aplicar(ch: discord.TextChannel) -> str:
+            if tipo == "ler_somente":
+                return await _apply_read_only(ch, bot_member)
+            elif tipo == "desbloquear":
+                return await _apply_unlock(ch)
+            return await _apply_private(ch, bot_member)
+
+        # Canais em paralelo (concorrência limitada), com progresso ao vivo e botão de cancelar
+        execucao = await executar_com_progresso(
+            interaction, f"Preset {tipo} em {len(canais_list)} canal(is)", canais_list, aplicar,
+            rotulo=lambda ch: ch.mention
+        )
+        contagem = execucao.contagem()
+        ok, iguais, fail, cancelados = contagem["alterado"], contagem["sem_mudanca"], contagem["falha"], contagem["cancelado"]
+        for r in execucao.resultados:
+            if r.status == "falha":
+                print(f"[chatatualizarperms] Falha em {r.item}:", r.detalhe)
 
         # Log central/local
         try:
             detalhes = (
                 f"Tipo: **{tipo}**\n"
                 f"Canais: {', '.join(ch.mention for ch in canais_list)}\n"
-                f"Resultado: ✅ {ok} aplicado(s) • ❌ {fail} falha(s)\n"
+                f"Resultado: ✅ {ok} alterado(s) • ➖ {iguais} sem mudança • ❌ {fail} falha(s)"
+                + (f" • ⏹️ {cancelados} cancelado(s)" if cancelados else "") + "\n"
                 f"Data: {datetime.now(brasil).strftime('%d/%m/%Y %H:%M:%S')}"
             )
             await registrar_log(
@@ -161,8 +169,3 @@ async def setup_mod_permissoes(bot: commands.Bot):
             )
         except Exception as e:
             print("[chatatualizarperms] Falha ao registrar log:", e)
-
-        await interaction.followup.send(
-            f"✅ Permissões aplicadas: **{tipo}** • Sucesso: **{ok}** • Falhas: **{fail}**",
-            ephemeral=True
-        )
@@ -7,6 +7,8 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
+from cache_membros import garantir_membros, obter_membros
+
 # Logs (opcional)
 try:
     from mod_logs import registrar_log
@@ -41,6 +43,11 @@ def parse_duration(s: str) -> int:
         total += int(num) * map_mult.get(last_unit, 1)
     return total
 
+def sortear_vencedores(membros: List[discord.Member], qtd: int) -> List[discord.Member]:
+    if len(membros) <= qtd:
+        return list(membros)
+    return random.sample(membros, qtd)
+
 def winners_to_str(members: List[discord.Member]) -> str:
     return ", ".join(m.mention for m in members) if members else "—"
 
@@ -63,18 +70,10 @@ class SorteioView(discord.ui.View):
             channel = self.msg.channel
 
             # Filtra membros válidos (presentes no servidor)
-            membros = []
-            for uid in list(self.participantes):
-                m = self.guild.get_member(uid)
-                if m:
-                    membros.append(m)
-
-            vencedores: List[discord.Member] = []
-            if membros:
-                if len(membros) <= self.qtd_vencedores:
-                    vencedores = membros
-                else:
-                    vencedores = random.sample(membros, self.qtd_vencedores)
+            await garantir_membros(self.guild)
+            membros = await obter_membros(self.guild, list(self.participantes))
+
+            vencedores = sortear_vencedores(membros, self.qtd_vencedores)
 
             embed = discord.Embed(
                 title="🎉 Sorteio encerrado!",
@@ -221,18 +220,15 @@ async def setup_mod_sorteio(bot: commands.Bot):
                 return
 
             # Refaz vencedores
-            membros = []
-            for uid in list(view.participantes):
-                m = interaction.guild.get_member(uid)
-                if m:
-                    membros.append(m)
+            await garantir_membros(interaction.guild)
+            membros = await obter_membros(interaction.guild, list(view.participantes))
 
             if not membros:
                 await interaction.followup.send("⚠️ Não há participantes para sortear.", ephemeral=True)
                 return
 
             qtd = max(1, vencedores)
-            vencedores_list = random.sample(membros, k=min(qtd, len(membros)))
+            vencedores_list = sortear_vencedores(membros, qtd)
 
             embed = discord.Embed(
                 title="🔁 Re-roll do sorteio",
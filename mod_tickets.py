@@ -4,6 +4,12 @@ from discord.ext import commands
 from discord import app_commands
 from typing import Optional, Dict, Any
 
+from cache_membros import obter_membro
+from diff_permissoes import aplicar_overwrites
+from indice_cargos import NOMES_PADRAO, indice_cargos
+from metricas import metricas
+from modulos import guardar_estado, restaurar_estado
+
 # Logs (opcional)
 try:
     from mod_logs import registrar_log
@@ -22,15 +28,10 @@ except ImportError:
 # -------------------------
 # Regras de permissão
 # -------------------------
-STAFF_ROLE_NAMES = {"staff", "moderador", "moderators", "staff team", "admin", "adm"}  # nomes que contam como Staff
+STAFF_ROLE_NAMES = NOMES_PADRAO["staff"]  # nomes padrão que contam como Staff (por servidor: indice_cargos)
 
 def _is_admin_or_staff(m: discord.Member) -> bool:
-    if m.guild_permissions.administrator:
-        return True
-    for r in m.roles:
-        if r.name.lower() in STAFF_ROLE_NAMES:
-            return True
-    return False
+    return indice_cargos.membro_eh(m, "admin", "staff")
 
 # -------------------------
 # Estado simples em memória
@@ -57,6 +58,19 @@ async def _ensure_ticket_category(guild: discord.Guild) -> discord.CategoryChann
             return None
     return cat
 
+def _overwrites_ticket(guild: discord.Guild, author: discord.Member) -> Dict[Any, discord.PermissionOverwrite]:
+    overwrites = {
+        guild.default_role: discord.PermissionOverwrite(view_channel=False),
+        author: discord.PermissionOverwrite(view_channel=True, read_message_history=True, send_messages=True),
+        guild.me: discord.PermissionOverwrite(view_channel=True, read_message_history=True, send_messages=True, manage_channels=True)
+    }
+    # Garante Admin/Staff com acesso
+    for role_id in indice_cargos.cargos(guild, "admin", "staff"):
+        role = guild.get_role(role_id)
+        if role:
+            overwrites[role] = discord.PermissionOverwrite(view_channel=True, read_message_history=True, send_messages=True, manage_channels=True)
+    return overwrites
+
 async def _create_ticket_channel(
     guild: discord.Guild,
     author: discord.Member,
@@ -69,16 +83,7 @@ async def _create_ticket_channel(
     - admins/staff: ver/falar
     - bot: ver/falar
     """
-    overwrites = {
-        guild.default_role: discord.PermissionOverwrite(view_channel=False),
-        author: discord.PermissionOverwrite(view_channel=True, read_message_history=True, send_messages=True),
-        guild.me: discord.PermissionOverwrite(view_channel=True, read_message_history=True, send_messages=True, manage_channels=True)
-    }
-    # Garante Admin/Staff com acesso
-    for role in guild.roles:
-        if role.permissions.administrator or role.name.lower() in STAFF_ROLE_NAMES:
-            overwrites[role] = discord.PermissionOverwrite(view_channel=True, read_message_history=True, send_messages=True, manage_channels=True)
-
+    overwrites = _overwrites_ticket(guild, author)
     cat = await _ensure_ticket_category(guild)
     # Marca VIPs com ⭐
     is_vip = eh_vip(author)
@@ -95,17 +100,22 @@ async def _create_ticket_channel(
     ticket_meta[channel.id] = {"owner_id": author.id, "claimed_by": None, "locked": False}
     return channel
 
-async def _lock_ticket(channel: discord.TextChannel, lock: bool = True):
+async def _lock_ticket(channel: discord.TextChannel, lock: bool = True) -> str:
     """
     Privar: somente Admin/Staff (e bot) podem falar; todos os outros ficam só leitura.
     Despravar: volta a permitir falar para o autor e Staff.
+    Devolve "sem_mudanca" se o canal já estava assim (nenhuma chamada à API).
     """
+    overw = _overwrites_lock(channel, lock)
+    return await aplicar_overwrites(channel, overw, reason="Privar ticket" if lock else "Despravar ticket")
+
+def _overwrites_lock(channel: discord.TextChannel, lock: bool) -> Dict[Any, discord.PermissionOverwrite]:
     overw = channel.overwrites
 
     # Bloqueia todo mundo de enviar, mas garante staff com send_messages True
     for target, perms in list(overw.items()):
         if isinstance(target, discord.Role):
-            if target.permissions.administrator or target.name.lower() in STAFF_ROLE_NAMES:
+            if indice_cargos.cargo_eh(target, "admin", "staff"):
                 # staff/admin: pode falar
                 perms.send_messages = True
                 perms.view_channel = True
@@ -127,8 +137,7 @@ async def _lock_ticket(channel: discord.TextChannel, lock: bool = True):
                 perms.send_messages = False if lock else True
             perms.view_channel = True
             overw[target] = perms
-
-    await channel.edit(overwrites=overw, reason="Privar ticket" if lock else "Despravar ticket")
+    return overw
 
 async def _add_user_to_ticket(channel: discord.TextChannel, user: discord.Member):
     overw = channel.overwrites
@@ -174,7 +183,8 @@ class TicketPanelView(discord.ui.View):
         author: discord.Member = interaction.user
         await interaction.response.defer(ephemeral=True, thinking=True)
         try:
-            channel = await _create_ticket_channel(interaction.guild, author, reason="Abrir ticket")
+            with metricas.medir("ticket_criar"):
+                channel = await _create_ticket_channel(interaction.guild, author, reason="Abrir ticket")
             # envia painel de controle dentro do ticket
             meta = ticket_meta.get(channel.id) or {"owner_id": author.id, "claimed_by": None, "locked": False}
             embed = _ticket_controls_embed(interaction.guild, author, meta["claimed_by"], meta["locked"])
@@ -208,7 +218,7 @@ class AddUserModal(discord.ui.Modal, title="Adicionar usuário ao ticket"):
                 return await inter.followup.send("❌ Este canal não parece ser um ticket válido.", ephemeral=True)
 
             uid = int(str(self.user_id).strip())
-            member = inter.guild.get_member(uid)
+            member = await obter_membro(inter.guild, uid)
             if not member:
                 return await inter.followup.send("❌ Membro não encontrado neste servidor.", ephemeral=True)
 
@@ -257,7 +267,7 @@ class TicketControlsView(discord.ui.View):
             ticket_meta[cid] = meta
 
             # Atualiza painel
-            owner = inter.guild.get_member(meta["owner_id"]) or inter.user
+            owner = await obter_membro(inter.guild, meta["owner_id"]) or inter.user
             embed = _ticket_controls_embed(inter.guild, owner, meta["claimed_by"], meta["locked"])
             await inter.channel.send(embed=embed, view=self)  # type: ignore
             await inter.followup.send(f"🧷 Ticket reivindicado por {inter.user.mention}.", ephemeral=True)
@@ -286,7 +296,7 @@ class TicketControlsView(discord.ui.View):
             meta["locked"] = locked
             ticket_meta[cid] = meta
 
-            owner = inter.guild.get_member(meta["owner_id"]) or inter.user
+            owner = await obter_membro(inter.guild, meta["owner_id"]) or inter.user
             embed = _ticket_controls_embed(inter.guild, owner, meta["claimed_by"], meta["locked"])
             await inter.channel.send(embed=embed, view=self)  # type: ignore
 
@@ -310,8 +320,8 @@ class TicketControlsView(discord.ui.View):
             if not meta:
                 return await inter.followup.send("❌ Este canal não parece ser um ticket válido.", ephemeral=True)
 
-            owner = inter.guild.get_member(meta["owner_id"])
-            claimed_by = inter.guild.get_member(meta["claimed_by"]) if meta.get("claimed_by") else None
+            owner = await obter_membro(inter.guild, meta["owner_id"])
+            claimed_by = await obter_membro(inter.guild, meta["claimed_by"]) if meta.get("claimed_by") else None
             channel: discord.TextChannel = inter.channel  # type: ignore
 
             # Monta embed de encerramento
@@ -345,7 +355,14 @@ class TicketControlsView(discord.ui.View):
 # -------------------------
 # Setup (slash)
 # -------------------------
+def teardown_mod_tickets(bot: commands.Bot):
+    # Recarga a quente: o estado dos tickets abertos sobrevive ao novo código
+    guardar_estado(__name__, ticket_meta=ticket_meta)
+
 async def setup_mod_tickets(bot: commands.Bot):
+    global ticket_meta
+    ticket_meta = restaurar_estado(__name__).get("ticket_meta", ticket_meta)
+
     # Registrar views persistentes (para botões funcionarem após restart)
     bot.add_view(TicketPanelView())
     bot.add_view(TicketControlsView())
@@ -0,0 +1,184 @@
+# modulos.py
+import importlib
+import importlib.util
+import sys
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import discord
+
+import config
+
+class Modulo(NamedTuple):
+    nome: str
+    setup: str
+    intents: Tuple[str, ...] = ()   # flags de discord.Intents que o módulo precisa além de INTENTS_BASE
+    eventos: Tuple[str, ...] = ()   # listeners de gateway que o módulo registra (add_listener)
+
+
+# Sem "guilds" não há cache de servidores/canais/cargos; o resto vem dos módulos ativos
+INTENTS_BASE = ("guilds",)
+
+# Na ordem em que os comandos são registrados. Slash commands e botões chegam
+# como interações e não precisam de intent nenhum.
+MODULOS: List[Modulo] = [
+    Modulo("comandos_utilitarios", "setup_comandos_utilitarios"),
+    Modulo("mod_logs", "setup_mod_logs", intents=("webhooks",), eventos=("on_guild_channel_delete", "on_webhooks_update")),
+    Modulo("mod_tickets", "setup_mod_tickets"),
+    Modulo("mod_moderacao", "setup_mod_moderacao"),
+    Modulo("mod_permissoes", "setup_mod_permissoes"),
+    Modulo("mod_musica", "setup_mod_musica", intents=("voice_states",)),   # user.voice e conexão de voz
+    Modulo("mod_sorteio", "setup_mod_sorteio", intents=("members",)),      # chunk/busca dos participantes
+    Modulo("mod_painel_admin", "setup_mod_painel_admin"),
+    Modulo("mod_org_cargos", "setup_mod_org_cargos"),
+    Modulo("mod_formulario", "setup_mod_formulario"),
+    Modulo("mod_equipes", "setup_mod_equipes"),
+]
+
+
+class RegistroModulos:
+    """
+    Carrega os módulos do bot sob demanda (só os ativos são importados)
+    e mede quanto cada um gasta em import e em setup.
+
+    Cada módulo também pode ser recarregado com o bot no ar: o opcional
+    teardown_<mod>(bot) guarda o estado em memória, os comandos e listeners
+    do módulo saem da árvore, o código é reexecutado (importlib.reload, no
+    mesmo objeto de módulo) e o setup roda de novo, recuperando o estado.
+    """
+    def __init__(self, modulos: List[Modulo]):
+        self.modulos = modulos
+        self.tempos: Dict[str, Dict[str, float]] = {}
+        self.status: Dict[str, str] = {}
+        self._estado: Dict[str, Dict[str, Any]] = {}
+
+    # ---------- estado entre recargas ----------
+    def guardar_estado(self, modulo: str, **valores):
+        self._estado[modulo] = valores
+
+    def restaurar_estado(self, modulo: str) -> Dict[str, Any]:
+        return self._estado.pop(modulo, {})
+
+    def funcao_setup(self, nome: str) -> Optional[str]:
+        for modulo in self.modulos:
+            if modulo.nome == nome:
+                return modulo.setup
+        return None
+
+    def ativo(self, nome: str) -> bool:
+        return nome not in config.MODULOS_DESATIVADOS
+
+    def intents(self) -> discord.Intents:
+        """Menor conjunto de intents que cobre os módulos ativos (+ INTENTS_EXTRAS do config)."""
+        intents = discord.Intents.none()
+        nomes = set(INTENTS_BASE) | set(config.INTENTS_EXTRAS)
+        for modulo in self.modulos:
+            if self.ativo(modulo.nome):
+                nomes.update(modulo.intents)
+        for nome in nomes:
+            if nome not in discord.Intents.VALID_FLAGS:
+                print(f"⚠️ [Módulos] Intent desconhecido ignorado: {nome}")
+                continue
+            setattr(intents, nome, True)
+        return intents
+
+    async def carregar_todos(self, bot):
+        for modulo in self.modulos:
+            if not self.ativo(modulo.nome):
+                self.status[modulo.nome] = "desativado"
+                continue
+            await self.carregar(bot, modulo.nome, modulo.setup)
+
+    async def carregar(self, bot, nome: str, funcao: str):
+        inicio = time.perf_counter()
+        try:
+            modulo = importlib.import_module(nome)
+        except Exception as e:
+            self.status[nome] = f"erro no import: {e}"
+            print(f"❌ [Módulos] Falha ao importar {nome}: {e}")
+            return
+        meio = time.perf_counter()
+        try:
+            await getattr(modulo, funcao)(bot)
+            self.status[nome] = "ok"
+        except Exception as e:
+            self.status[nome] = f"erro no setup: {e}"
+            print(f"❌ [Módulos] Falha no setup de {nome}: {e}")
+        fim = time.perf_counter()
+        self.tempos[nome] = {"import": meio - inicio, "setup": fim - meio}
+        self._conferir_eventos(bot, nome)
+
+    def _conferir_eventos(self, bot, nome: str):
+        # Listener fora da declaração pode depender de um intent que não foi pedido
+        declarados = next((m.eventos for m in self.modulos if m.nome == nome), ())
+        for evento, funcoes in bot.extra_events.items():
+            if evento not in declarados and any(getattr(f, "__module__", None) == nome for f in funcoes):
+                print(f"⚠️ [Módulos] {nome} registrou {evento} sem declarar em MODULOS (confira os intents)")
+
+    def _remover_referencias(self, bot, nome: str):
+        # Slash commands e listeners definidos dentro do módulo (closures do setup)
+        for cmd in bot.tree.get_commands():
+            if getattr(cmd, "module", None) == nome:
+                bot.tree.remove_command(cmd.name, type=getattr(cmd, "type", discord.AppCommandType.chat_input))
+        for evento, funcoes in list(bot.extra_events.items()):
+            for func in list(funcoes):
+                if getattr(func, "__module__", None) == nome:
+                    bot.remove_listener(func, evento)
+
+    async def recarregar(self, bot, nome: str):
+        """Recarrega um módulo já carregado. Erros sobem para o chamador."""
+        funcao = self.funcao_setup(nome)
+        if funcao is None:
+            raise ValueError(f"Módulo desconhecido: {nome}")
+        modulo = sys.modules.get(nome)
+        if modulo is None or self.status.get(nome) != "ok":
+            raise ValueError(f"{nome} não está carregado")
+
+        # Compila antes de mexer em qualquer coisa: erro de sintaxe não derruba o módulo atual
+        spec = importlib.util.find_spec(nome)
+        if spec is None or spec.loader is None:
+            raise ValueError(f"Código de {nome} não encontrado")
+        spec.loader.get_code(nome)
+
+        teardown = getattr(modulo, funcao.replace("setup_", "teardown_", 1), None)
+        if teardown:
+            teardown(bot)
+        self._remover_referencias(bot, nome)
+
+        inicio = time.perf_counter()
+        self.status[nome] = "recarregando"
+        try:
+            modulo = importlib.reload(modulo)
+            meio = time.perf_counter()
+            await getattr(modulo, funcao)(bot)
+        except Exception as e:
+            self.status[nome] = f"erro na recarga: {e}"
+            raise
+        self.status[nome] = "ok"
+        self.tempos[nome] = {"import": meio - inicio, "setup": time.perf_counter() - meio}
+        self._conferir_eventos(bot, nome)
+
+    def relatorio(self) -> str:
+        linhas = ["⏱️ Módulos (import / setup):"]
+        total = 0.0
+        for nome, *_ in self.modulos:
+            t = self.tempos.get(nome)
+            status = self.status.get(nome, "—")
+            if t:
+                total += t["import"] + t["setup"]
+                linhas.append(f"   {nome:<22} {t['import'] * 1000:7.1f}ms / {t['setup'] * 1000:7.1f}ms  {status}")
+            else:
+                linhas.append(f"   {nome:<22} {'—':>9} / {'—':>9}  {status}")
+        linhas.append(f"   {'total':<22} {total * 1000:7.1f}ms")
+        return "\n".join(linhas)
+
+
+registro = RegistroModulos(MODULOS)
+
+
+def guardar_estado(modulo: str, **valores):
+    registro.guardar_estado(modulo, **valores)
+
+
+def restaurar_estado(modulo: str) -> Dict[str, Any]:
+    return registro.restaurar_estado(modulo)
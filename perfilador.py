@@ -0,0 +1,190 @@
+# perfilador.py
+"""
+Perfis sob demanda do processo em produção (/debug_profile).
+
+cpu → uma thread copia a pilha da thread do loop a cada INTERVALO_CPU_SEG
+      (amostragem: o custo não depende de quanto código roda, só da taxa);
+mem → tracemalloc ligado só durante a janela, diferença entre dois snapshots.
+
+Cada amostra/alocação é atribuída ao módulo do bot mais interno da pilha
+(mod_logs, mod_tickets...); o que não passa por código do bot fica com o
+pacote da biblioteca (discord, aiohttp...).
+"""
+import asyncio
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Tuple
+
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+SEGUNDOS_MAX = 60
+INTERVALO_CPU_SEG = 0.005
+FRAMES_MEM = 10        # profundidade guardada pelo tracemalloc (custo cresce com ela)
+TOP_POR_MODULO = 8
+
+_em_andamento = asyncio.Lock()
+
+Local = Tuple[str, int, str]   # arquivo, linha, função
+
+
+def modulo_do_arquivo(arquivo: str) -> Optional[str]:
+    """Nome do módulo do bot (mod_logs, main...) ou None se for biblioteca."""
+    if arquivo.startswith(RAIZ) and "site-packages" not in arquivo:
+        relativo = os.path.relpath(arquivo, RAIZ)
+        return os.path.splitext(relativo.replace(os.sep, "."))[0]
+    return None
+
+
+def _pacote(arquivo: str) -> str:
+    partes = arquivo.replace(os.sep, "/").split("/")
+    for marcador in ("site-packages", "dist-packages"):
+        if marcador in partes:
+            resto = partes[partes.index(marcador) + 1:]
+            return os.path.splitext(resto[0])[0] if resto else marcador
+    # stdlib: asyncio/events.py → asyncio; selectors.py → selectors
+    pasta = partes[-2] if len(partes) > 1 else ""
+    if not pasta or pasta.startswith("python"):
+        return os.path.splitext(partes[-1])[0]
+    return pasta
+
+
+def _responsavel(pilha: List[Local]) -> str:
+    """pilha do mais externo para o mais interno."""
+    for arquivo, _linha, _func in reversed(pilha):
+        modulo = modulo_do_arquivo(arquivo)
+        if modulo and modulo != "perfilador":
+            return modulo
+    return _pacote(pilha[-1][0]) if pilha else "?"
+
+
+def _fmt_local(local: Local) -> str:
+    arquivo, linha, func = local
+    modulo = modulo_do_arquivo(arquivo)
+    nome = f"{modulo}.py" if modulo else f"{_pacote(arquivo)}/{os.path.basename(arquivo)}"
+    return f"{func} ({nome}:{linha})"
+
+
+# ---------- CPU ----------
+
+def _amostrar(thread_id: int, segundos: float):
+    por_modulo: Counter = Counter()
+    proprias: Dict[str, Counter] = defaultdict(Counter)      # módulo → função na ponta da pilha
+    acumuladas: Dict[str, Counter] = defaultdict(Counter)    # módulo → funções do bot presentes na pilha
+    ocioso = total = 0
+    fim = time.monotonic() + segundos
+    while time.monotonic() < fim:
+        time.sleep(INTERVALO_CPU_SEG)
+        frame = sys._current_frames().get(thread_id)
+        if frame is None:
+            break
+        pilha: List[Local] = []
+        while frame is not None:
+            codigo = frame.f_code
+            pilha.append((codigo.co_filename, codigo.co_firstlineno, codigo.co_name))
+            frame = frame.f_back
+        pilha.reverse()
+        total += 1
+        # Loop parado no select esperando o próximo evento: tempo livre, não CPU
+        if pilha[-1][2] in ("select", "poll", "epoll", "control") and "selectors" in pilha[-1][0]:
+            ocioso += 1
+            continue
+        modulo = _responsavel(pilha)
+        por_modulo[modulo] += 1
+        proprias[modulo][pilha[-1]] += 1
+        for local in set(pilha):
+            if modulo_do_arquivo(local[0]) == modulo:
+                acumuladas[modulo][local] += 1
+    return total, ocioso, por_modulo, proprias, acumuladas
+
+
+def _relatorio_cpu(segundos: float, total: int, ocioso: int, por_modulo: Counter,
+                   proprias: Dict[str, Counter], acumuladas: Dict[str, Counter]) -> str:
+    ocupado = total - ocioso
+    linhas = [
+        f"Perfil de CPU da thread do event loop: {segundos:.0f}s, {total} amostras a cada {INTERVALO_CPU_SEG * 1000:.0f}ms",
+        f"Ocupado: {ocupado} amostras ({ocupado * 100 / max(total, 1):.1f}%)  |  ocioso no select: {ocioso}",
+        "",
+    ]
+    for modulo, qtd in por_modulo.most_common():
+        linhas.append(f"=== {modulo}: {qtd} amostras ({qtd * 100 / max(total, 1):.1f}% do tempo) ===")
+        if acumuladas.get(modulo):
+            linhas.append("  funções do módulo (acumulado, inclui o que chamam):")
+            for local, n in acumuladas[modulo].most_common(TOP_POR_MODULO):
+                linhas.append(f"    {n:>6}  {_fmt_local(local)}")
+        linhas.append("  ponta da pilha (tempo próprio):")
+        for local, n in proprias[modulo].most_common(TOP_POR_MODULO):
+            linhas.append(f"    {n:>6}  {_fmt_local(local)}")
+        linhas.append("")
+    return "\n".join(linhas)
+
+
+async def perfil_cpu(segundos: float) -> str:
+    thread_id = threading.get_ident()   # chamado de dentro do loop: é a thread que interessa
+    dados = await asyncio.to_thread(_amostrar, thread_id, segundos)
+    return _relatorio_cpu(segundos, *dados)
+
+
+# ---------- memória ----------
+
+def _relatorio_mem(segundos: float, antes: tracemalloc.Snapshot, depois: tracemalloc.Snapshot) -> str:
+    filtros = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+    diferencas = depois.filter_traces(filtros).compare_to(antes.filter_traces(filtros), "traceback")
+
+    por_modulo: Counter = Counter()
+    blocos: Counter = Counter()
+    locais: Dict[str, Counter] = defaultdict(Counter)
+    for diff in diferencas:
+        if diff.size_diff == 0:
+            continue
+        pilha = [(f.filename, f.lineno, "") for f in reversed(diff.traceback)]  # tracemalloc: mais interno primeiro
+        modulo = _responsavel(pilha)
+        por_modulo[modulo] += diff.size_diff
+        blocos[modulo] += diff.count_diff
+        # Linha responsável: a do módulo do bot, se houver; senão, a da alocação em si
+        local = next(((a, l) for a, l, _ in reversed(pilha) if modulo_do_arquivo(a) == modulo), pilha[-1][:2])
+        locais[modulo][local] += diff.size_diff
+
+    total = sum(por_modulo.values())
+    linhas = [
+        f"Diferença de memória (tracemalloc, {FRAMES_MEM} frames) em {segundos:.0f}s: {total / 1024:+.1f} KiB",
+        f"Memória rastreada no fim: {sum(s.size for s in depois.statistics('filename')) / 1024 / 1024:.1f} MiB",
+        "",
+    ]
+    for modulo, tamanho in sorted(por_modulo.items(), key=lambda kv: abs(kv[1]), reverse=True):
+        linhas.append(f"=== {modulo}: {tamanho / 1024:+.1f} KiB em {blocos[modulo]:+d} blocos ===")
+        topo = sorted(locais[modulo].items(), key=lambda kv: abs(kv[1]), reverse=True)[:TOP_POR_MODULO]
+        for (arquivo, linha), n in topo:
+            nome = f"{modulo_do_arquivo(arquivo)}.py" if modulo_do_arquivo(arquivo) else \
+                f"{_pacote(arquivo)}/{os.path.basename(arquivo)}"
+            linhas.append(f"    {n / 1024:>+10.1f} KiB  {nome}:{linha}")
+        linhas.append("")
+    return "\n".join(linhas)
+
+
+async def perfil_mem(segundos: float) -> str:
+    ja_ativo = tracemalloc.is_tracing()
+    if not ja_ativo:
+        tracemalloc.start(FRAMES_MEM)
+    try:
+        antes = tracemalloc.take_snapshot()
+        await asyncio.sleep(segundos)
+        depois = tracemalloc.take_snapshot()
+    finally:
+        # Quem já usava o tracemalloc antes continua usando
+        if not ja_ativo:
+            tracemalloc.stop()
+    return await asyncio.to_thread(_relatorio_mem, segundos, antes, depois)
+
+
+async def perfilar(modo: str, segundos: float) -> str:
+    """Um perfil por vez no processo; segundos limitado a SEGUNDOS_MAX."""
+    if _em_andamento.locked():
+        raise RuntimeError("já existe um perfil em andamento")
+    segundos = max(1.0, min(float(segundos), SEGUNDOS_MAX))
+    async with _em_andamento:
+        if modo == "mem":
+            return await perfil_mem(segundos)
+        return await perfil_cpu(segundos)
@@ -0,0 +1,75 @@
+# sync_comandos.py
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import discord
+
+import config
+
+SYNC_HASH_FILE = "sync_hash.json"
+
+
+def _escopo(bot) -> Tuple[str, Optional[discord.Object]]:
+    # Chave por aplicação + escopo: trocar de token ou de GUILD_ID força um sync novo
+    if config.GUILD_ID:
+        guild = discord.Object(id=int(config.GUILD_ID))
+        return f"{bot.application_id}:guild:{guild.id}", guild
+    return f"{bot.application_id}:global", None
+
+
+def hash_arvore(tree: discord.app_commands.CommandTree, guild: Optional[discord.Object] = None) -> str:
+    """Hash do payload que tree.sync() enviaria para este escopo."""
+    payload = [cmd.to_dict(tree) for cmd in tree.get_commands(guild=guild)]
+    payload.sort(key=lambda c: (c.get("type", 1), c["name"]))
+    bruto = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(bruto.encode("utf-8")).hexdigest()
+
+
+def _ler() -> Dict[str, Any]:
+    if not os.path.exists(SYNC_HASH_FILE):
+        return {}
+    try:
+        with open(SYNC_HASH_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[Sync] {SYNC_HASH_FILE} ilegível, será refeito: {e}")
+        return {}
+
+
+def _salvar(dados: Dict[str, Any]):
+    tmp = SYNC_HASH_FILE + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(dados, f, indent=2)
+    os.replace(tmp, SYNC_HASH_FILE)
+
+
+async def sincronizar(bot, forcar: bool = False) -> Optional[int]:
+    """
+    Sincroniza os slash commands só se a árvore mudou desde o último sync.
+    Retorna quantos comandos foram sincronizados, ou None se o sync foi pulado.
+    """
+    chave, guild = _escopo(bot)
+    atual = hash_arvore(bot.tree, guild)
+    dados = _ler()
+    anterior = dados.get(chave, {})
+    rotulo = f"guild: {guild.id}" if guild else "global"
+
+    if not forcar and anterior.get("hash") == atual:
+        economia = anterior.get("duracao_seg", 0.0)
+        print(f"⏭️ Slash sync ({rotulo}) pulado: comandos inalterados (~{economia:.2f}s economizados)")
+        return None
+
+    inicio = time.perf_counter()
+    sincronizados = await bot.tree.sync(guild=guild)
+    duracao = time.perf_counter() - inicio
+
+    dados[chave] = {"hash": atual, "duracao_seg": round(duracao, 3), "em": int(time.time())}
+    try:
+        _salvar(dados)
+    except OSError as e:
+        print(f"[Sync] Não consegui gravar {SYNC_HASH_FILE}: {e}")
+    print(f"✅ Slash sync ({rotulo}): {len(sincronizados)} comandos em {duracao:.2f}s")
+    return len(sincronizados)
@@ -0,0 +1,134 @@
+# vigia_loop.py
+import asyncio
+import os
+import sys
+import threading
+import time
+import traceback
+from typing import Dict, List, Optional, Tuple
+
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+MAX_REGISTROS = 200   # pontos distintos guardados; acima disso o menos grave sai
+
+
+class Travamento:
+    def __init__(self, handler: str, origem: str, pilha: str):
+        self.handler = handler
+        self.origem = origem
+        self.pilha = pilha
+        self.ocorrencias = 0
+        self.pior_seg = 0.0
+        self.total_seg = 0.0
+        self.ultimo = 0.0
+
+
+class VigiaLoop:
+    """
+    Watchdog do event loop: um callback no loop marca um "batimento" a cada
+    intervalo e uma thread separada confere o relógio. Se o loop ficar
+    parado além do limiar, a thread copia a pilha da thread do loop (que
+    está justamente executando o código que travou) e o nome da tarefa atual.
+    Os registros são agrupados por tarefa + primeira linha de código do bot
+    na pilha, para mostrar os piores pontos.
+    """
+    def __init__(self):
+        self.limiar_seg = 0.5
+        self.intervalo_seg = 0.1
+        self.registros: Dict[Tuple[str, str], Travamento] = {}
+        self.pior_atraso_seg = 0.0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread_loop_id: Optional[int] = None
+        self._batimento = 0.0
+        self._atual: Optional[Travamento] = None
+        self._parar = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._handle: Optional[asyncio.TimerHandle] = None
+
+    # ---------- lado do loop ----------
+    def iniciar(self, limiar_ms: int):
+        if limiar_ms <= 0 or self._thread is not None:
+            return
+        self.limiar_seg = limiar_ms / 1000
+        self.intervalo_seg = max(0.05, self.limiar_seg / 4)
+        self._loop = asyncio.get_running_loop()
+        self._thread_loop_id = threading.get_ident()
+        self._batimento = time.monotonic()
+        self._handle = self._loop.call_later(self.intervalo_seg, self._bater)
+        self._parar.clear()
+        self._thread = threading.Thread(target=self._vigiar, name="lzim-vigia-loop", daemon=True)
+        self._thread.start()
+
+    def _bater(self):
+        agora = time.monotonic()
+        atraso = agora - self._batimento - self.intervalo_seg
+        if atraso > self.pior_atraso_seg:
+            self.pior_atraso_seg = atraso
+        atual, self._atual = self._atual, None
+        if atual is not None:
+            # Travamento terminou: agora se sabe quanto durou de fato
+            atual.pior_seg = max(atual.pior_seg, atraso)
+            atual.total_seg += atraso
+        self._batimento = agora
+        self._handle = self._loop.call_later(self.intervalo_seg, self._bater)
+
+    def encerrar(self):
+        self._parar.set()
+        if self._handle:
+            self._handle.cancel()
+        self._thread = None
+
+    # ---------- thread de vigia ----------
+    def _vigiar(self):
+        while not self._parar.wait(self.intervalo_seg):
+            parado = time.monotonic() - self._batimento - self.intervalo_seg
+            if parado > self.limiar_seg and self._atual is None:
+                try:
+                    self._capturar(parado)
+                except Exception as e:
+                    print(f"[VigiaLoop] Falha ao capturar pilha: {e}")
+
+    def _handler_atual(self) -> str:
+        try:
+            tarefa = asyncio.current_task(self._loop)
+        except RuntimeError:
+            tarefa = None
+        if tarefa is None:
+            return "(callback fora de tarefa)"
+        coro = tarefa.get_coro()
+        nome = getattr(coro, "__qualname__", type(coro).__name__)
+        return f"{tarefa.get_name()} · {nome}"
+
+    def _capturar(self, parado: float):
+        frame = sys._current_frames().get(self._thread_loop_id)
+        if frame is None:
+            return
+        pilha = traceback.extract_stack(frame)
+        # Origem: o frame mais interno que é código do bot (não biblioteca)
+        origem = "(fora do código do bot)"
+        for f in reversed(pilha):
+            if f.filename.startswith(RAIZ) and not f.filename.endswith("vigia_loop.py"):
+                origem = f"{os.path.relpath(f.filename, RAIZ)}:{f.lineno} em {f.name}"
+                break
+        handler = self._handler_atual()
+        chave = (handler, origem)
+        registro = self.registros.get(chave)
+        if registro is None:
+            if len(self.registros) >= MAX_REGISTROS:
+                menor = min(self.registros, key=lambda k: self.registros[k].pior_seg)
+                del self.registros[menor]
+            registro = self.registros[chave] = Travamento(handler, origem, "".join(traceback.format_list(pilha)))
+        registro.ocorrencias += 1
+        registro.pior_seg = max(registro.pior_seg, parado)
+        registro.ultimo = time.time()
+        self._atual = registro
+
+    # ---------- consulta ----------
+    def piores(self, limite: int = 10) -> List[Travamento]:
+        return sorted(self.registros.values(), key=lambda r: r.pior_seg, reverse=True)[:limite]
+
+    def limpar(self):
+        self.registros.clear()
+        self.pior_atraso_seg = 0.0
+
+
+vigia = VigiaLoop()